@@ -10,23 +10,29 @@ Email                   : juztas (at) gmail.com
 Date                    : 2023/11/05
 """
 import copy
+import os
+import pickle
 import sys
 
 from ansible import constants as C
 from ansible.module_utils._text import to_text
-from ansible.module_utils.connection import Connection
+from ansible.module_utils.connection import Connection, ConnectionError
 from ansible.utils.display import Display
+from ansible.utils.path import unfrackpath
 from ansible_collections.ansible.netcommon.plugins.action.network import \
     ActionModule as ActionNetworkModule
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import \
     load_provider
 from ansible_collections.sense.dellos9.plugins.module_utils.network.dellos9 import \
     dellos9_provider_spec
-from ansible_collections.sense.dellos9.plugins.module_utils.runwrapper import \
-    classwrapper
+from ansible_collections.sense.dellos9.plugins.module_utils.runwrapper import (
+    PROFILE_ENV, classwrapper)
 
 display = Display()
 
+# Modules with profile options. profile_name defaults to <host>_<task name>
+PROFILED_MODULES = ["dellos9_facts", "dellos9_config"]
+
 
 @classwrapper
 class ActionModule(ActionNetworkModule):
@@ -35,6 +41,7 @@ class ActionModule(ActionNetworkModule):
     def run(self, tmp=None, task_vars=None):
         """DellOS9 Ansible Run"""
         self._config_module = self._task.action.split(".")[-1] == "dellos9_config"
+        self.setProfileName(task_vars or {})
         sockPath = None
         persConn = self._play_context.connection.split(".")[-1]
 
@@ -63,33 +70,75 @@ class ActionModule(ActionNetworkModule):
                 plc.become_method = "enable"
             plc.become_pass = provider["auth_pass"]
 
-            display.vvv(f"using connection plugin {plc.connection}", plc.remote_addr)
-            connection = self._shared_loader_obj.connection_loader.get(
-                "persistent", plc, sys.stdin
-            )
-            connection.set_options(
-                direct={"persistent_command_timeout": command_timeout}
-            )
-
-            sockPath = connection.run()
-            display.vvvv(f"socket_path: {sockPath}", plc.remote_addr)
+            sockPath = self.reuseSocket(plc, command_timeout)
             if not sockPath:
-                return {
-                    "failed": True,
-                    "msg": "unable to open shell. Please see: https://docs.ansible.com/ansible/network_debug_troubleshooting.html#unable-to-open-shell",
-                }
+                display.vvv(f"using connection plugin {plc.connection}", plc.remote_addr)
+                connection = self._shared_loader_obj.connection_loader.get(
+                    "persistent", plc, sys.stdin
+                )
+                connection.set_options(
+                    direct={"persistent_command_timeout": command_timeout}
+                )
+
+                sockPath = connection.run()
+                display.vvvv(f"socket_path: {sockPath}", plc.remote_addr)
+                if not sockPath:
+                    return {
+                        "failed": True,
+                        "msg": (
+                            "unable to open shell. Please see: https://docs.ansible.com/ansible/"
+                            "network_debug_troubleshooting.html#unable-to-open-shell"
+                        ),
+                    }
 
             task_vars["ansible_socket"] = sockPath
 
         if not sockPath:
             sockPath = self._connection.socket_path
 
-        conn = Connection(sockPath)
-        out = conn.get_prompt()
-        while to_text(out, errors="surrogate_then_replace").strip().endswith(")#"):
-            display.vvvv("wrong context, send exit...", self._play_context.remote_addr)
-            conn.send_command("exit")
-            out = conn.get_prompt()
+        self.leaveConfigMode(Connection(sockPath))
 
         result = super().run(task_vars=task_vars)
         return result
+
+    def reuseSocket(self, plc, command_timeout):
+        """
+        Socket of running persistent connection to the same (host, port, user), or None.
+        ansible-connection derives the same path; reusing it skips starting that process per task
+        """
+        ssh = self._shared_loader_obj.connection_loader.get("ssh", class_only=True)
+        controlPath = ssh._create_control_path(plc.remote_addr, plc.port, plc.remote_user, plc.connection, os.getppid())
+        sockPath = unfrackpath(controlPath % {"directory": unfrackpath(C.PERSISTENT_CONTROL_PATH_DIR)})
+        if not os.path.exists(sockPath):
+            return None
+        conn = Connection(sockPath)
+        try:
+            conn.set_options(direct={"persistent_command_timeout": command_timeout})
+            conn.update_play_context(to_text(pickle.dumps(plc.serialize())))
+            conn.set_check_prompt(self._task._uuid)
+        except ConnectionError as ex:
+            display.vvvv(f"unable to reuse socket {sockPath}: {ex}", plc.remote_addr)
+            return None
+        display.vvvv(f"reusing socket_path: {sockPath}", plc.remote_addr)
+        return sockPath
+
+    def leaveConfigMode(self, conn):
+        """
+        Return to exec mode with a single end, if session is in config mode.
+        network_cli keeps the last prompt matched by any task on the socket, so
+        get_prompt is answered by the persistent connection, not the device
+        """
+        out = conn.get_prompt()
+        if to_text(out, errors="surrogate_then_replace").strip().endswith(")#"):
+            display.vvvv("wrong context, send end...", self._play_context.remote_addr)
+            conn.send_command("end")
+
+    def setProfileName(self, task_vars):
+        """Name profiling output files per host and task, if profiling is requested"""
+        if self._task.action.split(".")[-1] not in PROFILED_MODULES:
+            return
+        if not (self._task.args.get("profile") or os.environ.get(PROFILE_ENV)):
+            return
+        if not self._task.args.get("profile_name"):
+            host = task_vars.get("inventory_hostname", self._play_context.remote_addr)
+            self._task.args["profile_name"] = f"{host}_{self._task.get_name()}"
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""Callback plugin to aggregate per device and per module latency
+Copyright: Contributors to the SENSE Project
+GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+Title                   : sdn-sense/sense-dellos9-collection
+Author                  : Justas Balcas
+Email                   : juztas (at) gmail.com
+@Copyright              : General Public License v3.0+
+Date                    : 2026/10/19
+"""
+import json
+import time
+
+from ansible.plugins.callback import CallbackBase
+
+DOCUMENTATION = """
+    name: dellos9_latency
+    type: aggregate
+    short_description: Per device and per module latency report
+    description:
+      - Collects wall time of every task per host and metrics reported by modules (collect_metrics).
+      - At the end of playbook prints percentile summaries per module and slowest devices,
+        and writes the full report to a JSON file.
+    requirements:
+      - enable in configuration (callbacks_enabled = sense.dellos9.dellos9_latency)
+    options:
+      output_file:
+        description: JSON report file.
+        default: dellos9_latency.json
+        env:
+          - name: DELLOS9_LATENCY_FILE
+        ini:
+          - section: dellos9_latency
+            key: output_file
+      slowest:
+        description: Number of slowest devices to report.
+        default: 10
+        type: int
+        env:
+          - name: DELLOS9_LATENCY_SLOWEST
+        ini:
+          - section: dellos9_latency
+            key: slowest
+"""
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+def percentile(values, pct):
+    """Nearest rank percentile of sorted values"""
+    if not values:
+        return None
+    rank = max(1, -(-pct * len(values) // 100))
+    return values[int(rank) - 1]
+
+
+def summary(values):
+    """Count, min, max, mean and percentiles of values"""
+    values = sorted(values)
+    out = {
+        "count": len(values),
+        "min": round(values[0], 4),
+        "max": round(values[-1], 4),
+        "mean": round(sum(values) / len(values), 4),
+    }
+    for pct in PERCENTILES:
+        out[f"p{pct}"] = round(percentile(values, pct), 4)
+    return out
+
+
+class CallbackModule(CallbackBase):
+    """Aggregate task wall time and module metrics per host and module"""
+
+    CALLBACK_VERSION = 2.0
+    CALLBACK_TYPE = "aggregate"
+    CALLBACK_NAME = "sense.dellos9.dellos9_latency"
+    CALLBACK_NEEDS_ENABLED = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.started = {}
+        # {host: {module: [seconds, ...]}}
+        self.durations = {}
+        # {host: {"exec_command": n, "bytes_received": n, "phases": {phase: seconds}}}
+        self.metrics = {}
+        self.playStart = time.time()
+
+    def v2_runner_on_start(self, host, task):
+        self.started[(host.get_name(), task._uuid)] = time.perf_counter()
+
+    def record(self, result):
+        """Record task duration and module metrics of result"""
+        host = result._host.get_name()
+        start = self.started.pop((host, result._task._uuid), None)
+        if start is None:
+            return
+        module = result._task.action.split(".")[-1]
+        self.durations.setdefault(host, {}).setdefault(module, []).append(time.perf_counter() - start)
+        metrics = result._result.get("metrics")
+        if isinstance(metrics, dict):
+            hostMetrics = self.metrics.setdefault(host, {"exec_command": 0, "bytes_received": 0, "phases": {}})
+            hostMetrics["exec_command"] += metrics.get("exec_command", 0)
+            hostMetrics["bytes_received"] += sum(metrics.get("bytes_received", {}).values())
+            for name, seconds in metrics.get("phases", {}).items():
+                hostMetrics["phases"][name] = round(hostMetrics["phases"].get(name, 0.0) + seconds, 6)
+
+    def v2_runner_on_ok(self, result):
+        self.record(result)
+
+    def v2_runner_on_failed(self, result, ignore_errors=False):
+        self.record(result)
+
+    def v2_runner_on_unreachable(self, result):
+        self.record(result)
+
+    def v2_runner_on_skipped(self, result):
+        self.started.pop((result._host.get_name(), result._task._uuid), None)
+
+    def report(self):
+        """Build report of modules, hosts and slowest devices"""
+        modules = {}
+        hosts = {}
+        for host, perModule in self.durations.items():
+            allDurations = []
+            for module, durations in perModule.items():
+                modules.setdefault(module, []).extend(durations)
+                allDurations.extend(durations)
+            hosts[host] = {"total": round(sum(allDurations), 4), "tasks": summary(allDurations)}
+            if host in self.metrics:
+                hosts[host]["metrics"] = self.metrics[host]
+        slowest = sorted(hosts, key=lambda host: hosts[host]["total"], reverse=True)
+        return {
+            "play_duration": round(time.time() - self.playStart, 4),
+            "modules": {module: summary(durations) for module, durations in modules.items()},
+            "hosts": hosts,
+            "slowest_devices": [
+                {"host": host, "total": hosts[host]["total"]} for host in slowest[:self.get_option("slowest")]
+            ],
+        }
+
+    def v2_playbook_on_stats(self, stats):
+        report = self.report()
+        self._display.banner("DELLOS9 LATENCY")
+        for module, stat in sorted(report["modules"].items()):
+            pcts = " ".join(f"p{pct}={stat[f'p{pct}']:.2f}s" for pct in PERCENTILES)
+            self._display.display(f"{module:<30} count={stat['count']} {pcts} max={stat['max']:.2f}s")
+        self._display.display("Slowest devices:")
+        for entry in report["slowest_devices"]:
+            self._display.display(f"  {entry['host']:<40} {entry['total']:.2f}s")
+        outputFile = self.get_option("output_file")
+        if outputFile:
+            with open(outputFile, "w", encoding="utf-8") as fd:
+                json.dump(report, fd, indent=2)
+            self._display.display(f"Latency report written to {outputFile}")
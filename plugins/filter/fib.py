@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""Filter plugins for packed routing tables (ansible_net_fib)
+Copyright: Contributors to the SENSE Project
+GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+Title                   : sdn-sense/sense-dellos9-collection
+Author                  : Justas Balcas
+Email                   : juztas (at) gmail.com
+@Copyright              : General Public License v3.0+
+Date                    : 2026/10/19
+"""
+import json
+from collections import OrderedDict
+
+from ansible.errors import AnsibleFilterError
+from ansible_collections.sense.dellos9.plugins.module_utils.network.fib import \
+    RouteTable
+
+# Decoded tables, keyed by all serialized fields of table. Filters are called in loops
+# with same facts, so recently used tables are kept decoded (at most _CACHE_SIZE,
+# least recently used first), so cache does not grow with every host of the play
+_TABLES = OrderedDict()
+_CACHE_SIZE = 8
+
+
+def _cacheKey(data):
+    """
+    Cache key of serialized table. Packed strings are used as is (key keeps
+    reference, not copy), small lists (segments, nexthop_table) as json
+    """
+    return (
+        data["family"], data["networks"], data["nexthops"],
+        json.dumps(data["segments"]), json.dumps(data["nexthop_table"]),
+    )
+
+
+def _getTable(fib, vrf, family):
+    """Get decoded RouteTable of vrf and family from ansible_net_fib"""
+    try:
+        data = fib[vrf][f"ipv{family}"]
+    except KeyError as ex:
+        raise AnsibleFilterError(f"No ipv{family} routing table for vrf {vrf}") from ex
+    key = _cacheKey(data)
+    table = _TABLES.get(key)
+    if table is None:
+        table = _TABLES[key] = RouteTable.deserialize(data)
+        if len(_TABLES) > _CACHE_SIZE:
+            _TABLES.popitem(last=False)
+    else:
+        _TABLES.move_to_end(key)
+    return table
+
+
+def fib_lookup(fib, address, vrf="default"):
+    """Longest prefix match of address in ansible_net_fib. Returns route dict or None"""
+    family = 6 if ":" in address else 4
+    return _getTable(fib, vrf, family).lookup(address)
+
+
+def fib_count(fib, vrf="default", family=4):
+    """Number of routes in vrf routing table"""
+    return len(_getTable(fib, vrf, int(family)))
+
+
+class FilterModule:
+    """Routing table filters"""
+
+    def filters(self):
+        """Return filters"""
+        return {"fib_lookup": fib_lookup, "fib_count": fib_count}
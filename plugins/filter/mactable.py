@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""Filter plugins for packed MAC address table (ansible_net_mac_table)
+Copyright: Contributors to the SENSE Project
+GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+Title                   : sdn-sense/sense-dellos9-collection
+Author                  : Justas Balcas
+Email                   : juztas (at) gmail.com
+@Copyright              : General Public License v3.0+
+Date                    : 2026/10/19
+"""
+import json
+from collections import OrderedDict
+
+from ansible_collections.sense.dellos9.plugins.module_utils.network.mactable import \
+    MacTable
+
+# Decoded tables, keyed by all serialized fields of table. Filters are called in loops
+# with same facts, so recently used tables are kept decoded (at most _CACHE_SIZE,
+# least recently used first), so cache does not grow with every host of the play
+_TABLES = OrderedDict()
+_CACHE_SIZE = 8
+
+
+def _cacheKey(macTable):
+    """
+    Cache key of serialized table. Packed strings are used as is (key keeps
+    reference, not copy), small lists (port_table, flag_table, port_ranges) as json
+    """
+    return (
+        macTable["macs"], macTable["vlans"], macTable["ports"], macTable["flags"], macTable["port_index"],
+        json.dumps(macTable["port_table"]), json.dumps(macTable["flag_table"]), json.dumps(macTable["port_ranges"]),
+    )
+
+
+def _getTable(macTable):
+    """Get decoded MacTable from ansible_net_mac_table"""
+    key = _cacheKey(macTable)
+    table = _TABLES.get(key)
+    if table is None:
+        table = _TABLES[key] = MacTable.deserialize(macTable)
+        if len(_TABLES) > _CACHE_SIZE:
+            _TABLES.popitem(last=False)
+    else:
+        _TABLES.move_to_end(key)
+    return table
+
+
+def mac_lookup(macTable, mac):
+    """All entries (one per vlan) of mac in ansible_net_mac_table"""
+    return _getTable(macTable).lookupMac(mac)
+
+
+def mac_port(macTable, port):
+    """All entries learned on port in ansible_net_mac_table"""
+    return _getTable(macTable).lookupPort(port)
+
+
+class FilterModule:
+    """MAC address table filters"""
+
+    def filters(self):
+        """Return filters"""
+        return {"mac_lookup": mac_lookup, "mac_port": mac_port}
@@ -0,0 +1,106 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""Incremental CLI prompt and error matchers
+Copyright: Contributors to the SENSE Project
+GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+Title                   : sdn-sense/sense-dellos9-collection
+Author                  : Justas Balcas
+Email                   : juztas (at) gmail.com
+@Copyright              : General Public License v3.0+
+Date                    : 2026/10/19
+"""
+__metaclass__ = type
+
+import re
+
+from ansible_collections.sense.dellos9.plugins.module_utils.runwrapper import \
+    classwrapper
+
+# Prompt is searched only in this many last bytes of response
+PROMPT_WINDOW = 512
+
+# Incomplete last line of response is rescanned for errors, at most this many bytes
+ERROR_WINDOW = 16384
+
+# Bytes compared at start and end of previous response, to see if response only grew
+_FINGERPRINT = 32
+
+
+@classwrapper
+class PromptMatcher:
+    """
+    All prompt patterns combined to one regex. Patterns must be anchored to the
+    end ($), so only the last PROMPT_WINDOW bytes of response are searched.
+    Used by network_cli as a compiled regex (search, pattern)
+    """
+
+    def __init__(self, patterns, window=PROMPT_WINDOW):
+        self.regex = re.compile(b"|".join(b"(?:%s)" % pattern for pattern in patterns))
+        self.pattern = self.regex.pattern
+        self.window = window
+
+    def search(self, data):
+        """Search prompt at the end of response"""
+        return self.regex.search(data, max(0, len(data) - self.window))
+
+
+@classwrapper
+class ErrorMatcher:
+    """
+    All error patterns combined to one regex, scanned over new bytes only.
+    network_cli passes the whole (growing) response on every read; if response
+    continues the previous one, scan resumes at the start of its last incomplete
+    line (at most ERROR_WINDOW back), otherwise it starts over.
+
+    guarded is (prefix, exclude) pattern pair: prefix matches an error, if the rest
+    of its line is complete (ends with newline) and exclude is not found in it.
+    This is the same as prefix(?:(?!exclude).)*\\n, without lookahead at every byte.
+    Patterns must not span lines (except by a byte or two, like '\\n')
+    """
+
+    def __init__(self, patterns, guarded=None, window=ERROR_WINDOW):
+        alternatives = [b"(?P<guarded>%s)" % guarded[0]] if guarded else []
+        alternatives += [b"(?:%s)" % pattern for pattern in patterns]
+        self.regex = re.compile(b"|".join(alternatives))
+        self.exclude = re.compile(guarded[1]) if guarded else None
+        self.pattern = self.regex.pattern
+        self.window = window
+        self.reset()
+
+    def reset(self):
+        """Forget previous response"""
+        self.length = 0
+        self.head = self.tail = b""
+        self.resume = 0
+        self.match = None
+
+    def continues(self, data):
+        """Check if data is previous response with more bytes appended"""
+        return (
+            self.length
+            and len(data) >= self.length
+            and data.startswith(self.head)
+            and data[self.length - len(self.tail):self.length] == self.tail
+        )
+
+    def search(self, data):
+        """Search error in response (returns match or None)"""
+        if not self.continues(data):
+            self.reset()
+        elif self.match is not None:
+            return self.match
+        for match in self.regex.finditer(data, self.resume):
+            if self.exclude is not None and match.group("guarded"):
+                end = data.find(b"\n", match.end())
+                if end == -1 or self.exclude.search(data, match.end(), end):
+                    continue
+            self.match = match
+            break
+        # Last line can still get an error or the newline, which completes guarded error
+        lastLine = data.rfind(b"\n", self.resume) + 1 or self.resume
+        self.resume = max(self.resume, lastLine - 2, len(data) - self.window)
+        self.length = len(data)
+        self.head = data[:_FINGERPRINT]
+        self.tail = data[-_FINGERPRINT:]
+        return self.match
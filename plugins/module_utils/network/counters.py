@@ -0,0 +1,133 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""Interface counters kept in columns and bulk delta/rate computation
+Copyright: Contributors to the SENSE Project
+GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+Title                   : sdn-sense/sense-dellos9-collection
+Author                  : Justas Balcas
+Email                   : juztas (at) gmail.com
+@Copyright              : General Public License v3.0+
+Date                    : 2026/10/19
+"""
+__metaclass__ = type
+
+from array import array
+
+from ansible_collections.sense.dellos9.plugins.module_utils.runwrapper import \
+    classwrapper
+
+# Interface counters on Dell OS 9 are 64 bit
+COUNTER_WRAP = 1 << 64
+
+# Counter words in show interfaces Input/Output Statistics and their column names
+COUNTER_WORDS = {
+    "in": {
+        "packets": "in_packets",
+        "bytes": "in_bytes",
+        "Multicasts": "in_multicasts",
+        "Broadcasts": "in_broadcasts",
+        "Unicasts": "in_unicasts",
+        "runts": "in_runts",
+        "giants": "in_giants",
+        "throttles": "in_throttles",
+        "CRC": "in_crc",
+        "overrun": "in_overrun",
+        "discarded": "in_discarded",
+    },
+    "out": {
+        "packets": "out_packets",
+        "bytes": "out_bytes",
+        "underruns": "out_underruns",
+        "Multicasts": "out_multicasts",
+        "Broadcasts": "out_broadcasts",
+        "Unicasts": "out_unicasts",
+        "throttles": "out_throttles",
+        "discarded": "out_discarded",
+        "collisions": "out_collisions",
+        "wreddrops": "out_wreddrops",
+    },
+}
+
+COLUMNS = [column for words in COUNTER_WORDS.values() for column in words.values()]
+
+
+@classwrapper
+class CounterTable:
+    """
+    Counters of all interfaces in one sample, kept in columns:
+      names - interface names, row index is the position in names
+      columns - one array of 64 bit counters per counter name (see COLUMNS)
+      timestamp - time of the sample (seconds since epoch)
+    """
+
+    def __init__(self, timestamp):
+        self.timestamp = timestamp
+        self.names = []
+        self.columns = {column: array("Q") for column in COLUMNS}
+
+    def addRow(self, name):
+        """Add interface with all counters set to 0 and return its row index"""
+        self.names.append(name)
+        for arr in self.columns.values():
+            arr.append(0)
+        return len(self.names) - 1
+
+    def __len__(self):
+        return len(self.names)
+
+    def serialize(self):
+        """Serialize to json compatible dict"""
+        return {
+            "timestamp": self.timestamp,
+            "names": self.names,
+            "columns": {column: arr.tolist() for column, arr in self.columns.items()},
+        }
+
+    @classmethod
+    def deserialize(cls, data):
+        """Load sample from serialize output"""
+        table = cls(data["timestamp"])
+        table.names = data["names"]
+        for column in COLUMNS:
+            values = data["columns"].get(column)
+            table.columns[column] = array("Q", values if values is not None else [0] * len(table.names))
+        return table
+
+    @staticmethod
+    def delta(prev, cur):
+        """
+        Difference of two counter values. If counter went backwards and previous
+        value was in the upper half of the range, counter wrapped; otherwise
+        counters were cleared and current value is the delta
+        """
+        if cur >= prev:
+            return cur - prev
+        if prev >= COUNTER_WRAP >> 1:
+            return cur + COUNTER_WRAP - prev
+        return cur
+
+    def compare(self, previous):
+        """
+        Compute deltas and rates (per second) of all counters against previous sample.
+        Previous rows are aligned to current rows once, then every column is computed
+        in one pass. Interfaces missing in previous sample get None.
+        Returns (interval, deltas, rates), deltas and rates are dicts of column lists
+        """
+        interval = self.timestamp - previous.timestamp
+        prevIndex = {name: idx for idx, name in enumerate(previous.names)}
+        aligned = [prevIndex.get(name) for name in self.names]
+        deltas = {}
+        rates = {}
+        for column, arr in self.columns.items():
+            prevArr = previous.columns[column]
+            colDeltas = [
+                None if idx is None else self.delta(prevArr[idx], value)
+                for idx, value in zip(aligned, arr)
+            ]
+            deltas[column] = colDeltas
+            if interval > 0:
+                rates[column] = [None if val is None else val / interval for val in colDeltas]
+            else:
+                rates[column] = [None] * len(colDeltas)
+        return interval, deltas, rates
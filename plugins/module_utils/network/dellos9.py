@@ -22,7 +22,7 @@ from ansible.utils.display import Display
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
     ComplexList, to_list)
 from ansible_collections.sense.dellos9.plugins.module_utils.runwrapper import (
-    classwrapper, functionwrapper)
+    classwrapper, functionwrapper, recordCommand)
 
 display = Display()
 
@@ -73,6 +73,7 @@ def get_config(module, flags=None):
         return _DEVICE_CONFIGS[cmd]
     except KeyError:
         ret, out, err = exec_command(module, cmd)
+        recordCommand(cmd, out)
         if ret != 0:
             module.fail_json(
                 msg="unable to retrieve current config",
@@ -97,8 +98,10 @@ def run_commands(module, commands, check_rc=True):
     responses = []
     commands = to_commands(module, to_list(commands))
     for cmd in commands:
+        command = cmd["command"]
         cmd = module.jsonify(cmd)
         ret, out, err = exec_command(module, cmd)
+        recordCommand(command, out)
         if check_rc and ret != 0:
             module.fail_json(msg=to_text(err, errors="surrogate_or_strict"), rc=ret)
         responses.append(to_text(out, errors="surrogate_or_strict"))
@@ -109,6 +112,7 @@ def run_commands(module, commands, check_rc=True):
 def load_config(module, commands):
     """Load config"""
     ret, _out, err = exec_command(module, "configure terminal")
+    recordCommand("configure terminal", _out)
     if ret != 0:
         module.fail_json(
             msg="unable to enter configuration mode",
@@ -119,12 +123,14 @@ def load_config(module, commands):
         if command == "end":
             continue
         ret, _out, err = exec_command(module, command)
+        recordCommand(command, _out)
         if ret != 0:
             module.fail_json(
                 msg=to_text(err, errors="surrogate_or_strict"), command=command, rc=ret
             )
 
-    exec_command(module, "end")
+    _ret, _out, _err = exec_command(module, "end")
+    recordCommand("end", _out)
 
 
 @functionwrapper
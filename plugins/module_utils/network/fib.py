@@ -0,0 +1,154 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""Packed routing table (FIB) storage and longest prefix match lookups
+Copyright: Contributors to the SENSE Project
+GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+Title                   : sdn-sense/sense-dellos9-collection
+Author                  : Justas Balcas
+Email                   : juztas (at) gmail.com
+@Copyright              : General Public License v3.0+
+Date                    : 2026/10/19
+"""
+__metaclass__ = type
+
+import base64
+import socket
+import sys
+from array import array
+from bisect import bisect_left
+
+from ansible_collections.sense.dellos9.plugins.module_utils.runwrapper import \
+    classwrapper
+
+FAMILIES = {4: (socket.AF_INET, 4), 6: (socket.AF_INET6, 16)}
+
+
+# Array type code of 32 bit unsigned int (IPv4 networks)
+_UINT32 = "I" if array("I").itemsize == 4 else "L"
+
+
+@classwrapper
+class RouteTable:
+    """
+    Routing table of one VRF and address family, kept in packed form:
+      networks - big endian network addresses (4 or 16 bytes each) in one bytes object
+      nexthops - array of indexes into interned nexthop table ([code, gateway, interface])
+      segments - [prefixlen, start, end] ranges of routes with same prefix length.
+    Routes are sorted by prefix length and network, so each segment can be
+    searched with bisect. Lookup checks segments from the longest prefix length
+    and stops at the first match. Networks are unpacked to ints once, on first
+    lookup (array for IPv4, list for IPv6, which does not fit array types).
+    """
+
+    def __init__(self, family):
+        self.family = family
+        self.addrFamily, self.width = FAMILIES[family]
+        self.nexthopTable = []
+        self.nexthops = array("I")
+        self.networks = b""
+        self.segments = []
+        self._interned = {}
+        self._staging = []
+        self._keys = None
+
+    def add(self, prefix, code, gateway, interface):
+        """Add route (e.g. 10.0.0.0/8) to staging. Call finalize once all routes are added"""
+        network, _, prefixlen = prefix.partition("/")
+        try:
+            packed = socket.inet_pton(self.addrFamily, network)
+            prefixlen = int(prefixlen)
+        except (OSError, ValueError):
+            return False
+        if not 0 <= prefixlen <= self.width * 8:
+            return False
+        key = (code, gateway, interface)
+        nhIndex = self._interned.get(key)
+        if nhIndex is None:
+            nhIndex = self._interned[key] = len(self.nexthopTable)
+            self.nexthopTable.append(list(key))
+        bits = self.width * 8
+        network = int.from_bytes(packed, "big") & (((1 << prefixlen) - 1) << (bits - prefixlen))
+        # One int per route keeps staging small and sorts by prefixlen, network
+        self._staging.append((((prefixlen << bits) | network) << 32) | nhIndex)
+        return True
+
+    def finalize(self):
+        """Sort staged routes and pack them"""
+        self._staging.sort()
+        networks = bytearray()
+        netMask = (1 << (self.width * 8)) - 1
+        for route in self._staging:
+            self.nexthops.append(route & 0xFFFFFFFF)
+            route >>= 32
+            networks += (route & netMask).to_bytes(self.width, "big")
+            prefixlen = route >> (self.width * 8)
+            if self.segments and self.segments[-1][0] == prefixlen:
+                self.segments[-1][2] += 1
+            else:
+                count = len(self.nexthops) - 1
+                self.segments.append([prefixlen, count, count + 1])
+        self.networks = bytes(networks)
+        self._keys = None
+        self._staging = []
+        self._interned = {}
+
+    def __len__(self):
+        return len(self.nexthops)
+
+    def serialize(self):
+        """Serialize to json compatible dict"""
+        return {
+            "family": self.family,
+            "count": len(self.nexthops),
+            "networks": base64.b64encode(self.networks).decode("ascii"),
+            "nexthops": base64.b64encode(self.nexthops.tobytes()).decode("ascii"),
+            "segments": self.segments,
+            "nexthop_table": self.nexthopTable,
+        }
+
+    @classmethod
+    def deserialize(cls, data):
+        """Load table from serialize output"""
+        table = cls(data["family"])
+        table.networks = base64.b64decode(data["networks"])
+        table.nexthops.frombytes(base64.b64decode(data["nexthops"]))
+        table.segments = data["segments"]
+        table.nexthopTable = data["nexthop_table"]
+        return table
+
+    def networkKeys(self):
+        """Networks as ints, in the same order as packed networks"""
+        if self._keys is None:
+            if self.width == 4:
+                keys = array(_UINT32, self.networks)
+                if sys.byteorder == "little":
+                    keys.byteswap()
+            else:
+                keys = [
+                    int.from_bytes(self.networks[idx:idx + self.width], "big")
+                    for idx in range(0, len(self.networks), self.width)
+                ]
+            self._keys = keys
+        return self._keys
+
+    def lookup(self, address):
+        """Longest prefix match of address. Returns route dict or None"""
+        try:
+            addr = int.from_bytes(socket.inet_pton(self.addrFamily, address), "big")
+        except OSError:
+            return None
+        bits = self.width * 8
+        keys = self.networkKeys()
+        for prefixlen, start, end in reversed(self.segments):
+            network = addr & (((1 << prefixlen) - 1) << (bits - prefixlen))
+            idx = bisect_left(keys, network, start, end)
+            if idx < end and keys[idx] == network:
+                code, gateway, interface = self.nexthopTable[self.nexthops[idx]]
+                return {
+                    "prefix": f"{socket.inet_ntop(self.addrFamily, network.to_bytes(self.width, 'big'))}/{prefixlen}",
+                    "code": code,
+                    "gateway": gateway,
+                    "interface": interface,
+                }
+        return None
@@ -0,0 +1,130 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""Canonical Dell OS 9 interface names and alias index
+Copyright: Contributors to the SENSE Project
+GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+Title                   : sdn-sense/sense-dellos9-collection
+Author                  : Justas Balcas
+Email                   : juztas (at) gmail.com
+@Copyright              : General Public License v3.0+
+Date                    : 2026/10/19
+"""
+__metaclass__ = type
+
+import re
+
+from ansible_collections.sense.dellos9.plugins.module_utils.runwrapper import (
+    classwrapper, functionwrapper)
+
+# Canonical interface prefix (as in show interfaces) and its abbreviation
+# used by table outputs (show interfaces status, show lldp neighbors, show arp, ...)
+ABBREVIATIONS = {
+    "Hu": "hundredGigE",
+    "Fi": "fiftyGigE",
+    "Fo": "fortyGigE",
+    "Tf": "twentyFiveGigE",
+    "Te": "TenGigabitEthernet",
+    "Gi": "GigabitEthernet",
+    "Ma": "ManagementEthernet",
+    "Po": "Port-channel",
+    "Vl": "Vlan",
+    "Lo": "Loopback",
+    "Tu": "Tunnel",
+}
+
+# Other spellings of prefixes seen in outputs and user input
+_EXTRA_ALIASES = {
+    "hundredGigE": ["HundredGigabitEthernet"],
+    "fortyGigE": ["FortyGigabitEthernet"],
+    "twentyFiveGigE": ["TwentyFiveGigabitEthernet"],
+    "TenGigabitEthernet": ["TenGigE"],
+    "GigabitEthernet": ["GigE"],
+    "ManagementEthernet": ["Mgmt"],
+    "Port-channel": ["PortChannel"],
+}
+
+
+def _buildPrefixIndex():
+    """Build lowercase prefix alias to canonical prefix index"""
+    index = {}
+    for abbr, prefix in ABBREVIATIONS.items():
+        for alias in [abbr, prefix] + _EXTRA_ALIASES.get(prefix, []):
+            index[alias.lower()] = prefix
+    return index
+
+
+PREFIX_INDEX = _buildPrefixIndex()
+
+# Canonical prefix to all its spellings (lowercase aliases and abbreviation)
+PREFIX_ALIASES = {prefix: [abbr] for abbr, prefix in ABBREVIATIONS.items()}
+for _alias, _prefix in PREFIX_INDEX.items():
+    PREFIX_ALIASES[_prefix].append(_alias)
+
+# Prefix, optional separator (space or underscore from member lists), unit/port[/breakout]
+# and optional status suffix, like Hu 1/1(Up) in port-channel member lists
+_NAME_RE = re.compile(r"^\s*([A-Za-z][A-Za-z-]*?)[\s_]*(\d+(?:/\d+)*)\s*(?:\(.*\))?\s*$")
+
+# Names already normalized. Same names repeat across commands and hosts
+_CANONICAL = {}
+
+
+@functionwrapper
+def canonicalName(name):
+    """
+    Canonical name of interface, e.g. Hu 1/1, Hu1/1, hundredgige 1/1 and Hu_1/1(Up)
+    all are hundredGigE 1/1. Breakout ports (fortyGigE 1/49/1) keep all numbers.
+    Unknown names are returned stripped, but otherwise unchanged
+    """
+    canonical = _CANONICAL.get(name)
+    if canonical is not None:
+        return canonical
+    canonical = name.strip()
+    match = _NAME_RE.match(name)
+    if match:
+        prefix = PREFIX_INDEX.get(match.group(1).lower())
+        if prefix:
+            canonical = f"{prefix} {match.group(2)}"
+    _CANONICAL[name] = canonical
+    return canonical
+
+
+def aliases(name):
+    """All common spellings of canonical interface name"""
+    prefix, _, number = name.partition(" ")
+    out = {name}
+    if not number:
+        return out
+    for alias in [prefix] + PREFIX_ALIASES.get(prefix, []):
+        out.update([f"{alias} {number}", f"{alias}{number}", f"{alias}_{number}"])
+    return out
+
+
+@classwrapper
+class InterfaceIndex:
+    """
+    Index of known interfaces. All aliases of every interface are precomputed,
+    so lookups of any spelling are a single dict get
+    """
+
+    def __init__(self, names=()):
+        self.index = {}
+        for name in names:
+            self.add(name)
+
+    def add(self, name):
+        """Add interface and all its aliases to index"""
+        canonical = canonicalName(name)
+        for alias in aliases(canonical):
+            self.index.setdefault(alias, name)
+        self.index[name] = name
+
+    def get(self, name, default=None):
+        """Get known interface name of any spelling"""
+        found = self.index.get(name)
+        if found is None:
+            found = self.index.get(canonicalName(name), default)
+        return found
+
+    def __contains__(self, name):
+        return self.get(name) is not None
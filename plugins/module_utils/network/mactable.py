@@ -0,0 +1,177 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""Packed MAC address table storage and lookups
+Copyright: Contributors to the SENSE Project
+GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+Title                   : sdn-sense/sense-dellos9-collection
+Author                  : Justas Balcas
+Email                   : juztas (at) gmail.com
+@Copyright              : General Public License v3.0+
+Date                    : 2026/10/19
+"""
+__metaclass__ = type
+
+import base64
+from array import array
+from bisect import bisect_left, bisect_right
+
+from ansible_collections.sense.dellos9.plugins.module_utils.network.ifnames import \
+    canonicalName
+from ansible_collections.sense.dellos9.plugins.module_utils.runwrapper import \
+    classwrapper
+
+
+def mactoint(mac):
+    """Convert mac (00:01:e8:96:1c:19, 0001.e896.1c19 or 00-01-e8-96-1c-19) to int"""
+    return int(mac.replace(":", "").replace(".", "").replace("-", ""), 16)
+
+
+def inttomac(value):
+    """Convert int to mac in 00:01:e8:96:1c:19 format"""
+    hexmac = f"{value:012x}"
+    return ":".join(hexmac[idx:idx + 2] for idx in range(0, 12, 2))
+
+
+def _encode(arr):
+    """Encode array to base64 string"""
+    return base64.b64encode(arr.tobytes()).decode("ascii")
+
+
+def _decode(typecode, data):
+    """Decode base64 string to array"""
+    arr = array(typecode)
+    arr.frombytes(base64.b64decode(data))
+    return arr
+
+
+@classwrapper
+class MacTable:
+    """
+    MAC address table kept in packed columns, sorted by mac and vlan:
+      macs - array of macs as 48 bit ints
+      vlans - array of vlan ids
+      ports - array of indexes into interned port names table
+      flags - array of indexes into interned [type, state] table
+    Port index (record indexes sorted by port) and port ranges are built once
+    in finalize, so lookups by mac and by port do not scan the table. Port
+    names are canonical, lookups by port accept any spelling (Te 1/33).
+    """
+
+    def __init__(self):
+        self.macs = array("Q")
+        self.vlans = array("H")
+        self.ports = array("H")
+        self.flags = array("B")
+        self.portTable = []
+        self.flagTable = []
+        self.portIndex = array("I")
+        self.portRanges = []
+        self._portLookup = None
+        self._portIdx = {}
+        self._flagIdx = {}
+        self._staging = []
+
+    @staticmethod
+    def _intern(table, interned, value):
+        """Intern value in table and return its index"""
+        idx = interned.get(value)
+        if idx is None:
+            idx = interned[value] = len(table)
+            table.append(list(value) if isinstance(value, tuple) else value)
+        return idx
+
+    def add(self, vlan, mac, port, mactype, state):
+        """Add mac entry to staging. Call finalize once all entries are added"""
+        try:
+            macInt = mactoint(mac)
+            vlan = int(vlan)
+        except ValueError:
+            return False
+        portIdx = self._intern(self.portTable, self._portIdx, port)
+        flagIdx = self._intern(self.flagTable, self._flagIdx, (mactype, state))
+        # One int per entry keeps staging small and sorts by mac, vlan
+        self._staging.append((macInt << 48) | (vlan << 32) | (portIdx << 8) | flagIdx)
+        return True
+
+    def finalize(self):
+        """Sort staged entries, pack them and build port index"""
+        self._staging.sort()
+        for entry in self._staging:
+            self.flags.append(entry & 0xFF)
+            self.ports.append((entry >> 8) & 0xFFFF)
+            self.vlans.append((entry >> 32) & 0xFFFF)
+            self.macs.append(entry >> 48)
+        self._staging = []
+        self._portIdx = {}
+        self._flagIdx = {}
+        self.buildPortIndex()
+
+    def buildPortIndex(self):
+        """Build record indexes sorted by port and [start, end] range of every port"""
+        self.portIndex = array("I", sorted(range(len(self.ports)), key=self.ports.__getitem__))
+        self.portRanges = [[0, 0] for _ in self.portTable]
+        for pos, idx in enumerate(self.portIndex):
+            portRange = self.portRanges[self.ports[idx]]
+            if portRange[1] == 0:
+                portRange[0] = pos
+            portRange[1] = pos + 1
+
+    def __len__(self):
+        return len(self.macs)
+
+    def serialize(self):
+        """Serialize to json compatible dict"""
+        return {
+            "count": len(self.macs),
+            "macs": _encode(self.macs),
+            "vlans": _encode(self.vlans),
+            "ports": _encode(self.ports),
+            "flags": _encode(self.flags),
+            "port_table": self.portTable,
+            "flag_table": self.flagTable,
+            "port_index": _encode(self.portIndex),
+            "port_ranges": self.portRanges,
+        }
+
+    @classmethod
+    def deserialize(cls, data):
+        """Load table from serialize output"""
+        table = cls()
+        table.macs = _decode("Q", data["macs"])
+        table.vlans = _decode("H", data["vlans"])
+        table.ports = _decode("H", data["ports"])
+        table.flags = _decode("B", data["flags"])
+        table.portTable = data["port_table"]
+        table.flagTable = data["flag_table"]
+        table.portIndex = _decode("I", data["port_index"])
+        table.portRanges = data["port_ranges"]
+        return table
+
+    def entry(self, idx):
+        """Get record as dict"""
+        mactype, state = self.flagTable[self.flags[idx]]
+        return {
+            "mac": inttomac(self.macs[idx]),
+            "vlan": self.vlans[idx],
+            "interface": self.portTable[self.ports[idx]],
+            "type": mactype,
+            "state": state,
+        }
+
+    def lookupMac(self, mac):
+        """All entries (one per vlan) of mac"""
+        macInt = mactoint(mac)
+        start = bisect_left(self.macs, macInt)
+        end = bisect_right(self.macs, macInt, start)
+        return [self.entry(idx) for idx in range(start, end)]
+
+    def lookupPort(self, port):
+        """All entries learned on port (any spelling of interface name)"""
+        if self._portLookup is None:
+            self._portLookup = {canonicalName(name): idx for idx, name in enumerate(self.portTable)}
+        idx = self._portLookup.get(canonicalName(port))
+        if idx is None:
+            return []
+        start, end = self.portRanges[idx]
+        return [self.entry(self.portIndex[pos]) for pos in range(start, end)]
@@ -0,0 +1,93 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""Spool large command outputs to temp file and parse them via mmap
+Copyright: Contributors to the SENSE Project
+GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+Title                   : sdn-sense/sense-dellos9-collection
+Author                  : Justas Balcas
+Email                   : juztas (at) gmail.com
+@Copyright              : General Public License v3.0+
+Date                    : 2026/10/19
+"""
+__metaclass__ = type
+
+import mmap
+import tempfile
+
+from ansible_collections.sense.dellos9.plugins.module_utils.runwrapper import (
+    classwrapper, functionwrapper)
+
+# Size of chunks, in which text output is encoded and written to temp file
+CHUNK_SIZE = 1 << 20
+
+
+@classwrapper
+class SpooledOutput:
+    """
+    Command output kept in anonymous temp file and mapped to memory.
+    Parsers run compiled bytes regexes over it (finditer), so pages are
+    loaded by the kernel on demand and no str copy of the output is made.
+    """
+
+    def __init__(self, data):
+        self.fd = tempfile.TemporaryFile()
+        if isinstance(data, str):
+            for idx in range(0, len(data), CHUNK_SIZE):
+                self.fd.write(data[idx:idx + CHUNK_SIZE].encode("utf-8", errors="surrogateescape"))
+        else:
+            self.fd.write(data)
+        self.fd.flush()
+        self.size = self.fd.tell()
+        self.map = mmap.mmap(self.fd.fileno(), 0, access=mmap.ACCESS_READ) if self.size else b""
+
+    def __len__(self):
+        return self.size
+
+    def finditer(self, pattern):
+        """Iterate over matches of compiled bytes pattern"""
+        return pattern.finditer(self.map)
+
+    def close(self):
+        """Unmap and remove temp file"""
+        if isinstance(self.map, mmap.mmap):
+            self.map.close()
+        self.map = b""
+        self.fd.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+@functionwrapper
+def encodedSize(data, limit):
+    """
+    Size of output in bytes, as written to temp file (utf-8). Counting stops
+    once size is above limit, so large outputs are not encoded twice
+    """
+    if isinstance(data, bytes) or data.isascii():
+        return len(data)
+    size = 0
+    for idx in range(0, len(data), CHUNK_SIZE):
+        size += len(data[idx:idx + CHUNK_SIZE].encode("utf-8", errors="surrogateescape"))
+        if size > limit:
+            break
+    return size
+
+
+@functionwrapper
+def spool(data, threshold):
+    """
+    Spool output to SpooledOutput, if it is larger than threshold (in bytes).
+    Only outputs of SPOOL_COMMANDS (mac subset) are spooled, as only their
+    parsers accept SpooledOutput
+    """
+    if threshold is None:
+        return data
+    # utf-8 takes at least one byte per character
+    if len(data) <= threshold and encodedSize(data, threshold) <= threshold:
+        return data
+    return SpooledOutput(data)
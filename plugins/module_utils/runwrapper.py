@@ -9,46 +9,241 @@ Email                   : juztas (at) gmail.com
 @Copyright              : General Public License v3.0+
 Date                    : 2023/11/05
 """
+import atexit
+import contextlib
+import cProfile
+import functools
 import inspect
+import os
+import pstats
+import re
+import sys
+import tempfile
 import time
+import tracemalloc
+import types
 
 from ansible.utils.display import Display
 
 display = Display()
 
+# Instrumentation state is resolved once, at import. When disabled, decorated
+# functions are returned as they are (no wrapper frame), but remembered, so
+# enable() can wrap them later
+ENABLED = display.verbosity > 5
 
-def functionwrapper(func):
-    """Function wrapper to print start/runtime/end"""
+# Cumulative call count and runtime of instrumented functions: {qualname: [calls, seconds]}
+STATS = {}
+
+# Commands run on device: number of exec_command calls and bytes received per command
+IO_STATS = {"exec_command": 0, "bytes_received": {}}
+
+# Wall time of module phases: {phase: seconds}
+PHASES = {}
+
+# Profiling requested by environment (cpu, memory or cpu,memory) and output directory
+PROFILE_ENV = "DELLOS9_PROFILE"
+PROFILE_DIR_ENV = "DELLOS9_PROFILE_DIR"
+PROFILE_MODES = ("cpu", "memory")
+
+# Active Profiler of module run
+PROFILER = None
+
+# Modules, which functions can be decorated (module run by AnsiballZ is __main__)
+MODULE_PREFIXES = ("ansible_collections.sense.dellos9.", "__main__")
+
+# (class or None, function) decorated while instrumentation was disabled
+_REGISTRY = []
+
+
+def _wrap(func):
+    """Wrap function to record its runtime in STATS. Logging is decided once, at wrap time"""
+    name = func.__qualname__
+    stats = STATS.setdefault(name, [0, 0.0])
+    verbose = display.verbosity > 5
 
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        if display.verbosity > 5:
-            display.vvvvvv(
-                f"[WRAPPER][{time.time()}] Enter {func.__qualname__}, {func.__code__.co_filename}"
-            )
-            start_time = time.perf_counter()
-            result = func(*args, **kwargs)
-            end_time = time.perf_counter()
-            total_time = end_time - start_time
-            display.vvvvvv(
-                f"[WRAPPER][{time.time()}] Function {func.__qualname__} {args} {kwargs} Took {total_time:.4f} seconds"
-            )
-            display.vvvvvv(f"[WRAPPER][{time.time()}] Leave {func.__qualname__}")
-        else:
-            result = func(*args, **kwargs)
-        return result
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            stats[0] += 1
+            stats[1] += elapsed
+            if verbose:
+                display.vvvvvv(f"[WRAPPER] {name} took {elapsed:.4f} seconds")
 
     return wrapper
 
+
+def functionwrapper(func):
+    """
+    Function wrapper to record runtime and call count. Generator functions are
+    not wrapped: call only creates generator, iteration is timed in the caller
+    """
+    if inspect.isgeneratorfunction(func):
+        return func
+    if ENABLED:
+        return _wrap(func)
+    _REGISTRY.append((None, func))
+    return func
+
+
 def classwrapper(cls):
-    """Class wrapper to print all functions start/runtime/end"""
-    for name, method in cls.__dict__.items():
-        if callable(method) and name != "__init__":
-            if inspect.isfunction(method):
-                if inspect.signature(method).parameters.get('self'):
-                    setattr(cls, name, functionwrapper(method))
-            elif inspect.ismethod(method):
-                if inspect.signature(method).parameters:
-                    firstParam = next(iter(inspect.signature(method).parameters))
-                    if firstParam == 'self':
-                        setattr(cls, name, functionwrapper(method))
+    """Class wrapper to record runtime and call count of all methods (except __init__, static and generators)"""
+    for name, method in list(cls.__dict__.items()):
+        if name == "__init__" or not isinstance(method, types.FunctionType) or inspect.isgeneratorfunction(method):
+            continue
+        code = method.__code__
+        if code.co_argcount and code.co_varnames[0] == "self":
+            if ENABLED:
+                setattr(cls, name, _wrap(method))
+            else:
+                _REGISTRY.append((cls, method))
     return cls
+
+
+def enable():
+    """Enable instrumentation of all functions decorated so far (only first call does anything)"""
+    global ENABLED
+    if ENABLED:
+        return
+    ENABLED = True
+    wrapped = {}
+    for cls, func in _REGISTRY:
+        if cls is None:
+            wrapped[id(func)] = (func, _wrap(func))
+        else:
+            setattr(cls, func.__name__, _wrap(func))
+    _REGISTRY.clear()
+    # Functions are also imported by name to other modules, replace all references
+    for modName, module in list(sys.modules.items()):
+        if module is None or not modName.startswith(MODULE_PREFIXES):
+            continue
+        for attr, value in list(vars(module).items()):
+            found = wrapped.get(id(value))
+            if found and found[0] is value:
+                setattr(module, attr, found[1])
+
+
+def outputSize(output):
+    """Size of output in bytes (utf-8). ASCII str, the usual device output, is not encoded"""
+    if not output:
+        return 0
+    if isinstance(output, bytes) or output.isascii():
+        return len(output)
+    return len(output.encode("utf-8", errors="surrogateescape"))
+
+
+def recordCommand(command, output):
+    """Record exec_command call and size of its output (only if instrumentation is enabled)"""
+    if not ENABLED:
+        return
+    IO_STATS["exec_command"] += 1
+    received = IO_STATS["bytes_received"]
+    received[command] = received.get(command, 0) + outputSize(output)
+
+
+@contextlib.contextmanager
+def phase(name):
+    """Record wall time of module phase"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        PHASES[name] = PHASES.get(name, 0.0) + time.perf_counter() - start
+
+
+def metrics():
+    """Collected metrics as json compatible dict (collect_metrics module result)"""
+    return {
+        "functions": {
+            name: {"calls": calls, "time": round(seconds, 6)}
+            for name, (calls, seconds) in STATS.items()
+            if calls
+        },
+        "exec_command": IO_STATS["exec_command"],
+        "bytes_received": dict(IO_STATS["bytes_received"]),
+        "phases": {name: round(seconds, 6) for name, seconds in PHASES.items()},
+    }
+
+
+class Profiler:
+    """
+    cProfile and/or tracemalloc capture of module run. Results are written to
+    directory as <name>_<time>.pstats (cpu), <name>_<time>.tracemalloc (snapshot)
+    and <name>_<time>.top.txt (top allocations). Worker threads are profiled
+    with their own profile (see profiled) and merged into one pstats file
+    """
+
+    TOP_ALLOCATIONS = 50
+
+    def __init__(self, modes, directory, name):
+        self.modes = set(modes)
+        self.directory = directory
+        self.name = re.sub(r"[^\w.-]+", "_", name).strip("_") or "module"
+        self.profile = None
+        self.threads = []
+        self.files = []
+        self.stopped = False
+
+    def start(self):
+        """Start capture. Results are written by stop, at latest on interpreter exit"""
+        global PROFILER
+        PROFILER = self
+        if "memory" in self.modes:
+            tracemalloc.start(25)
+        if "cpu" in self.modes:
+            self.profile = cProfile.Profile()
+            self.profile.enable()
+        atexit.register(self.stop)
+        return self
+
+    def stop(self):
+        """Stop capture and write results"""
+        global PROFILER
+        if self.stopped:
+            return self.files
+        self.stopped = True
+        PROFILER = None
+        os.makedirs(self.directory, exist_ok=True)
+        prefix = os.path.join(self.directory, f"{self.name}_{time.strftime('%Y%m%d-%H%M%S')}")
+        if self.profile:
+            self.profile.disable()
+            stats = pstats.Stats(self.profile)
+            for profile in self.threads:
+                stats.add(profile)
+            stats.dump_stats(prefix + ".pstats")
+            self.files.append(prefix + ".pstats")
+        if tracemalloc.is_tracing():
+            snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+            snapshot.dump(prefix + ".tracemalloc")
+            with open(prefix + ".top.txt", "w", encoding="utf-8") as fd:
+                for stat in snapshot.statistics("lineno")[:self.TOP_ALLOCATIONS]:
+                    fd.write(f"{stat}\n")
+            self.files += [prefix + ".tracemalloc", prefix + ".top.txt"]
+        return self.files
+
+
+def startProfiling(modes=None, directory=None, name="module"):
+    """
+    Start Profiler, if profiling is requested by modes (module option) or
+    DELLOS9_PROFILE environment variable. Returns Profiler or None
+    """
+    modes = [mode for mode in modes or os.environ.get(PROFILE_ENV, "").split(",") if mode in PROFILE_MODES]
+    if not modes:
+        return None
+    directory = directory or os.environ.get(PROFILE_DIR_ENV) or tempfile.gettempdir()
+    return Profiler(modes, directory, name).start()
+
+
+def profiled(func, *args, **kwargs):
+    """Run func, in worker thread under its own cProfile, if cpu profiling is active"""
+    profiler = PROFILER
+    if profiler is None or profiler.profile is None:
+        return func(*args, **kwargs)
+    profile = cProfile.Profile()
+    profiler.threads.append(profile)
+    return profile.runcall(func, *args, **kwargs)
@@ -18,8 +18,8 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.c
     NetworkConfig, dumps)
 from ansible_collections.sense.dellos9.plugins.module_utils.network.dellos9 import (
     check_args, dellos9_argument_spec, get_config, load_config, run_commands)
-from ansible_collections.sense.dellos9.plugins.module_utils.runwrapper import \
-    functionwrapper
+from ansible_collections.sense.dellos9.plugins.module_utils.runwrapper import (
+    enable, functionwrapper, metrics, phase, startProfiling)
 
 __metaclass__ = type
 
@@ -83,6 +83,10 @@ def main():
         config={},
         backup=dict(type="bool", default=False),
         backup_options=dict(type="dict", options=backup_spec),
+        collect_metrics=dict(type="bool", default=False),
+        profile=dict(type="list", elements="str", default=[], choices=["cpu", "memory"]),
+        profile_dir=dict(type="path"),
+        profile_name=dict(type="str"),
     )
 
     argument_spec.update(dellos9_argument_spec)
@@ -93,6 +97,11 @@ def main():
         mutually_exclusive=mutually_exclusive,
         supports_check_mode=True,
     )
+    if module.params["collect_metrics"]:
+        enable()
+    profiler = startProfiling(
+        module.params["profile"], module.params["profile_dir"], module.params["profile_name"] or "dellos9_config"
+    )
 
     match = module.params["match"]
     replace = module.params["replace"]
@@ -102,17 +111,21 @@ def main():
 
     result = dict(changed=False, saved=False, warnings=warnings)
 
-    candidate = get_candidate(module)
+    with phase("candidate"):
+        candidate = get_candidate(module)
 
     if module.params["backup"]:
         if not module.check_mode:
-            result["__backup__"] = get_config(module)
+            with phase("backup"):
+                result["__backup__"] = get_config(module)
 
     if any((module.params["lines"], module.params["src"])):
         if match != "none":
-            config = get_running_config(module)
-            config = NetworkConfig(contents=config, indent=1)
-            configobjs = candidate.difference(config, match=match, replace=replace)
+            with phase("running_config"):
+                config = get_running_config(module)
+            with phase("diff"):
+                config = NetworkConfig(contents=config, indent=1)
+                configobjs = candidate.difference(config, match=match, replace=replace)
         else:
             configobjs = candidate.items
 
@@ -140,7 +153,8 @@ def main():
                 commands.extend(module.params["after"])
 
             if not module.check_mode and module.params["update"] == "merge":
-                load_config(module, commands)
+                with phase("load"):
+                    load_config(module, commands)
 
             result["changed"] = True
             result["commands"] = commands
@@ -154,7 +168,8 @@ def main():
                 "prompt": r"\[confirm yes/no\]:\s?$",
                 "answer": "yes",
             }
-            run_commands(module, [cmd])
+            with phase("save"):
+                run_commands(module, [cmd])
             result["saved"] = True
         else:
             module.warn(
@@ -163,6 +178,10 @@ def main():
                 "non-volatile storage"
             )
 
+    if module.params["collect_metrics"]:
+        result["metrics"] = metrics()
+    if profiler:
+        result["profile_files"] = profiler.stop()
     module.exit_json(**result)
 
 
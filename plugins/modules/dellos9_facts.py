@@ -13,18 +13,35 @@ Date                    : 2023/11/05
 __metaclass__ = type
 import os
 import json
+import multiprocessing
+import pickle
 import tempfile
+import threading
 
 import re
+import time
 import traceback
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from xml.etree import ElementTree
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.six import iteritems
 from ansible.utils.display import Display
+from ansible_collections.sense.dellos9.plugins.module_utils.network.counters import (
+    COUNTER_WORDS, CounterTable)
 from ansible_collections.sense.dellos9.plugins.module_utils.network.dellos9 import (
     PortMapping, check_args, dellos9_argument_spec, normalizedip, run_commands)
+from ansible_collections.sense.dellos9.plugins.module_utils.network.fib import \
+    RouteTable
+from ansible_collections.sense.dellos9.plugins.module_utils.network.ifnames import (
+    ABBREVIATIONS, InterfaceIndex, canonicalName)
+from ansible_collections.sense.dellos9.plugins.module_utils.network.mactable import \
+    MacTable
+from ansible_collections.sense.dellos9.plugins.module_utils.network.spool import (
+    SpooledOutput, spool)
 from ansible_collections.sense.dellos9.plugins.module_utils.runwrapper import (
-    classwrapper, functionwrapper)
+    classwrapper, enable, functionwrapper, metrics, phase, profiled, startProfiling)
 
 display = Display()
 
@@ -47,24 +64,228 @@ def dumpFactsToTmp(ansible_facts):
         json.dump(ansible_facts, f, indent=2, ensure_ascii=False, default=default_serializer)
     return path
 
+@functionwrapper
+def iterLines(data):
+    """
+    Iterate over lines of output (with line ends, same as io.StringIO) by slicing
+    it in place. io.StringIO keeps UCS4 copy of the whole output and split keeps
+    all lines, so memory would grow with output size
+    """
+    start = 0
+    size = len(data)
+    while start < size:
+        end = data.find("\n", start) + 1 or size
+        yield data[start:end]
+        start = end
+
+
+# Characters of display-xml output fed to parser at a time
+XML_CHUNK = 65536
+
+
+@functionwrapper
+def iterXmlRecords(data, recordTag, listTags=()):
+    """
+    Iterate over display-xml output and yield every recordTag element as a dict
+    of its leaf tags and texts (tags in listTags are collected as lists).
+    Output can contain several documents (per interface commands); document
+    boundaries are found with str.find and every document is fed to its own
+    pull parser in slices, so output is not copied. Elements are dropped as soon
+    as record is yielded, so memory stays bounded by one record
+    """
+    start = data.find("<?xml")
+    if start == -1 and data.strip():
+        start = 0
+    while start != -1:
+        nextDoc = data.find("<?xml", start + 1)
+        end = len(data) if nextDoc == -1 else nextDoc
+        parser = ElementTree.XMLPullParser(events=("start", "end"))
+        stack = []
+        record = None
+        for pos in range(start, end, XML_CHUNK):
+            parser.feed(data[pos:min(pos + XML_CHUNK, end)])
+            for event, elem in parser.read_events():
+                tag = elem.tag.rsplit("}", 1)[-1]
+                if event == "start":
+                    stack.append(elem)
+                    if tag == recordTag:
+                        record = {}
+                    continue
+                stack.pop()
+                if tag == recordTag:
+                    yield record
+                    record = None
+                    elem.clear()
+                    if stack:
+                        stack[-1].remove(elem)
+                elif record is not None and len(elem) == 0:
+                    text = (elem.text or "").strip()
+                    if tag in listTags:
+                        record.setdefault(tag, []).append(text)
+                    elif text:
+                        record[tag] = text
+        parser.close()
+        start = nextDoc
+
+
+class FactsTimeout(Exception):
+    """Command or subset did not finish within its time budget"""
+
+
+@classwrapper
+class Task(threading.Thread):
+    """
+    Run function in daemon thread and keep its result or exception.
+    With after, function starts only once previous task is finished, so
+    tasks run one by one, in the order they were created. Previous task is
+    waited for only until its own deadline, so a hung task does not use up
+    time of later ones. Daemon thread of timed out task does not block module exit
+    """
+
+    def __init__(self, func, after=None, name=None, deadline=None):
+        super().__init__(daemon=True, name=name)
+        self.func = func
+        self.after = after
+        self.deadline = deadline
+        self.result = None
+        self.error = None
+        self.elapsed = 0.0
+        self.start()
+
+    def run(self):
+        if self.after:
+            self.after.join(self.after.remaining())
+        start = time.perf_counter()
+        try:
+            self.result = profiled(self.func)
+        except Exception as ex:
+            self.error = ex
+        self.elapsed = time.perf_counter() - start
+
+    def remaining(self):
+        """Seconds left until task deadline or None, if task has no deadline"""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def wait(self, timeout=None):
+        """Wait for task to finish. Returns function result or raises its exception"""
+        self.join(timeout)
+        if self.is_alive():
+            raise FactsTimeout(f"{self.name} did not finish within {timeout:.2f} seconds")
+        if self.error:
+            raise self.error
+        return self.result
+
+
 @classwrapper
 class FactsBase:
     """Base class for Facts"""
 
     COMMANDS = []
 
+    # Per interface alternatives of bulk commands, used with interfaces filter
+    PER_INTERFACE = {}
+
+    # Commands, which output can be requested in xml (output_format: xml)
+    XML_COMMANDS = []
+
+    # Above this number of filtered interfaces, one bulk command is cheaper
+    PER_INTERFACE_LIMIT = 8
+
+    # Commands, which parsers accept SpooledOutput (spool_threshold). Only the mac subset
+    # spools, other outputs (e.g. running-config, which is returned as config fact) are kept as str
+    SPOOL_COMMANDS = []
+
+    # Port abbreviations used by table outputs, like show interfaces status or show lldp neighbors
+    PORT_ABBREVIATIONS = ABBREVIATIONS
+
     def __init__(self, module):
         self.module = module
         self.facts = {}
         self.responses = None
+        self.interfaces = [canonicalName(name) for name in module.params.get("interfaces") or []]
+        self.xml = module.params.get("output_format") == "xml"
+        self.spoolThreshold = module.params.get("spool_threshold")
+        self.commandTimeout = module.params.get("command_timeout")
+        # Monotonic time, by which subset must finish (set by main from subset_timeout)
+        self.deadline = None
+        # Wall clock time, when responses were received
+        self.timestamp = None
 
     def populate(self):
-        """Populate responses"""
-        self.responses = run_commands(self.module, self.COMMANDS, check_rc=False)
+        """Fetch and parse facts"""
+        self.fetch()
+        self.parse()
+
+    def fetch(self):
+        """Run commands and keep responses for parse"""
+        commands = [self.expandCommand(cmd) for cmd in self.COMMANDS]
+        responses = iter(self.execute([cmd for cmds in commands for cmd in cmds]))
+        # Join per interface outputs back, so there is one response per command
+        self.responses = ["\n".join(next(responses) for _ in cmds) for cmds in commands]
+        self.timestamp = time.time()
+        # Large outputs go to temp file, so parsers do not keep str copies of them
+        for idx, cmd in enumerate(self.COMMANDS):
+            if cmd in self.SPOOL_COMMANDS:
+                self.responses[idx] = spool(self.responses[idx], self.spoolThreshold)
+
+    def parse(self):
+        """Parse responses to facts. Does not run any commands, so it can overlap next fetch"""
+
+    def textResponse(self, cmd):
+        """Text (not xml or spooled) response of command, if it was fetched, otherwise None"""
+        if self.responses is None or cmd not in self.COMMANDS or (self.xml and cmd in self.XML_COMMANDS):
+            return None
+        response = self.responses[self.COMMANDS.index(cmd)]
+        return response if isinstance(response, str) else None
+
+    def expandCommand(self, cmd):
+        """Get list of device commands to execute for command"""
+        suffix = " | display-xml" if self.xml and cmd in self.XML_COMMANDS else ""
+        if cmd in self.PER_INTERFACE and self.perInterface():
+            return [self.PER_INTERFACE[cmd].format(name=name) + suffix for name in self.interfaces]
+        return [cmd + suffix]
+
+    def perInterface(self):
+        """Check if per interface commands are cheaper than bulk commands"""
+        return 0 < len(self.interfaces) <= self.PER_INTERFACE_LIMIT
+
+    def wanted(self, intfName):
+        """Check if interface is requested by interfaces filter"""
+        return not self.interfaces or intfName in self.interfaces
 
     def run(self, cmd):
         """Run commands"""
-        return run_commands(self.module, cmd, check_rc=False)
+        return self.execute(cmd)
+
+    def remaining(self):
+        """Seconds left until subset deadline or None, if subset has no deadline"""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def execute(self, commands):
+        """
+        Run commands. With command_timeout or subset deadline, every command runs in
+        Task and FactsTimeout is raised, if it does not finish in time
+        """
+        if self.commandTimeout is None and self.deadline is None:
+            return run_commands(self.module, commands, check_rc=False)
+        responses = []
+        for cmd in commands:
+            timeout = min(val for val in (self.commandTimeout, self.remaining()) if val is not None)
+            task = Task(
+                lambda cmd=cmd: run_commands(self.module, [cmd], check_rc=False),
+                name=f"Command '{cmd}'",
+            )
+            responses += task.wait(timeout)
+        return responses
+
+    @staticmethod
+    def expandPortName(portName):
+        """Expand abbreviated port name, e.g. Hu 1/1 to hundredGigE 1/1"""
+        return canonicalName(portName)
 
 
 @classwrapper
@@ -75,9 +296,8 @@ class Routing(FactsBase):
         "show running-config",
     ]
 
-    def populate(self):
-        """Populate facts"""
-        super().populate()
+    def parse(self):
+        """Parse routing facts"""
         data = self.responses[0].split("\n")
         self.facts["ipv6"] = []
         self.getIPv6Routing(data)
@@ -200,17 +420,405 @@ class Routing(FactsBase):
                 )
 
 
+@classwrapper
+class Fib(FactsBase):
+    """Full routing table (FIB) of all VRFs. Routes are kept packed, see RouteTable"""
+
+    COMMANDS = ["show ip vrf"]
+
+    ROUTE_COMMANDS = {4: "show ip route", 6: "show ipv6 route"}
+
+    # Route line, like:  *S   0.0.0.0/0   via 192.168.255.254, Vl 43   1/0   1w2d20h
+    # IPv6 routes have gateway on next line:  C   fc00:1788::/64 [0/0]
+    ROUTE_RE = re.compile(
+        r"^\s*\*?\s*(?P<code>[A-Z][A-Za-z0-9]*(?: [A-Z][A-Z0-9]*)?)\s+(?P<prefix>[0-9a-fA-F:.]+/\d{1,3})(?P<rest>.*)$"
+    )
+    GATEWAY_RE = re.compile(
+        r"(?:via (?P<gateway>[0-9a-fA-F:.]+)|Direct),?\s*(?P<intf>[A-Za-z][A-Za-z\-]* ?[\d/]+)?"
+    )
+
+    def __init__(self, module):
+        super().__init__(module)
+        self.tables = []
+        self.routes = []
+
+    def fetch(self):
+        super().fetch()
+        self.tables = []
+        commands = []
+        for vrf in self.parseVrfs(self.responses[0]):
+            for family, cmd in self.ROUTE_COMMANDS.items():
+                self.tables.append((vrf, family))
+                commands.append(cmd if vrf == "default" else f"{cmd} vrf {vrf}")
+        self.routes = self.run(commands)
+
+    def parse(self):
+        self.facts["fib"] = {}
+        for (vrf, family), output in zip(self.tables, self.routes):
+            table = RouteTable(family)
+            self.parseRoutes(output, table)
+            table.finalize()
+            self.facts["fib"].setdefault(vrf, {})[f"ipv{family}"] = table.serialize()
+
+    @staticmethod
+    def parseVrfs(data):
+        """Parse VRF names from show ip vrf"""
+        vrfs = ["default"]
+        header = False
+        for line in iterLines(data):
+            if line.startswith("VRF-Name"):
+                header = True
+            elif header and line[:1].strip():
+                vrf = line.split()[0]
+                if vrf not in vrfs:
+                    vrfs.append(vrf)
+        return vrfs
+
+    def parseRoutes(self, data, table):
+        """
+        Stream show ip/ipv6 route output into RouteTable. Only first gateway
+        of multipath (ECMP) routes is stored.
+        """
+        pending = None
+        for line in iterLines(data):
+            match = self.ROUTE_RE.match(line)
+            if match:
+                if pending:
+                    table.add(pending[0], pending[1], "", "")
+                pending = (match.group("prefix"), match.group("code"))
+                line = match.group("rest")
+            elif not pending:
+                continue
+            gateway = self.GATEWAY_RE.search(line)
+            if gateway:
+                intf = gateway.group("intf")
+                table.add(
+                    pending[0],
+                    pending[1],
+                    gateway.group("gateway") or "",
+                    self.expandPortName(intf) if intf else "",
+                )
+                pending = None
+        if pending:
+            table.add(pending[0], pending[1], "", "")
+
+
+@classwrapper
+class MacAddressTable(FactsBase):
+    """MAC address table. Entries are kept packed, see MacTable"""
+
+    COMMANDS = ["show mac-address-table"]
+
+    SPOOL_COMMANDS = ["show mac-address-table"]
+
+    # Same rows as parsed by parseMacTable, for spooled (mmap) output
+    MAC_ROW_RE = re.compile(
+        rb"^[ \t]*(\d+)[ \t]+(\S+)[ \t]+(\S+)[ \t]+(\S+(?:[ \t]+\S+)*?)[ \t]+(\S+)[ \t\r]*$", re.M
+    )
+
+    def parse(self):
+        table = MacTable()
+        data = self.responses[0]
+        if isinstance(data, SpooledOutput):
+            with data:
+                self.parseMacTableSpooled(data, table)
+        else:
+            self.parseMacTable(data, table)
+        table.finalize()
+        self.facts["mac_table"] = table.serialize()
+
+    def parseMacTable(self, data, table):
+        """
+        Stream show mac-address-table output into MacTable:
+        VlanId     Mac Address           Type          Interface        State
+         16       00:01:e8:96:1c:19     Dynamic         Te 1/33          Active
+        """
+        for line in iterLines(data):
+            tokens = line.split()
+            if len(tokens) < 5 or not tokens[0].isdigit():
+                continue
+            port = self.expandPortName(" ".join(tokens[3:-1]))
+            if self.wanted(port):
+                table.add(tokens[0], tokens[1], port, tokens[2], tokens[-1])
+
+    def parseMacTableSpooled(self, data, table):
+        """Parse spooled show mac-address-table output with bytes regex over mmap"""
+        for match in data.finditer(self.MAC_ROW_RE):
+            vlan, mac, mactype, port, state = [group.decode() for group in match.groups()]
+            port = self.expandPortName(" ".join(port.split()))
+            if self.wanted(port):
+                table.add(vlan, mac, port, mactype, state)
+
+
+@classwrapper
+class ArpInfo(FactsBase):
+    """ARP and IPv6 neighbor tables, joined with interfaces and vlans"""
+
+    COMMANDS = ["show arp", "show ipv6 neighbors"]
+
+    # Internet    172.20.1.2      12   00:01:e8:96:1c:19   Te 1/33        Vl 16            CP
+    ARP_RE = re.compile(
+        r"^Internet\s+(?P<ip>[0-9.]+)\s+\S+\s+(?P<mac>[0-9a-fA-F:.]+)\s+(?P<port>\S+ \S+)\s+(?P<vlan>Vl \d+|-)"
+    )
+    # 2605:d9c0:2:fff1::10   0.00   ec:0d:9a:92:b2:36   REACH Hu 1/10          Vl 101  CP
+    ND_RE = re.compile(
+        r"^(?P<ip>[0-9a-fA-F:]+:[0-9a-fA-F:]*)\s+\S+\s+(?P<mac>[0-9a-fA-F:.]+)\s+(?P<state>\S+)"
+        r"\s+(?P<port>\S+ \S+)\s+(?P<vlan>Vl \d+|-)"
+    )
+    # IPv6 link-local (fe80::/10) address repeats on every vlan
+    LINK_LOCAL_RE = re.compile(r"^fe[89ab][0-9a-f]:", re.I)
+
+    def parse(self):
+        self.facts["arp"] = {"by_ip": {}, "by_mac": {}, "by_interface": {}}
+        self.parseNeighbors(self.responses[0], self.ARP_RE)
+        self.parseNeighbors(self.responses[1], self.ND_RE)
+
+    def parseNeighbors(self, data, regex):
+        """
+        Parse show arp or show ipv6 neighbors output in one pass and store entries
+        in ip, mac and interface (both vlan and port) indexes. Link-local entries
+        are keyed with zone, like fe80::1%Vlan 16, other entries by ip
+        """
+        for line in iterLines(data):
+            match = regex.match(line)
+            if not match:
+                continue
+            port = self.expandPortName(match.group("port"))
+            vlan = match.group("vlan")
+            entry = {
+                "ip": match.group("ip"),
+                "mac": match.group("mac"),
+                "port": port,
+                "interface": self.expandPortName(vlan) if vlan != "-" else port,
+                "vlan": int(vlan[3:]) if vlan != "-" else None,
+            }
+            if "state" in regex.groupindex:
+                entry["state"] = match.group("state")
+            if not self.wanted(entry["interface"]) and not self.wanted(port):
+                continue
+            key = entry["ip"]
+            if self.LINK_LOCAL_RE.match(key):
+                key = f"{key}%{entry['interface']}"
+            self.facts["arp"]["by_ip"][key] = entry
+            self.facts["arp"]["by_mac"].setdefault(entry["mac"], []).append(key)
+            self.facts["arp"]["by_interface"].setdefault(entry["interface"], []).append(key)
+            if port != entry["interface"]:
+                self.facts["arp"]["by_interface"].setdefault(port, []).append(key)
+
+
+@classwrapper
+class Counters(FactsBase):
+    """Interface counters, with deltas and rates against previous sample"""
+
+    COMMANDS = ["show interfaces"]
+
+    PER_INTERFACE = {"show interfaces": "show interfaces {name}"}
+
+    HEADER_RE = re.compile(r"^(\S.*?) is .*, line protocol is")
+    COUNTER_RE = re.compile(r"(\d+) ([A-Za-z]+)\b")
+
+    def __init__(self, module):
+        super().__init__(module)
+        self.cacheFile = module.params.get("counters_cache")
+        # Default subset, which fetches same show interfaces (set by main)
+        self.default = None
+
+    def fetch(self):
+        """Reuse show interfaces response of default subset. Command runs only, if default has none"""
+        response = self.default.textResponse(self.COMMANDS[0]) if self.default else None
+        if response is None:
+            super().fetch()
+        else:
+            self.responses = [response]
+            self.timestamp = self.default.timestamp
+
+    def parse(self):
+        table = self.parseCounters(self.responses[0], CounterTable(self.timestamp))
+        self.facts["counters"] = table.serialize()
+        if not self.cacheFile:
+            return
+        previous = self.loadCache()
+        if previous is not None:
+            interval, deltas, rates = table.compare(previous)
+            self.facts["counters"]["interval"] = interval
+            self.facts["counters"]["deltas"] = deltas
+            self.facts["counters"]["rates"] = rates
+        with open(self.cacheFile, "w", encoding="utf-8") as fd:
+            json.dump(table.serialize(), fd)
+
+    def parseCounters(self, data, table):
+        """
+        Parse Input/Output Statistics of show interfaces output in one pass:
+         Input Statistics:
+              773350033 packets, 1714550024524 bytes
+              ...
+              0 CRC, 0 overrun, 0 discarded
+         Output Statistics:
+              1042024502 packets, 1318762724029 bytes, 0 underruns
+         Rate info (interval 299 seconds):
+        Every "<number> <word>" pair with word in COUNTER_WORDS is stored in its column
+        """
+        row = None
+        words = None
+        for line in iterLines(data):
+            if not line.startswith(" "):
+                words = None
+                match = self.HEADER_RE.match(line)
+                if match:
+                    name = match.group(1)
+                    row = table.addRow(name) if self.wanted(name) else None
+                elif line.startswith("Input Statistics"):
+                    words = COUNTER_WORDS["in"]
+                elif line.startswith("Output Statistics"):
+                    words = COUNTER_WORDS["out"]
+                continue
+            if words is None or row is None:
+                continue
+            for value, word in self.COUNTER_RE.findall(line):
+                if word in words:
+                    table.columns[words[word]][row] = int(value)
+        return table
+
+    def loadCache(self):
+        """Load previous counters sample"""
+        try:
+            with open(self.cacheFile, "r", encoding="utf-8") as fd:
+                return CounterTable.deserialize(json.load(fd))
+        except (OSError, ValueError, KeyError):
+            return None
+
+
 @classwrapper
 class LLDPInfo(FactsBase):
     """LLDP Information and link mapping"""
 
     COMMANDS = ["show lldp neighbors detail"]
 
-    def populate(self):
-        super().populate()
-        data = self.responses[0]
+    PER_INTERFACE = {
+        "show lldp neighbors detail": "show lldp neighbors interface {name} detail"
+    }
+
+    XML_COMMANDS = ["show lldp neighbors detail"]
+
+    # Field names in show lldp neighbors detail and the facts key they are stored as
+    LLDP_FIELDS = {
+        "Local Port ID": "local_port_id",
+        "Remote System Name": "remote_system_name",
+        "Remote Port ID": "remote_port_id",
+        "Remote Chassis ID": "remote_chassis_id",
+        "Existing System Capabilities": "remote_system_capabilities",
+        "Enabled System Capabilities": "remote_enabled_capabilities",
+        "Remote Management Address (IPv4)": "remote_management_address",
+        "Remote Management Address (IPv6)": "remote_management_address",
+    }
+
+    # Fields, which can be present multiple times and are stored as list
+    LLDP_LIST_FIELDS = ["remote_management_address"]
+
+    XML_FIELDS = [
+        "local-port-id",
+        "remote-system-name",
+        "remote-port-id",
+        "remote-chassis-id",
+        "remote-system-capabilities",
+        "remote-enabled-capabilities",
+        "remote-management-address",
+    ]
+
+    SUMMARY_COMMAND = "show lldp neighbors"
+
+    def __init__(self, module):
+        super().__init__(module)
+        self.cacheFile = module.params.get("lldp_cache")
+        self.summary = {}
+
+    def fetch(self):
         self.facts["lldp"] = {}
-        self.getlldpneighbors(data)
+        if self.cacheFile:
+            self.refresh()
+        else:
+            super().fetch()
+
+    def parse(self):
+        if self.responses:
+            self.parseDetail(self.responses[0])
+        if self.cacheFile:
+            self.saveCache({"summary": self.summary, "lldp": self.facts["lldp"]})
+
+    def parseDetail(self, data):
+        """Parse show lldp neighbors detail output"""
+        if self.xml:
+            self.getlldpneighborsXml(data)
+        else:
+            self.getlldpneighbors(data)
+
+    def refresh(self):
+        """
+        Incremental collection. Fetch cheap show lldp neighbors summary, compare it with
+        cached summary and fetch details only for local ports, whose neighbor changed.
+        Details are parsed and cache is saved in parse
+        """
+        self.summary = summary = self.parseSummary(self.run([self.SUMMARY_COMMAND])[0])
+        cache = self.loadCache()
+        changed = []
+        for port, row in summary.items():
+            if cache["summary"].get(port) == row and port in cache["lldp"]:
+                self.facts["lldp"][port] = cache["lldp"][port]
+            else:
+                changed.append(port)
+        suffix = " | display-xml" if self.xml else ""
+        # Same as for interfaces filter, above the limit one bulk command is cheaper
+        if len(changed) > self.PER_INTERFACE_LIMIT:
+            commands = [self.COMMANDS[0] + suffix]
+        else:
+            template = self.PER_INTERFACE[self.COMMANDS[0]]
+            commands = [template.format(name=port) + suffix for port in changed]
+        if changed:
+            self.responses = ["\n".join(self.run(commands))]
+
+    def parseSummary(self, data):
+        """
+        Parse show lldp neighbors summary to dict of local port and its neighbor rows:
+         Loc PortID          Rem Host Name     Rem Port Id                    Rem Chassis Id
+         --------------------------------------------------------------------------------------
+         Hu 1/1              LRT-SDN-R03-De... hundredGigE 1/32               34:17:eb:4c:1e:80
+        Rows without local port belong to previous port (multiple neighbors)
+        """
+        summary = {}
+        port = None
+        for line in iterLines(data):
+            tokens = line.split()
+            if len(tokens) < 2:
+                continue
+            if tokens[0] in self.PORT_ABBREVIATIONS:
+                port = self.expandPortName(f"{tokens[0]} {tokens[1]}")
+                if self.wanted(port):
+                    summary[port] = " ".join(tokens[2:])
+            elif port in summary:
+                summary[port] += "\n" + " ".join(tokens)
+        return summary
+
+    def loadCache(self):
+        """Load cached lldp summary and neighbors from previous run"""
+        try:
+            with open(self.cacheFile, "r", encoding="utf-8") as fd:
+                cache = json.load(fd)
+        except (OSError, ValueError):
+            cache = {}
+        cache.setdefault("summary", {})
+        cache.setdefault("lldp", {})
+        return cache
+
+    def saveCache(self, cache):
+        """Save lldp summary and neighbors for next run"""
+        with open(self.cacheFile, "w", encoding="utf-8") as fd:
+            json.dump(cache, fd)
+
+    def getlldpneighborsXml(self, data):
+        """Get all lldp neighbors from display-xml output (one lldp-neighbor element per neighbor)"""
+        for record in iterXmlRecords(data, "lldp-neighbor", ("remote-management-address",)):
+            entryOut = {tag.replace("-", "_"): record[tag] for tag in self.XML_FIELDS if tag in record}
+            self.storeNeighbor(entryOut)
 
     def getlldpneighbors(self, data):
         """
@@ -237,23 +845,32 @@ class LLDPInfo(FactsBase):
             Information valid for next 113 seconds
             Time since last information change of this neighbor:  2w2d16h
            ---------------------------------------------------------------------------
+        Output is read line by line once, and the field name (text before first colon)
+        is looked up in LLDP_FIELDS. First value of each field in entry wins.
         """
-        regexs = {
-            "local_port_id": r"Local Port ID:\s*(.+)",
-            "remote_system_name": r"Remote System Name:\s*(.+)",
-            "remote_port_id": r"Remote Port ID:\s*(.+)",
-            "remote_chassis_id": r"Remote Chassis ID:\s*(.+)",
-        }
-        for entry in data.split(
-            "========================================================================"
-        ):
-            entryOut = {}
-            for regName, regex in regexs.items():
-                match = re.search(regex, entry, re.M)
-                if match:
-                    entryOut[regName] = match.group(1)
-            if "local_port_id" in entryOut:
-                self.facts["lldp"][entryOut["local_port_id"]] = entryOut
+        entryOut = {}
+        for line in iterLines(data):
+            if line.startswith("===="):
+                self.storeNeighbor(entryOut)
+                entryOut = {}
+                continue
+            fieldName, _, value = line.partition(":")
+            key = self.LLDP_FIELDS.get(fieldName.strip())
+            if not key:
+                continue
+            value = value.strip()
+            if not value:
+                continue
+            if key in self.LLDP_LIST_FIELDS:
+                entryOut.setdefault(key, []).append(value)
+            else:
+                entryOut.setdefault(key, value)
+        self.storeNeighbor(entryOut)
+
+    def storeNeighbor(self, entryOut):
+        """Store lldp neighbor entry, if it is requested"""
+        if "local_port_id" in entryOut and self.wanted(entryOut["local_port_id"]):
+            self.facts["lldp"][entryOut["local_port_id"]] = entryOut
 
 
 @classwrapper
@@ -262,45 +879,335 @@ class Default(FactsBase):
 
     COMMANDS = ["show interfaces", "show running-config", "show system"]
 
-    def populate(self):
-        super().populate()
+    PER_INTERFACE = {
+        "show interfaces": "show interfaces {name}",
+        "show running-config": "show running-config interface {name}",
+    }
+
+    XML_COMMANDS = ["show interfaces"]
+
+    # Patterns of show interfaces, used by parseInterfacesSpans. Same matches as in parse_*
+    # methods, but duplex and media are anchored, so they do not backtrack from every position.
+    # Fields are single line, so search starts at the line of first occurrence of the literal
+    HEADER_SPAN_RE = re.compile(r"^(.*) is (.*), line protocol is (.*)", re.M)
+    FIELD_SPAN_RE = {
+        "description": ("Description: ", re.compile(r"Description: (.+)$", re.M)),
+        "mtu": ("MTU ", re.compile(r"MTU (\d+)")),
+        "bandwidth": ("LineSpeed ", re.compile(r"LineSpeed (\d+)")),
+        "duplex": (" duplex", re.compile(r"(?<!\w)(\w+) duplex", re.M)),
+        "lineprotocol": ("line protocol is ", re.compile(r"line protocol is (\w+[ ]?\w*)\(?.*\)?$", re.M)),
+        "operstatus": (" is ", re.compile(r"^(?:.+) is (.+),", re.M)),
+        "type": ("Hardware is ", re.compile(r"Hardware is (.+),", re.M)),
+    }
+    MACADDRESS_SPAN_RE = [re.compile(r"address is (\S+),"), re.compile(r"address is (\S+)")]
+    MEDIA_SPAN_RE = re.compile(r"^(.+) media present, (.+)", re.M)
+    MEDIATYPE_SPAN_RE = re.compile(r"type is (.+)$", re.M)
+    MEMBERS_SPAN_RE = re.compile(r"^Members in this channel: +([a-zA-Z0-9 /()]+)$", re.M)
+    MEMBER_SPAN_RE = re.compile(r"([A-Za-z]+) ([0-9/]+)")
+
+    # show interfaces header line, e.g. hundredGigE 1/1 is up, line protocol is up
+    HEADER_RE = re.compile(r"^(.*) is (.*), line protocol is (.*)")
+
+    # Above this number of show interfaces lines, parse_workers process pool is used
+    PARALLEL_THRESHOLD = 10000
+
+    # Fields of show interfaces, in the order they are stored
+    INTERFACE_FIELDS = [
+        "description", "macaddress", "mtu", "bandwidth", "mediatype", "duplex",
+        "lineprotocol", "operstatus", "type", "channel-member",
+    ]
 
+    # display-xml interface tags and the facts key and type they are stored as
+    XML_FIELDS = {
+        "status": ("operstatus", str),
+        "line-protocol": ("lineprotocol", str),
+        "description": ("description", str),
+        "hardware-type": ("type", str),
+        "mac-address": ("macaddress", str),
+        "media-type": ("mediatype", str),
+        "mtu": ("mtu", int),
+        "line-speed": ("bandwidth", int),
+        "duplex": ("duplex", str),
+    }
+
+    # Commands in the order they are executed and parsed. Interface listing
+    # commands must go before running config (which only enriches interfaces)
+    COMMAND_ORDER = [
+        "show interfaces description",
+        "show interfaces status",
+        "show interfaces",
+        "show running-config",
+        "show system",
+    ]
+
+    # Commands listing all interfaces (show interfaces status lists only physical ports)
+    LISTING_COMMANDS = ["show interfaces description", "show interfaces"]
+
+    # Commands able to provide each field, from the cheapest to the most expensive
+    FIELD_SOURCES = {
+        "description": ["show interfaces description", "show interfaces"],
+        "operstatus": ["show interfaces description", "show interfaces"],
+        "lineprotocol": ["show interfaces description", "show interfaces"],
+        "duplex": ["show interfaces status", "show interfaces"],
+        "macaddress": ["show interfaces"],
+        "mtu": ["show interfaces"],
+        "bandwidth": ["show interfaces"],
+        "mediatype": ["show interfaces"],
+        "type": ["show interfaces"],
+        "channel-member": ["show interfaces"],
+        "tagged": ["show running-config"],
+        "untagged": ["show running-config"],
+        "portmode": ["show running-config"],
+        "switchport": ["show running-config"],
+        "spanning-tree": ["show running-config"],
+        "ip_vrf": ["show running-config"],
+        "ipv4": ["show running-config"],
+        "ipv6": ["show running-config"],
+        "config": ["show running-config"],
+        "macs": ["show system"],
+    }
+
+    def __init__(self, module):
+        super().__init__(module)
+        self.fields = set(module.params.get("gather_fields") or self.FIELD_SOURCES)
+        self.parseWorkers = module.params.get("parse_workers") or 0
+        # Process pool of parse_workers, started by main before any thread (see startParsePool)
+        self.pool = None
+        self.COMMANDS = self.selectCommands(self.fields)
+
+    def selectCommands(self, fields):
+        """Select the cheapest list of commands, which provides all requested fields"""
+        selected = set()
+        # Fields with a single source go first, as they force the most expensive commands
+        for field in sorted(fields, key=lambda fld: len(self.FIELD_SOURCES[fld])):
+            sources = self.FIELD_SOURCES[field]
+            if not selected.intersection(sources):
+                selected.add(sources[0])
+        return [cmd for cmd in self.COMMAND_ORDER if cmd in selected]
+
+    def parse(self):
         self.facts.setdefault("info", {"macs": []})
         self.facts.setdefault("interfaces", {})
-        calls = {
-            "description": self.parse_description,
-            "macaddress": self.parse_macaddress,
-            "mtu": self.parse_mtu,
-            "bandwidth": self.parse_bandwidth,
-            "mediatype": self.parse_mediatype,
-            "duplex": self.parse_duplex,
-            "lineprotocol": self.parse_lineprotocol,
-            "operstatus": self.parse_operstatus,
-            "type": self.parse_type,
-            "channel-member": self.parse_members,
+        parsers = {
+            "show interfaces description": self.parseDescriptionTable,
+            "show interfaces status": self.parseStatusTable,
+            "show interfaces": self.parseInterfacesXml if self.xml else self.parseInterfacesText,
+            "show running-config": self.parseConfigOutput,
+            "show system": self.parseSystemOutput,
         }
-        interfaceData = self.parseInterfaces(self.responses[0])
-        for intfName, intfDict in interfaceData.items():
-            for key, call in calls.items():
+        for cmd, output in zip(self.COMMANDS, self.responses):
+            parsers[cmd](output)
+
+    def parseInterfacesOutput(self, data, parallel=False):
+        """
+        Parse show interfaces output per interface block and store requested fields.
+        With parallel, blocks are parsed in process pool (chosen by parseInterfacesText)
+        """
+        if parallel:
+            parsed = self.parseInterfacesParallel(data)
+        else:
+            parsed = self.parseInterfaceShard(data, self.fields, self.interfaces)
+        for intfName, intfOut in parsed:
+            if intfOut:
+                self.facts["interfaces"].setdefault(intfName, {}).update(intfOut)
+            self.storeMacs(self.facts["interfaces"].get(intfName, {}))
+
+    def parseInterfacesParallel(self, data):
+        """
+        Split show interfaces output to shards of whole interface blocks and parse
+        them in process pool. Results are merged in shard order, so facts are same
+        as of serial parsing. If pool can not be used, parsing falls back to serial
+        """
+        lines = data.split("\n")
+        starts = [idx for idx, line in enumerate(lines) if self.HEADER_RE.match(line)]
+        if not starts:
+            return []
+        step = -(-len(starts) // self.parseWorkers)
+        bounds = starts[::step] + [len(lines)]
+        shards = ["\n".join(lines[bounds[idx]:bounds[idx + 1]]) for idx in range(len(bounds) - 1)]
+        try:
+            results = self.pool.map(
+                self.parseInterfaceShard, shards, repeat(self.fields), repeat(self.interfaces)
+            )
+            return [entry for result in results for entry in result]
+        except (OSError, RuntimeError, pickle.PicklingError):
+            display.warning("Parallel parsing of show interfaces failed. Falling back to serial parsing")
+            return self.parseInterfaceShard(data, self.fields, self.interfaces)
+
+    @staticmethod
+    def parseInterfaceShard(data, fields, interfaces=()):
+        """
+        Parse show interfaces output (or its shard of whole interface blocks).
+        Returns list of interface name and its parsed fields. Static, so it can run
+        in process pool workers
+        """
+        parsers = {
+            "description": Default.parse_description,
+            "macaddress": Default.parse_macaddress,
+            "mtu": Default.parse_mtu,
+            "bandwidth": Default.parse_bandwidth,
+            "mediatype": Default.parse_mediatype,
+            "duplex": Default.parse_duplex,
+            "lineprotocol": Default.parse_lineprotocol,
+            "operstatus": Default.parse_operstatus,
+            "type": Default.parse_type,
+            "channel-member": Default.parse_members,
+        }
+        parsers = {key: call for key, call in parsers.items() if key in fields}
+        parsed = []
+        for intfName, intfDict in Default.parseInterfaces(data).items():
+            if interfaces and intfName not in interfaces:
+                continue
+            intfOut = {}
+            for key, call in parsers.items():
                 tmpOut = call(intfDict)
                 if tmpOut:
-                    self.facts["interfaces"].setdefault(intfName, {})
-                    if key in self.facts["interfaces"][intfName] and tmpOut not in self.facts["interfaces"][intfName]:
-                        # No point to repeat and add same entry
-                        # This can mainly happen for ipv4/6 parsing
-                        self.facts["interfaces"][intfName][key] = tmpOut
-                    else:
-                        self.facts["interfaces"][intfName][key] = tmpOut
+                    intfOut[key] = tmpOut
+            parsed.append((intfName, intfOut))
+        return parsed
+
+    def parseInterfacesText(self, data):
+        """Parse show interfaces output. Large outputs are parsed in process pool, if parse_workers is set"""
+        if self.pool is not None and data.count("\n") >= self.PARALLEL_THRESHOLD:
+            self.parseInterfacesOutput(data, parallel=True)
+        else:
+            self.parseInterfacesSpans(data)
+
+    def parseInterfacesSpans(self, data):
+        """
+        Parse show interfaces output and store requested fields.
+        Interface blocks are not copied - every pattern searches the block
+        span (pos, endpos) of the output and only matched values are sliced.
+        Facts are the same as of parseInterfacesOutput.
+        """
+        headers = list(self.HEADER_SPAN_RE.finditer(data))
+        for idx, header in enumerate(headers):
+            start = header.start()
+            end = headers[idx + 1].start() if idx + 1 < len(headers) else len(data)
+            intfName = header.group(1)
+            if not self.wanted(intfName):
+                continue
+            intfOut = {}
+            for key, (literal, pattern) in self.FIELD_SPAN_RE.items():
+                if key not in self.fields:
+                    continue
+                found = data.find(literal, start, end)
+                if found != -1:
+                    match = pattern.search(data, data.rfind("\n", start, found) + 1 or start, end)
+                    if match:
+                        value = match.group(1)
+                        intfOut[key] = int(value) if key in ("mtu", "bandwidth") else value
+            if "macaddress" in self.fields:
+                for pattern in self.MACADDRESS_SPAN_RE:
+                    match = pattern.search(data, start, end)
+                    if match and match.group(1) != "not":
+                        intfOut["macaddress"] = match.group(1)
+                        break
+            if "mediatype" in self.fields:
+                media = self.MEDIA_SPAN_RE.search(data, start, end)
+                match = self.MEDIATYPE_SPAN_RE.search(data, media.start(), media.end()) if media else None
+                if match:
+                    intfOut["mediatype"] = match.group(1)
+            if "channel-member" in self.fields:
+                match = self.MEMBERS_SPAN_RE.search(data, start, end)
+                members = []
+                if match:
+                    for prefix, number in self.MEMBER_SPAN_RE.findall(match.group(1)):
+                        if prefix in ABBREVIATIONS:
+                            members.append(canonicalName(f"{prefix} {number}"))
+                if members:
+                    intfOut["channel-member"] = members
+            if intfOut:
+                # Same key order as parseInterfacesOutput
+                intf = self.facts["interfaces"].setdefault(intfName, {})
+                for key in self.INTERFACE_FIELDS:
+                    if key in intfOut:
+                        intf[key] = intfOut[key]
             self.storeMacs(self.facts["interfaces"].get(intfName, {}))
-        # Use running config to identify all tagged, untagged vlans and mapping
-        self.parseRunningConfig(self.responses[1])
-        # Also write running config to output
-        self.facts["config"] = self.responses[1]
 
-        systemMac = self.parse_stack_mac(self.responses[2])
+    def parseInterfacesXml(self, data):
+        """Parse show interfaces | display-xml output and store requested fields"""
+        for record in iterXmlRecords(data, "interface", ("member",)):
+            intfName = record.get("name")
+            if not intfName or not self.wanted(intfName):
+                continue
+            intfOut = {}
+            for tag, (key, conv) in self.XML_FIELDS.items():
+                if tag in record:
+                    intfOut[key] = conv(record[tag])
+            members = [self.expandPortName(member.split("(")[0]) for member in record.get("member", [])]
+            if members:
+                intfOut["channel-member"] = members
+            self.storeFields(intfName, intfOut)
+            self.storeMacs(self.facts["interfaces"][intfName])
+
+    def parseConfigOutput(self, data):
+        """Parse show running-config output"""
+        # Without a full interface listing, interfaces come also from running config
+        listed = any(cmd in self.COMMANDS for cmd in self.LISTING_COMMANDS)
+        # Use running config to identify all tagged, untagged vlans and mapping
+        self.parseRunningConfig(data, addMissing=not listed)
+        # Also write running config to output. Per interface fragments are not the
+        # running config, so config is left out when interfaces filter uses them
+        if "config" in self.fields and not self.perInterface():
+            self.facts["config"] = data
+
+    def parseSystemOutput(self, data):
+        """Parse show system output"""
+        systemMac = self.parse_stack_mac(data)
         if systemMac:
             self.facts["info"]["macs"].append(systemMac)
 
+    def parseDescriptionTable(self, data):
+        """Parse show interfaces description output (status, protocol, description)"""
+        for row in self.parseTable(data, "Interface"):
+            intfOut = {}
+            if row.get("Status"):
+                # Administratively shut ports are reported as down in show interfaces
+                intfOut["operstatus"] = "down" if row["Status"] == "admin down" else row["Status"]
+            if row.get("Protocol"):
+                intfOut["lineprotocol"] = row["Protocol"]
+            if row.get("Description"):
+                intfOut["description"] = row["Description"]
+            self.storeFields(row["Interface"], intfOut)
+
+    def parseStatusTable(self, data):
+        """Parse show interfaces status output (duplex). Lists only physical ports"""
+        for row in self.parseTable(data, "Port"):
+            intfOut = {}
+            if row.get("Duplex") and row["Duplex"] != "Auto":
+                intfOut["duplex"] = row["Duplex"].lower()
+            self.storeFields(self.expandPortName(row["Port"]), intfOut)
+
+    def storeFields(self, intfName, intfOut):
+        """Store requested fields of interface"""
+        if not self.wanted(intfName):
+            return
+        intf = self.facts["interfaces"].setdefault(intfName, {})
+        for key, val in intfOut.items():
+            if key in self.fields:
+                intf[key] = val
+
+    @staticmethod
+    def parseTable(data, firstColumn):
+        """Parse fixed width table. Column offsets are taken from the header line"""
+        rows = []
+        columns = []
+        for line in data.split("\n"):
+            if not columns:
+                if line.startswith(firstColumn):
+                    columns = [(match.group(0), match.start()) for match in re.finditer(r"\S+", line)]
+                continue
+            if not line.strip():
+                continue
+            row = {}
+            for idx, (colName, colStart) in enumerate(columns):
+                colEnd = columns[idx + 1][1] if idx + 1 < len(columns) else None
+                row[colName] = line[colStart:colEnd].strip()
+            if row[firstColumn]:
+                rows.append(row)
+        return rows
+
     @staticmethod
     def parse_stack_mac(data):
         """Parse Stack MAC Address"""
@@ -309,7 +1216,7 @@ class Default(FactsBase):
             return match.group(1)
         return None
 
-    def parseRunningConfig(self, data):
+    def parseRunningConfig(self, data, addMissing=False):
         """General Parser to parse ansible config"""
         calls = {
             "tagged": self.parse_tagged,
@@ -321,6 +1228,7 @@ class Default(FactsBase):
             "ipv4": self.parse_ipv4,
             "ipv6": self.parse_ipv6,
         }
+        calls = {key: call for key, call in calls.items() if key in self.fields}
         interfaceSt = False
         intfKey = None
         for line in data.split("\n"):
@@ -330,6 +1238,8 @@ class Default(FactsBase):
             elif line.startswith("interface"):
                 interfaceSt = True
                 intfKey = line[10:]
+                if addMissing and self.wanted(intfKey):
+                    self.facts["interfaces"].setdefault(intfKey, {})
             elif interfaceSt and intfKey in self.facts["interfaces"]:
                 for key, call in calls.items():
                     tmpOut = call(line)
@@ -358,7 +1268,7 @@ class Default(FactsBase):
         for line in data.split("\n"):
             if len(line) == 0:
                 continue
-            match = re.match(r"^(.*) is (.*), line protocol is (.*)", line)
+            match = Default.HEADER_RE.match(line)
             if match:
                 key = match.group(1)
                 parsed[key] = line
@@ -522,48 +1432,138 @@ class Default(FactsBase):
     @staticmethod
     def parse_members(data):
         """Parse Member of PortChannel"""
-        keys = {"Hu": "hundredGigE", "Fo": "fortyGigE", "Te": "TenGigabitEthernet"}
         match = re.search(r"^Members in this channel: +([a-zA-Z0-9 /()]+)$", data, re.M)
         out = []
         if match:
-            allintf = (
-                match.group(1)
-                .replace("Hu ", "Hu_")
-                .replace("Fo ", "Fo_")
-                .replace("Te ", "Te_")
-                .split()
-            )
-            for intf in allintf:
-                splintf = intf.split("(")[0].split("_")
-                if splintf[0] in keys:
-                    out.append(f"{keys[splintf[0]]} {splintf[1]}")
+            for prefix, number in re.findall(r"([A-Za-z]+) ([0-9/]+)", match.group(1)):
+                if prefix in ABBREVIATIONS:
+                    out.append(canonicalName(f"{prefix} {number}"))
         return out
 
 
-FACT_SUBSETS = {"default": Default, "lldp": LLDPInfo, "routing": Routing}
+@functionwrapper
+def joinFacts(facts):
+    """
+    Attach related facts to interfaces, so consumers do not need to join them:
+      lldp - lldp neighbor of the port
+      channel - port-channel the port is member of
+    Names of every spelling are resolved with precomputed InterfaceIndex
+    """
+    interfaces = facts.get("interfaces")
+    if not interfaces:
+        return
+    index = InterfaceIndex(interfaces)
+    for port, neighbor in facts.get("lldp", {}).items():
+        intfName = index.get(port)
+        if intfName:
+            interfaces[intfName]["lldp"] = neighbor
+    for channel, intf in list(interfaces.items()):
+        for member in intf.get("channel-member", []):
+            intfName = index.get(member)
+            if intfName:
+                interfaces[intfName]["channel"] = channel
+
+
+FACT_SUBSETS = {
+    "default": Default,
+    "lldp": LLDPInfo,
+    "routing": Routing,
+    "fib": Fib,
+    "mac": MacAddressTable,
+    "arp": ArpInfo,
+    "counters": Counters,
+}
 
 VALID_SUBSETS = frozenset(FACT_SUBSETS.keys())
 
+# Subsets collected when gather_subset is not set, and with gather_subset: all
+DEFAULT_SUBSETS = frozenset(["default", "lldp", "routing"])
+
+# Large table subsets. They run only on request, by name or with gather_subset: extended
+# (all and extended together collect every subset)
+EXTENDED_SUBSETS = VALID_SUBSETS - DEFAULT_SUBSETS
+
+VALID_FIELDS = frozenset(Default.FIELD_SOURCES.keys())
+
+
+@functionwrapper
+def startParsePool(workers):
+    """
+    Process pool for parse_workers or None. Pool is used from parse thread, but
+    it must be started here, before fetch and parse threads exist: forking a
+    multi-threaded process can deadlock on locks held by other threads (and is
+    deprecated since Python 3.12). fork start method launches all workers on the
+    first submit, so they are forked now, from the single threaded process
+    """
+    if workers <= 1:
+        return None
+    try:
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("fork"))
+        pool.submit(int).result()
+    except (OSError, RuntimeError, ValueError):
+        display.warning("Process pool of parse_workers could not be started. Parsing serially")
+        return None
+    return pool
+
+
+@functionwrapper
+def markFailed(status, subset, ex):
+    """Mark subset as failed (and timed out) in status facts"""
+    if isinstance(ex, FactsTimeout):
+        status["timed_out"].append(subset)
+    else:
+        display.warning("".join(traceback.format_exception(type(ex), ex, ex.__traceback__)))
+    status["failed_subsets"][subset] = str(ex)
+
 
 @functionwrapper
 def main():
     """main entry point for module execution"""
-    argument_spec = {"gather_subset": {"default": [], "type": "list"}}
+    argument_spec = {
+        # Subsets: default, lldp and routing (selected by all, and when not set), fib, mac,
+        # arp and counters (selected by extended). !<subset> excludes subset
+        "gather_subset": {"default": [], "type": "list"},
+        "gather_fields": {"default": [], "type": "list"},
+        "interfaces": {"default": [], "type": "list"},
+        "output_format": {"default": "text", "choices": ["text", "xml"]},
+        "lldp_cache": {"type": "path"},
+        "counters_cache": {"type": "path"},
+        # Bytes, above which show mac-address-table output is spooled to temp file
+        "spool_threshold": {"type": "int"},
+        "parse_workers": {"default": 0, "type": "int"},
+        "subset_timeout": {"type": "float"},
+        "command_timeout": {"type": "float"},
+        "collect_metrics": {"default": False, "type": "bool"},
+        "profile": {"default": [], "type": "list", "elements": "str", "choices": ["cpu", "memory"]},
+        "profile_dir": {"type": "path"},
+        "profile_name": {"type": "str"},
+    }
     argument_spec.update(dellos9_argument_spec)
     module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
+    if module.params["collect_metrics"]:
+        enable()
+    profiler = startProfiling(
+        module.params["profile"], module.params["profile_dir"], module.params["profile_name"] or "dellos9_facts"
+    )
     gather_subset = module.params["gather_subset"]
     runable_subsets = set()
     exclude_subsets = set()
 
     for subset in gather_subset:
         if subset == "all":
-            runable_subsets.update(VALID_SUBSETS)
+            runable_subsets.update(DEFAULT_SUBSETS)
+            continue
+        if subset == "extended":
+            runable_subsets.update(EXTENDED_SUBSETS)
             continue
         if subset.startswith("!"):
             subset = subset[1:]
             if subset == "all":
                 exclude_subsets.update(VALID_SUBSETS)
                 continue
+            if subset == "extended":
+                exclude_subsets.update(EXTENDED_SUBSETS)
+                continue
             exclude = True
         else:
             exclude = False
@@ -576,38 +1576,83 @@ def main():
         else:
             runable_subsets.add(subset)
     if not runable_subsets:
-        runable_subsets.update(VALID_SUBSETS)
+        runable_subsets.update(DEFAULT_SUBSETS)
+
+    for field in module.params["gather_fields"]:
+        if field not in VALID_FIELDS:
+            module.fail_json(
+                msg=f"Bad field. {field} not available in {VALID_FIELDS}"
+            )
 
     runable_subsets.difference_update(exclude_subsets)
     runable_subsets.add("default")
 
     facts = {"gather_subset": [runable_subsets]}
 
+    # Default goes first, so other subsets can reuse its responses
     instances = []
-    for key in runable_subsets:
-        instances.append(FACT_SUBSETS[key](module))
-
-    for inst in instances:
-        if inst:
+    for key in sorted(runable_subsets, key=lambda key: key != "default"):
+        instances.append((key, FACT_SUBSETS[key](module)))
+    pool = startParsePool(module.params["parse_workers"])
+    for _key, inst in instances:
+        if isinstance(inst, Counters):
+            inst.default = instances[0][1]
+        elif isinstance(inst, Default):
+            inst.pool = pool
+
+    # Failed or timed out subsets do not fail the module. Facts of completed subsets are returned
+    status = {"timings": {}, "timed_out": [], "failed_subsets": {}}
+    subsetTimeout = module.params["subset_timeout"]
+    # Fetch of next subset overlaps parse of previous one (parse runs in worker thread)
+    parsers = []
+    for key, inst in instances:
+        start = time.monotonic()
+        if subsetTimeout:
+            inst.deadline = start + subsetTimeout
+        try:
+            with phase("fetch"):
+                inst.fetch()
+        except Exception as ex:
+            markFailed(status, key, ex)
+            continue
+        finally:
+            status["timings"][key] = {"fetch": round(time.monotonic() - start, 4)}
+        task = Task(inst.parse, after=parsers[-1][2] if parsers else None, name=f"Subset {key}", deadline=inst.deadline)
+        parsers.append((key, inst, task))
+    with phase("parse"):
+        for key, inst, task in parsers:
             try:
-                inst.populate()
+                task.wait(inst.remaining())
                 facts.update(inst.facts)
             except Exception as ex:
-                display.warning(traceback.format_exc())
-                raise Exception(traceback.format_exc()) from ex
-
-    ansible_facts = {}
-    for key, value in iteritems(facts):
-        ansible_facts[f"ansible_net_{key}"] = value
-
-    warnings = []
-    check_args(module, warnings)
-    if len(str(ansible_facts)) > 100000:
-        facts_path = dumpFactsToTmp(ansible_facts)
-        display.vvv(facts_path)
-        module.exit_json(ansible_facts_file={"file": facts_path}, warnings=warnings)
-    else:
-        module.exit_json(ansible_facts=ansible_facts, warnings=warnings)
+                markFailed(status, key, ex)
+            status["timings"][key]["parse"] = round(task.elapsed, 4)
+    if pool is not None:
+        # Timed out parse can still use the pool, do not wait for it
+        pool.shutdown(wait=False, cancel_futures=True)
+    facts.update(status)
+    with phase("join"):
+        joinFacts(facts)
+
+    with phase("serialize"):
+        ansible_facts = {}
+        for key, value in iteritems(facts):
+            ansible_facts[f"ansible_net_{key}"] = value
+
+        warnings = []
+        check_args(module, warnings)
+        result = {"warnings": warnings}
+        if len(str(ansible_facts)) > 100000:
+            facts_path = dumpFactsToTmp(ansible_facts)
+            display.vvv(facts_path)
+            result["ansible_facts_file"] = {"file": facts_path}
+        else:
+            result["ansible_facts"] = ansible_facts
+    if module.params["collect_metrics"]:
+        result["metrics"] = metrics()
+    if profiler:
+        result["profile_files"] = profiler.stop()
+    module.exit_json(**result)
 
 
 if __name__ == "__main__":
@@ -11,13 +11,34 @@ Email                   : juztas (at) gmail.com
 Date                    : 2023/11/05
 """
 import json
-import re
 
 from ansible.errors import AnsibleConnectionFailure
 from ansible.module_utils._text import to_bytes, to_text
 from ansible.plugins.terminal import TerminalBase
+from ansible_collections.sense.dellos9.plugins.module_utils.network.climatch import (
+    ErrorMatcher, PromptMatcher)
 from ansible_collections.sense.dellos9.plugins.module_utils.runwrapper import classwrapper
 
+PROMPT_PATTERNS = [
+    rb"[\r\n]?[\w+\-\.:\/\[\]]+(?:\([^\)]+\)){,3}(?:>|#) ?$",
+    rb"\[\w+\@[\w\-\.]+(?: [^\]])\] ?[>#\$] ?$",
+]
+
+# % Error: lines are errors, unless the rest of the line has one of these phrases
+GUARDED_ERROR = (
+    rb"% ?Error: ",
+    rb"\b(?:does not exist|already exists|Host not found|not active)\b",
+)
+
+ERROR_PATTERNS = [
+    rb"% ?Bad secret",
+    rb"(?i:invalid input)",
+    rb"(?i:(?:incomplete|ambiguous) command)",
+    rb"(?i:connection timed out)",
+    rb"'[^']' +returned error code: ?\d+",
+]
+
+
 @classwrapper
 class TerminalModule(TerminalBase):
     """
@@ -25,26 +46,26 @@ class TerminalModule(TerminalBase):
     on devices via ansible.
     """
 
-    terminal_stdout_re = [
-        re.compile(rb"[\r\n]?[\w+\-\.:\/\[\]]+(?:\([^\)]+\)){,3}(?:>|#) ?$"),
-        re.compile(rb"\[\w+\@[\w\-\.]+(?: [^\]])\] ?[>#\$] ?$"),
-    ]
-
-    terminal_stderr_re = [
-        re.compile(
-            rb"% ?Error: (?:(?!\bdoes not exist\b)(?!\balready exists\b)(?!\bHost not found\b)(?!\bnot active\b).)*\n"
-        ),
-        re.compile(rb"% ?Bad secret"),
-        re.compile(rb"invalid input", re.I),
-        re.compile(rb"(?:incomplete|ambiguous) command", re.I),
-        re.compile(rb"connection timed out", re.I),
-        re.compile(rb"'[^']' +returned error code: ?\d+"),
-    ]
-
     terminal_initial_prompt = rb"\[y/n\]:"
 
     terminal_initial_answer = b"y"
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._promptMatcher = PromptMatcher(PROMPT_PATTERNS)
+        self._errorMatcher = ErrorMatcher(ERROR_PATTERNS, GUARDED_ERROR)
+
+    @property
+    def terminal_stdout_re(self):
+        """Prompt matcher (tail of response only)"""
+        return [self._promptMatcher]
+
+    @property
+    def terminal_stderr_re(self):
+        """Error matcher. network_cli reads it at the start of every receive, so it starts over"""
+        self._errorMatcher.reset()
+        return [self._errorMatcher]
+
     def _exec_cli_command(self, cmd, check_rc=True):
         """
         Executes the CLI command on the remote device and returns the output
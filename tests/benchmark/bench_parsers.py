@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Dell OS 9 facts parsers micro-benchmark
+Copyright: Contributors to the SENSE Project
+GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+Title                   : sdn-sense/dellos9
+Author                  : Justas Balcas
+Email                   : juztas (at) gmail.com
+@Copyright              : General Public License v3.0+
+Date                    : 2026/10/19
+
+Times every parser of dellos9_facts over unit test fixtures scaled to several
+sizes and reports throughput (input lines/sec) and peak memory (tracemalloc).
+Scaled fixtures repeat the output, renumbering interfaces in every copy, so
+parsed facts grow with the input. With --synthetic, outputs of size N come
+from os9gen device with N times SYNTHETIC_SCALE ports, VLANs and routes.
+
+    python tests/benchmark/bench_parsers.py --sizes 1,10,50 --repeat 3
+    python tests/benchmark/bench_parsers.py --only interfaces --json bench.json
+    python tests/benchmark/bench_parsers.py --synthetic --sizes 1,10,50
+"""
+__metaclass__ = type
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+import tracemalloc
+
+from ansible_collections.sense.dellos9.plugins.module_utils.network.dellos9 import \
+    PortMapping
+from ansible_collections.sense.dellos9.plugins.module_utils.network.ifnames import \
+    ABBREVIATIONS
+from ansible_collections.sense.dellos9.plugins.modules.dellos9_facts import (
+    Default, LLDPInfo, Routing)
+from ansible_collections.sense.dellos9.tests.unit.modules.dellos9_module import \
+    ParamsModule
+from ansible_collections.sense.dellos9.tests.unit.modules.os9gen import (
+    MAX_VLAN, Os9Generator)
+
+FIXTURE_PATH = os.path.join(os.path.dirname(__file__), "..", "unit", "modules", "fixtures")
+
+# Interface number in copy N of scaled output is offset by N * offset: ports
+# (unit/port) get a new unit, logical interfaces (Vlan 101) a new number
+PORT_OFFSET = 1000
+LOGICAL_OFFSET = 10000
+# Ports, VLANs and routes of synthetic device of size 1
+SYNTHETIC_SCALE = {"ports": 32, "vlans": 60, "routes": 20}
+
+_PREFIXES = sorted(list(ABBREVIATIONS) + list(ABBREVIATIONS.values()), key=len, reverse=True)
+_INTERFACE_RE = re.compile(r"(?<![\w/-])(%s)( ?)(\d+)(/?)" % "|".join(map(re.escape, _PREFIXES)))
+
+# Fields of show interfaces and running-config lines, which parse_* functions extract
+INTERFACE_PARSERS = [
+    "description", "macaddress", "mtu", "bandwidth", "mediatype", "duplex",
+    "lineprotocol", "operstatus", "type", "members",
+]
+CONFIG_PARSERS = [
+    "tagged", "untagged", "portmode", "switchport", "spanning_tree", "ip_vrf", "ipv4", "ipv6",
+]
+
+
+def loadFixture(name):
+    """Load unit test fixture"""
+    with open(os.path.join(FIXTURE_PATH, name), encoding="utf-8") as fd:
+        return fd.read()
+
+
+def scaleOutput(data, factor):
+    """Repeat output factor times, renumbering interfaces of every copy"""
+    copies = [data]
+    for copy in range(1, factor):
+        def renumber(match, copy=copy):
+            offset = PORT_OFFSET if match.group(4) else LOGICAL_OFFSET
+            return f"{match.group(1)}{match.group(2)}{int(match.group(3)) + copy * offset}{match.group(4)}"
+        copies.append(_INTERFACE_RE.sub(renumber, data))
+    return "\n".join(copies)
+
+
+def syntheticOutputs(size, seed=0):
+    """Outputs of os9gen device of given size, keyed by fixture name"""
+    params = {key: value * size for key, value in SYNTHETIC_SCALE.items()}
+    params["vlans"] = min(params["vlans"], MAX_VLAN - 1)
+    return Os9Generator(seed=seed, **params).outputs()
+
+
+def interfaceBlocks(data):
+    """show interfaces output split to per interface blocks"""
+    return list(Default.parseInterfaces(data).values())
+
+
+def configLines(data):
+    """Stripped running-config lines, as parseRunningConfig passes them to parse_*"""
+    return [line.strip() for line in data.split("\n")]
+
+
+def memberLines(data):
+    """Running-config port lists (tagged, untagged and channel-member)"""
+    return [line for line in configLines(data) if line.startswith(("tagged ", "untagged ", "channel-member "))]
+
+
+def benchParseCall(call):
+    """Run parse_* function over every item of input"""
+    def run(items):
+        for item in items:
+            call(item)
+    return run
+
+
+def benchInterfaces(data):
+    """Default show interfaces parsing (all fields)"""
+    parser = Default(ParamsModule())
+    parser.facts["interfaces"] = {}
+    parser.parseInterfacesText(data)
+
+
+def benchInterfaceBlocks(data):
+    """Default show interfaces parsing per interface block with parse_* methods (process pool shards)"""
+    parser = Default(ParamsModule())
+    parser.facts["interfaces"] = {}
+    parser.parseInterfacesOutput(data)
+
+
+def benchRunningConfig(data):
+    """Default running-config parsing, adding all interfaces found"""
+    parser = Default(ParamsModule())
+    parser.facts["interfaces"] = {}
+    parser.parseRunningConfig(data, addMissing=True)
+
+
+def benchRouting(data):
+    """Routing subset parse of running-config"""
+    parser = Routing(ParamsModule())
+    parser.responses = [data]
+    parser.parse()
+
+
+def benchLldp(data):
+    """LLDP neighbors detail parsing"""
+    parser = LLDPInfo(ParamsModule())
+    parser.facts["lldp"] = {}
+    parser.getlldpneighbors(data)
+
+
+def benchParseMembers(lines):
+    """PortMapping expansion of port lists"""
+    mapper = PortMapping()
+    for line in lines:
+        mapper.parseMembers(line)
+
+
+def buildBenchmarks():
+    """
+    Benchmarks as name: (fixture, input preparation, benchmark function).
+    Preparation runs outside of timing, e.g. to split output to blocks
+    """
+    benchmarks = {
+        "interfaces.parseInterfaces": ("show_interfaces", None, Default.parseInterfaces),
+        "interfaces.text": ("show_interfaces", None, benchInterfaces),
+        "interfaces.blocks": ("show_interfaces", None, benchInterfaceBlocks),
+    }
+    for field in INTERFACE_PARSERS:
+        benchmarks[f"interfaces.parse_{field}"] = (
+            "show_interfaces", interfaceBlocks, benchParseCall(getattr(Default, f"parse_{field}")))
+    for field in CONFIG_PARSERS:
+        benchmarks[f"config.parse_{field}"] = (
+            "show_running-config", configLines, benchParseCall(getattr(Default, f"parse_{field}")))
+    benchmarks.update({
+        "config.parseRunningConfig": ("show_running-config", None, benchRunningConfig),
+        "routing.Routing": ("show_running-config", None, benchRouting),
+        "lldp.getlldpneighbors": ("show_lldp_neighbors_detail", None, benchLldp),
+        "portmapping.parseMembers": ("show_running-config", memberLines, benchParseMembers),
+    })
+    return benchmarks
+
+
+def countLines(data):
+    """Number of input lines (of output or of all items of prepared input)"""
+    if isinstance(data, bytes):
+        return data.count(b"\n") + 1
+    if isinstance(data, str):
+        return data.count("\n") + 1
+    return sum(countLines(item) for item in data)
+
+
+def measure(func, data, repeat):
+    """Best wall time of repeat runs and peak traced memory of one run"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(data)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    tracemalloc.start()
+    try:
+        func(data)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+
+def runBenchmarks(sizes, repeat=3, only=None, synthetic=False):
+    """
+    Run benchmarks (names containing only, if set) at all sizes and return results.
+    Inputs are scaled fixtures or, if synthetic, os9gen outputs
+    """
+    results = []
+    fixtures = {}
+    for name, (fixture, prepare, func) in buildBenchmarks().items():
+        if only and only not in name:
+            continue
+        for size in sizes:
+            key = (fixture, size)
+            if key not in fixtures:
+                if synthetic:
+                    fixtures[key] = syntheticOutputs(size)[fixture]
+                else:
+                    fixtures[key] = scaleOutput(loadFixture(fixture), size)
+            data = prepare(fixtures[key]) if prepare else fixtures[key]
+            lines = countLines(data)
+            seconds, peak = measure(func, data, repeat)
+            results.append({
+                "benchmark": name,
+                "size": size,
+                "lines": lines,
+                "seconds": round(seconds, 6),
+                "lines_per_sec": round(lines / seconds) if seconds else None,
+                "peak_kib": round(peak / 1024, 1),
+            })
+    return results
+
+
+def printResults(results, out=sys.stdout):
+    """Print results table"""
+    out.write(f"{'benchmark':<32} {'size':>5} {'lines':>9} {'seconds':>10} {'lines/sec':>12} {'peak KiB':>10}\n")
+    for res in results:
+        out.write(
+            f"{res['benchmark']:<32} {res['size']:>5} {res['lines']:>9} {res['seconds']:>10.4f} "
+            f"{res['lines_per_sec'] or 0:>12} {res['peak_kib']:>10}\n"
+        )
+
+
+def main(argv=None):
+    """Parse arguments and run benchmarks"""
+    parser = argparse.ArgumentParser(description="Dell OS 9 facts parsers micro-benchmark")
+    parser.add_argument("--sizes", default="1,10,50", help="Comma separated fixture scale factors")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per benchmark, best time is reported")
+    parser.add_argument("--only", help="Run only benchmarks, which name contains this string")
+    parser.add_argument("--synthetic", action="store_true", help="Use os9gen outputs instead of scaled fixtures")
+    parser.add_argument("--json", help="Write results to this JSON file")
+    args = parser.parse_args(argv)
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+    results = runBenchmarks(sizes, args.repeat, args.only, args.synthetic)
+    printResults(results)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as fd:
+            json.dump(results, fd, indent=2)
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Terminal plugin prompt and error detection benchmark
+Copyright: Contributors to the SENSE Project
+GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+Title                   : sdn-sense/dellos9
+Author                  : Justas Balcas
+Email                   : juztas (at) gmail.com
+@Copyright              : General Public License v3.0+
+Date                    : 2026/10/19
+
+Replays multi-MB responses (os9gen running-config and show interfaces) the
+way network_cli (libssh) receives them: response grows by chunk and after
+every chunk all terminal_stderr_re and terminal_stdout_re are searched in the
+whole response. Compares the previous regex lists (LEGACY_*) with the
+combined, incremental matchers of the terminal plugin.
+
+    python tests/benchmark/bench_terminal.py --sizes 1,4 --chunk 16384
+"""
+__metaclass__ = type
+
+import argparse
+import sys
+import time
+
+from ansible_collections.sense.dellos9.plugins.terminal.dellos9 import \
+    TerminalModule
+from ansible_collections.sense.dellos9.tests.unit.modules.os9gen import \
+    Os9Generator
+from ansible_collections.sense.dellos9.tests.unit.plugins.module_utils.legacy_matchers import (
+    LEGACY_STDERR_RE, LEGACY_STDOUT_RE)
+
+PROMPT = b"\r\nFAKE-Z9100#"
+
+
+def responses(megabytes):
+    """Responses of about given size: running-config and show interfaces, ending with prompt"""
+    out = {}
+    for name, ports in (("show running-config", 1400), ("show interfaces", 180)):
+        factor = max(1, int(megabytes))
+        generator = Os9Generator(ports=ports * factor, vlans=min(4000, 1000 * factor), routes=500 * factor)
+        text = generator.showRunningConfig() if name == "show running-config" else generator.showInterfaces()
+        out[name] = text.replace("\n", "\r\n").encode() + PROMPT
+    return out
+
+
+def receive(data, chunk, stderrRe, stdoutRe):
+    """Replay network_cli receive loop, return (error found, prompt found, seconds)"""
+    resp = b""
+    error = prompt = False
+    start = time.perf_counter()
+    for idx in range(0, len(data), chunk):
+        resp += data[idx:idx + chunk]
+        if any(regex.search(resp) for regex in stderrRe):
+            error = True
+        if any(regex.search(resp) for regex in stdoutRe):
+            prompt = True
+    return error, prompt, time.perf_counter() - start
+
+
+def runBenchmarks(sizes, chunk):
+    """Run legacy and combined matchers over responses of all sizes"""
+    results = []
+    terminal = TerminalModule(None)
+    for size in sizes:
+        for name, data in responses(size).items():
+            legacy = receive(data, chunk, LEGACY_STDERR_RE, LEGACY_STDOUT_RE)
+            combined = receive(data, chunk, terminal.terminal_stderr_re, terminal.terminal_stdout_re)
+            if legacy[:2] != combined[:2]:
+                raise AssertionError(f"{name}: legacy {legacy[:2]} and combined {combined[:2]} results differ")
+            results.append({
+                "response": name,
+                "bytes": len(data),
+                "chunks": -(-len(data) // chunk),
+                "legacy_seconds": round(legacy[2], 4),
+                "combined_seconds": round(combined[2], 4),
+                "speedup": round(legacy[2] / combined[2], 1) if combined[2] else None,
+            })
+    return results
+
+
+def main(argv=None):
+    """Parse arguments and run benchmarks"""
+    parser = argparse.ArgumentParser(description="Terminal plugin prompt and error detection benchmark")
+    parser.add_argument("--sizes", default="1,4", help="Comma separated response scale (about MB of running-config)")
+    parser.add_argument("--chunk", type=int, default=16384, help="Bytes received per read")
+    args = parser.parse_args(argv)
+    results = runBenchmarks([int(size) for size in args.sizes.split(",") if size], args.chunk)
+    sys.stdout.write(f"{'response':<22} {'bytes':>10} {'chunks':>7} {'legacy s':>10} {'combined s':>11} {'speedup':>8}\n")
+    for res in results:
+        sys.stdout.write(
+            f"{res['response']:<22} {res['bytes']:>10} {res['chunks']:>7} {res['legacy_seconds']:>10.4f} "
+            f"{res['combined_seconds']:>11.4f} {res['speedup']:>8}\n"
+        )
+    return results
+
+
+if __name__ == "__main__":
+    main()
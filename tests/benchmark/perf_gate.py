@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Performance regression gate of parsers and module paths
+Copyright: Contributors to the SENSE Project
+GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+Title                   : sdn-sense/dellos9
+Author                  : Justas Balcas
+Email                   : juztas (at) gmail.com
+@Copyright              : General Public License v3.0+
+Date                    : 2026/10/19
+
+Collects, for a fixed input set:
+  parsers - time and peak memory of every bench_parsers benchmark over os9gen
+            output of GATE_SIZE, and scaling exponent of time between
+            SCALING_SIZES (1 is linear, 2 is quadratic)
+  modules - time, peak memory and exec_command calls of dellos9_facts (per
+            subset, all and extended) and dellos9_config runs against unit test fixtures
+and compares them to recorded baseline (perf_baseline.json). Baseline times
+are scaled by the median current/baseline ratio (host speed), so single slower
+paths are found on faster or loaded hosts; calibration loop time bounds the
+ratio itself, so shared slowdowns are found too. Peak memory depends on the
+interpreter, so it is gated only against a baseline recorded with the same
+Python version (major.minor).
+
+    python tests/benchmark/perf_gate.py --record
+    python tests/benchmark/perf_gate.py --check --tolerance time=0.5
+
+Unit tests check exec_command counts always and all gates with DELLOS9_PERF_GATE=1.
+"""
+__metaclass__ = type
+
+import argparse
+import json
+import math
+import os
+import sys
+import time
+from unittest.mock import patch
+
+from ansible.module_utils import basic
+from ansible_collections.sense.dellos9.plugins.module_utils.network import \
+    dellos9 as dellos9_utils
+from ansible_collections.sense.dellos9.plugins.modules import (dellos9_config,
+                                                              dellos9_facts)
+from ansible_collections.sense.dellos9.tests.benchmark.bench_parsers import (
+    buildBenchmarks, measure, syntheticOutputs)
+from ansible_collections.sense.dellos9.tests.unit.modules.fake_os9 import (
+    FIXTURE_PATH, fixtureName)
+from ansible_collections.sense.dellos9.tests.unit.modules.dellos9_module import (
+    AnsibleExitJson, AnsibleFailJson, exit_json, fail_json, set_module_args)
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "perf_baseline.json")
+
+# Environment variable, which enables timing and memory gates in unit tests
+GATE_ENV = "DELLOS9_PERF_GATE"
+
+# os9gen size of parser inputs and sizes scaling exponent is computed between
+GATE_SIZE = 4
+SCALING_SIZES = (2, 8)
+
+# Allowed regression, relative to baseline (time 1.0 - twice as slow). exec_command
+# calls must not grow at all. Scaling exponent is absolute limit, not relative
+DEFAULT_TOLERANCE = {"time": 1.0, "peak_kib": 0.25, "exec_command": 0.0, "scaling": 1.5}
+
+# Times below this (seconds) are too noisy to gate
+MIN_TIME = 0.005
+
+# Module runs: name, module and module args
+MODULE_PATHS = [
+    (f"facts:{subset}", dellos9_facts, {"gather_subset": [subset]}) for subset in dellos9_facts.FACT_SUBSETS
+] + [
+    ("facts:all", dellos9_facts, {"gather_subset": ["all"]}),
+    ("facts:extended", dellos9_facts, {"gather_subset": ["all", "extended"]}),
+    ("config:lines", dellos9_config, {
+        "lines": ["description gate test", "mtu 9000"], "parents": ["interface Vlan 100"],
+    }),
+    ("config:save", dellos9_config, {"save": True}),
+]
+
+
+def calibrate(repeat=5):
+    """Best time of fixed pure Python workload (string, dict and regex like operations)"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        index = {}
+        for idx in range(200000):
+            key = f"hundredGigE 1/{idx % 1024}"
+            index[key] = index.get(key, 0) + len(key.split(" ")[1])
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+class FakeExec:
+    """exec_command replacement, which serves fixtures and counts calls"""
+
+    def __init__(self, fixtures=FIXTURE_PATH):
+        self.fixtures = fixtures
+        self.cache = {}
+        self.calls = 0
+
+    def __call__(self, module, command):
+        self.calls += 1
+        try:
+            command = json.loads(command)["command"]
+        except ValueError:
+            pass
+        if not command.startswith("show "):
+            return 0, "", ""
+        if command not in self.cache:
+            path = os.path.join(self.fixtures, fixtureName(command))
+            if not os.path.isfile(path):
+                return 1, "", f"% Error: Invalid input at \"^\" marker. ({command})"
+            with open(path, encoding="utf-8") as fd:
+                self.cache[command] = fd.read()
+        return 0, self.cache[command], ""
+
+
+def runModule(module, args, fakeExec):
+    """Run module main with args against fake exec_command and return its result"""
+    set_module_args(dict(args))
+    dellos9_utils._DEVICE_CONFIGS.clear()
+    with patch.multiple(basic.AnsibleModule, exit_json=exit_json, fail_json=fail_json), \
+            patch.object(dellos9_utils, "exec_command", fakeExec):
+        try:
+            module.main()
+        except AnsibleExitJson as ex:
+            result = ex.args[0]
+        except AnsibleFailJson as ex:
+            raise RuntimeError(f"Module failed: {ex.args[0].get('msg')}") from ex
+    factsFile = result.get("ansible_facts_file", {}).get("file")
+    if factsFile and os.path.isfile(factsFile):
+        os.unlink(factsFile)
+    return result
+
+
+def collectModules(repeat=5, timing=True):
+    """Time, peak memory and exec_command calls of every module path"""
+    out = {}
+    for name, module, args in MODULE_PATHS:
+        fakeExec = FakeExec()
+        runModule(module, args, fakeExec)
+        entry = {"exec_command": fakeExec.calls}
+        if timing:
+            seconds, peak = measure(lambda _: runModule(module, args, FakeExec()), None, repeat)
+            entry.update({"seconds": round(seconds, 6), "peak_kib": round(peak / 1024, 1)})
+        out[name] = entry
+    return out
+
+
+def collectParsers(repeat=5):
+    """Time, peak memory and scaling exponent of every parser benchmark"""
+    sizes = sorted({GATE_SIZE, *SCALING_SIZES})
+    outputs = {size: syntheticOutputs(size) for size in sizes}
+    out = {}
+    for name, (fixture, prepare, func) in buildBenchmarks().items():
+        times = {}
+        for size in sizes:
+            data = outputs[size][fixture]
+            data = prepare(data) if prepare else data
+            seconds, peak = measure(func, data, repeat)
+            times[size] = seconds
+            if size == GATE_SIZE:
+                out[name] = {"seconds": round(seconds, 6), "peak_kib": round(peak / 1024, 1)}
+        low, high = SCALING_SIZES
+        if times[low] >= MIN_TIME / 10:
+            out[name]["scaling"] = round(math.log(times[high] / times[low]) / math.log(high / low), 3)
+    return out
+
+
+def pythonVersion():
+    """Python version (major.minor), which baseline memory is valid for"""
+    return f"{sys.version_info[0]}.{sys.version_info[1]}"
+
+
+def collect(repeat=5, timing=True):
+    """Collect all metrics. Without timing, only exec_command calls are collected"""
+    metrics = {"modules": collectModules(repeat, timing)}
+    if timing:
+        metrics["python"] = pythonVersion()
+        metrics["calibration"] = round(calibrate(), 6)
+        metrics["parsers"] = collectParsers(repeat)
+    return metrics
+
+
+def hostSpeed(baseline, current):
+    """
+    Median ratio of current to baseline time over all timed entries. Host speed
+    and load change all times alike, while a regression changes only a few,
+    so single entries are compared after dividing by this ratio
+    """
+    ratios = sorted(
+        cur["seconds"] / base["seconds"]
+        for group in ("modules", "parsers")
+        for name, base in baseline.get(group, {}).items()
+        for cur in [current.get(group, {}).get(name)]
+        if cur and "seconds" in cur and base.get("seconds", 0) >= MIN_TIME
+    )
+    if not ratios:
+        return None
+    return ratios[len(ratios) // 2]
+
+
+def compare(baseline, current, tolerance=None):
+    """List of regressions (strings) of current metrics against baseline"""
+    tolerance = dict(DEFAULT_TOLERANCE, **(tolerance or {}))
+    regressions = []
+    speed = hostSpeed(baseline, current)
+    # Peak memory of other interpreter is not comparable
+    checkMemory = baseline.get("python") == current.get("python")
+    if speed and baseline.get("calibration") and current.get("calibration"):
+        # Everything slower than calibration loop is a regression of shared code (e.g. wrappers)
+        overall = speed / (current["calibration"] / baseline["calibration"])
+        if overall > 1 + 2 * tolerance["time"]:
+            regressions.append(f"overall: all paths {overall:.2f}x slower than calibration loop")
+    for group in ("modules", "parsers"):
+        for name, base in sorted(baseline.get(group, {}).items()):
+            cur = current.get(group, {}).get(name)
+            if cur is None:
+                continue
+            if "exec_command" in base and cur.get("exec_command", 0) > base["exec_command"] * (1 + tolerance["exec_command"]):
+                regressions.append(f"{group} {name}: exec_command {base['exec_command']} -> {cur['exec_command']}")
+            if speed and "seconds" in cur and base.get("seconds", 0) >= MIN_TIME:
+                if cur["seconds"] > base["seconds"] * speed * (1 + tolerance["time"]):
+                    regressions.append(
+                        f"{group} {name}: time {base['seconds'] * speed:.4f}s -> {cur['seconds']:.4f}s (host speed adjusted)")
+            if checkMemory and "peak_kib" in cur and base.get("peak_kib"):
+                if cur["peak_kib"] > base["peak_kib"] * (1 + tolerance["peak_kib"]) + 16:
+                    regressions.append(f"{group} {name}: peak memory {base['peak_kib']} KiB -> {cur['peak_kib']} KiB")
+            if cur.get("scaling") is not None and base.get("seconds", 0) >= MIN_TIME:
+                if cur["scaling"] > max(tolerance["scaling"], base.get("scaling", 0)):
+                    regressions.append(f"{group} {name}: scaling exponent {cur['scaling']} (superlinear)")
+    return regressions
+
+
+def loadBaseline(path=BASELINE_PATH):
+    """Load recorded baseline"""
+    with open(path, encoding="utf-8") as fd:
+        return json.load(fd)
+
+
+def parseTolerance(values):
+    """Parse --tolerance key=value values"""
+    out = {}
+    for value in values or []:
+        key, _, limit = value.partition("=")
+        if key not in DEFAULT_TOLERANCE:
+            raise ValueError(f"Unknown tolerance {key}. Known: {', '.join(DEFAULT_TOLERANCE)}")
+        out[key] = float(limit)
+    return out
+
+
+def main(argv=None):
+    """Record baseline or check against it. Returns exit code"""
+    parser = argparse.ArgumentParser(description="Dell OS 9 performance regression gate")
+    action = parser.add_mutually_exclusive_group()
+    action.add_argument("--record", action="store_true", help="Record baseline")
+    action.add_argument("--check", action="store_true", help="Check against baseline (default)")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="Baseline file")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement, best time is used")
+    parser.add_argument("--tolerance", action="append", help="Allowed regression, e.g. time=0.5 or peak_kib=0.25")
+    args = parser.parse_args(argv)
+    current = collect(args.repeat)
+    if args.record:
+        with open(args.baseline, "w", encoding="utf-8") as fd:
+            json.dump(current, fd, indent=2, sort_keys=True)
+            fd.write("\n")
+        print(f"Baseline written to {args.baseline}")
+        return 0
+    baseline = loadBaseline(args.baseline)
+    if baseline.get("python") != current["python"]:
+        print(f"Baseline recorded with Python {baseline.get('python')}, memory is not checked on {current['python']}")
+    regressions = compare(baseline, current, parseTolerance(args.tolerance))
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if not regressions:
+        print("No performance regressions")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -60,6 +60,13 @@ class ModuleTestCase(unittest.TestCase):
         self.addCleanup(self.mock_sleep.stop)
 
 
+class ParamsModule:
+    """Minimal module, which facts parsers need (only params are used)"""
+
+    def __init__(self, **params):
+        self.params = params
+
+
 def set_module_args(args):
     """Set Module args"""
     if "_ansible_remote_tmp" not in args:
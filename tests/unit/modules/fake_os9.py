@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Fake Dell OS 9 CLI for end to end tests
+Copyright: Contributors to the SENSE Project
+GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+Title                   : sdn-sense/dellos9
+Author                  : Justas Balcas
+Email                   : juztas (at) gmail.com
+@Copyright              : General Public License v3.0+
+Date                    : 2026/10/19
+
+Emulates Dell OS 9 CLI: exec and enable prompts, --More-- paging (until
+terminal length 0), configuration modes with their prompts, [confirm yes/no]
+prompts and per command latency. show commands are served from fixture
+files, named as in unit tests (| removed, spaces to _, / to 7), so unit test
+fixtures or os9gen outputs can be used.
+
+CLI is served over TCP (one session per connection):
+
+    python tests/unit/modules/fake_os9.py --port 2222 --latency 0.05 --latency-cmd "show interfaces=0.5"
+
+or on stdin/stdout of a pty, e.g. as sshd ForceCommand of a test user, so
+network_cli (exec_command, terminal plugin, action plugin) runs against it:
+
+    Match User os9test
+        ForceCommand python /path/to/tests/unit/modules/fake_os9.py --stdio --fixtures /tmp/os9
+"""
+__metaclass__ = type
+
+import argparse
+import os
+import re
+import socketserver
+import sys
+import threading
+import time
+
+FIXTURE_PATH = os.path.join(os.path.dirname(__file__), "fixtures")
+
+MORE = b" --More-- "
+
+# Erases --More-- after key press (backspaces, spaces, backspaces)
+MORE_ERASE = b"\x08" * len(MORE) + b" " * len(MORE) + b"\x08" * len(MORE)
+
+# Commands, which ask for confirmation: command regex, question and output after yes
+CONFIRM_COMMANDS = [
+    (
+        re.compile(r"^copy running-config startup-config$"),
+        "File with same name already exist.\nProceed to copy the file [confirm yes/no]: ",
+        "!\n{size} bytes successfully copied",
+    ),
+    (re.compile(r"^write memory$"), None, "!"),
+    (re.compile(r"^reload$"), "Proceed with reload [confirm yes/no]: ", "Reload is not supported by fake device"),
+    (
+        re.compile(r"^delete (\S+)$"),
+        "Proceed to delete {0} [confirm yes/no]: ",
+        "",
+    ),
+]
+
+# Configuration sub modes: interface name prefix and its prompt abbreviation
+INTERFACE_MODES = {
+    "hundredgige": "hu",
+    "fortygige": "fo",
+    "twentyfivegige": "tf",
+    "tengigabitethernet": "te",
+    "gigabitethernet": "gi",
+    "managementethernet": "ma",
+    "port-channel": "po",
+    "vlan": "vl",
+    "loopback": "lo",
+}
+
+
+def fixtureName(command):
+    """Fixture file name of command"""
+    return command.replace("|", "").replace(" ", "_").replace("/", "7")
+
+
+class FakeOs9Device:
+    """
+    CLI session state machine. feed gets bytes typed by client and returns
+    bytes the device writes back (echo, output and next prompt). Sessions
+    share nothing, except fixtures and latency settings
+    """
+
+    def __init__(self, fixtures=FIXTURE_PATH, hostname="FAKE-Z9100", latency=0.0,
+                 latencies=None, pageLength=24, enableSecret=None):
+        self.fixtures = fixtures
+        self.hostname = hostname
+        self.latency = latency
+        self.latencies = latencies or {}
+        self.pageLength = pageLength
+        self.enableSecret = enableSecret
+        self.enabled = enableSecret is None
+        self.modes = []
+        self.buffer = b""
+        self.lastCr = False
+        self.pending = []
+        self.waiting = None
+        self.closed = False
+        self.config = []
+        # Commands executed in this session (one per round trip)
+        self.commands = []
+
+    def prompt(self):
+        """Prompt of current mode"""
+        if self.modes:
+            return f"{self.hostname}({self.modes[-1]})#".encode()
+        return f"{self.hostname}{'#' if self.enabled else '>'}".encode()
+
+    def banner(self):
+        """Output sent on connect"""
+        return b"\r\nDell EMC Networking OS (fake)\r\n\r\n" + self.prompt()
+
+    def feed(self, data):
+        """Process input typed by client and return output"""
+        out = b""
+        for char in data:
+            char = bytes([char])
+            lastCr, self.lastCr = self.lastCr, char == b"\r"
+            if char == b"\n" and lastCr:
+                # \n of \r\n line ending
+                continue
+            if self.pending:
+                out += self.nextPage(quit=char in b"qQ")
+                continue
+            if char in b"\r\n":
+                line, self.buffer = self.buffer.decode(errors="replace"), b""
+                out += b"\r\n" + self.handleLine(line)
+            elif char in b"\x08\x7f":
+                self.buffer = self.buffer[:-1]
+            else:
+                self.buffer += char
+                if self.waiting is None or self.waiting[0] != "password":
+                    out += char
+        return out
+
+    def handleLine(self, line):
+        """Handle complete input line"""
+        if self.waiting:
+            kind, callback = self.waiting
+            self.waiting = None
+            return callback(line.strip()) if kind != "password" else callback(line)
+        command = " ".join(line.split())
+        if not command:
+            return self.prompt()
+        self.commands.append(command)
+        delay = self.latencies.get(command)
+        if delay is None:
+            delay = next((value for prefix, value in self.latencies.items()
+                          if prefix.endswith("*") and command.startswith(prefix[:-1])), self.latency)
+        if delay:
+            time.sleep(delay)
+        return self.execute(command)
+
+    def execute(self, command):
+        """Execute command in current mode"""
+        lower = command.lower()
+        if lower in ("exit", "quit") and not self.modes:
+            self.closed = True
+            return b""
+        if not self.enabled:
+            if lower == "enable":
+                self.waiting = ("password", self.checkSecret)
+                return b"Password: "
+            return self.showOrError(command)
+        if lower == "disable" and not self.modes:
+            self.enabled = self.enableSecret is None
+            return self.prompt()
+        if lower.startswith("terminal length "):
+            self.pageLength = int(lower.split()[-1])
+            return self.prompt()
+        if lower in ("configure", "configure terminal"):
+            self.modes = ["conf"]
+            return self.prompt()
+        if self.modes:
+            return self.configure(command)
+        for regex, question, answer in CONFIRM_COMMANDS:
+            match = regex.match(command)
+            if match:
+                if question is None:
+                    return self.output(self.confirmed(answer, match))
+                self.waiting = ("confirm", lambda reply, answer=answer, match=match: self.confirm(reply, answer, match))
+                return question.format(*match.groups()).replace("\n", "\r\n").encode()
+        return self.showOrError(command)
+
+    def checkSecret(self, secret):
+        """Answer of enable password prompt"""
+        if secret == self.enableSecret:
+            self.enabled = True
+            return self.prompt()
+        return b"% Bad secret\r\n" + self.prompt()
+
+    def confirm(self, reply, answer, match):
+        """Answer of [confirm yes/no] prompt"""
+        if reply.lower() in ("yes", "y"):
+            return self.output(self.confirmed(answer, match))
+        return self.prompt()
+
+    def confirmed(self, answer, match):
+        """Output of confirmed command"""
+        return answer.format(*match.groups(), size=sum(len(line) + 1 for line in self.config))
+
+    def configure(self, command):
+        """Command in configuration mode"""
+        lower = command.lower()
+        if lower == "end":
+            self.modes = []
+            return self.prompt()
+        if lower == "exit":
+            self.modes.pop()
+            return self.prompt()
+        if lower.startswith("do "):
+            return self.showOrError(command[3:])
+        if lower.startswith("interface "):
+            name = lower[10:].replace(" ", "")
+            for prefix, abbr in INTERFACE_MODES.items():
+                if name.startswith(prefix):
+                    self.modes = self.modes[:1] + [f"conf-if-{abbr}-{name[len(prefix):]}"]
+                    self.config.append(command)
+                    return self.prompt()
+            return self.error(command, len("interface "))
+        if lower.startswith(("router ", "protocol ", "ip vrf ", "route-map ")):
+            self.modes = self.modes[:1] + [f"conf-{lower.split()[0]}"]
+        self.config.append(command)
+        return self.prompt()
+
+    def showOrError(self, command):
+        """Output of show command from fixtures or invalid input error"""
+        if command.startswith("show "):
+            path = os.path.join(self.fixtures, fixtureName(command))
+            if os.path.isfile(path):
+                with open(path, encoding="utf-8") as fd:
+                    return self.output(fd.read())
+        return self.error(command, command.find(" ") + 1)
+
+    def error(self, command, position):
+        """Invalid input error with ^ marker under position of command"""
+        marker = " " * (len(self.prompt()) + position) + "^"
+        return f"{marker}\r\n% Error: Invalid input at \"^\" marker.\r\n".encode() + self.prompt()
+
+    def output(self, text):
+        """Command output, paged if terminal length is set"""
+        lines = [line.encode() + b"\r\n" for line in text.rstrip("\n").split("\n")] if text else []
+        if not self.pageLength or len(lines) <= self.pageLength:
+            return b"".join(lines) + self.prompt()
+        self.pending = lines[self.pageLength:]
+        return b"".join(lines[:self.pageLength]) + MORE
+
+    def nextPage(self, quit=False):
+        """Output after key press at --More--"""
+        if quit:
+            self.pending = []
+            return MORE_ERASE + self.prompt()
+        page, self.pending = self.pending[:self.pageLength], self.pending[self.pageLength:]
+        return MORE_ERASE + b"".join(page) + (MORE if self.pending else self.prompt())
+
+
+class _SessionHandler(socketserver.BaseRequestHandler):
+    """One CLI session per TCP connection"""
+
+    def handle(self):
+        device = self.server.newDevice()
+        self.server.sessions.append(device)
+        self.request.sendall(device.banner())
+        while not device.closed:
+            data = self.request.recv(4096)
+            if not data:
+                break
+            out = device.feed(data)
+            if out:
+                self.request.sendall(out)
+
+
+class FakeOs9Server(socketserver.ThreadingTCPServer):
+    """
+    TCP server of fake CLI sessions. Use as context manager, it serves in
+    background thread on address (port 0 picks free port)
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address=("127.0.0.1", 0), **deviceArgs):
+        super().__init__(address, _SessionHandler)
+        self.deviceArgs = deviceArgs
+        self.sessions = []
+        self.thread = None
+
+    def newDevice(self):
+        """Device of new session"""
+        return FakeOs9Device(**self.deviceArgs)
+
+    @property
+    def port(self):
+        """Port server listens on"""
+        return self.server_address[1]
+
+    def __enter__(self):
+        self.thread = threading.Thread(target=self.serve_forever, args=(0.05,), daemon=True)
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
+        self.server_close()
+
+
+def serveStdio(device):
+    """Serve one session on stdin/stdout (raw mode, if stdin is a tty)"""
+    fdIn, fdOut = sys.stdin.fileno(), sys.stdout.fileno()
+    restore = None
+    if os.isatty(fdIn):
+        import termios
+        import tty
+        restore = termios.tcgetattr(fdIn)
+        tty.setraw(fdIn)
+    try:
+        os.write(fdOut, device.banner())
+        while not device.closed:
+            data = os.read(fdIn, 4096)
+            if not data:
+                break
+            out = device.feed(data)
+            if out:
+                os.write(fdOut, out)
+    finally:
+        if restore:
+            termios.tcsetattr(fdIn, termios.TCSADRAIN, restore)
+
+
+def parseLatencies(values):
+    """Parse --latency-cmd command=seconds values (command may end with *)"""
+    out = {}
+    for value in values or []:
+        command, _, seconds = value.rpartition("=")
+        out[command.strip()] = float(seconds)
+    return out
+
+
+def main(argv=None):
+    """Parse arguments and serve"""
+    parser = argparse.ArgumentParser(description="Fake Dell OS 9 CLI")
+    parser.add_argument("--fixtures", default=FIXTURE_PATH, help="Directory of show command outputs")
+    parser.add_argument("--hostname", default="FAKE-Z9100", help="Hostname in prompt")
+    parser.add_argument("--latency", type=float, default=0.0, help="Latency of every command (seconds)")
+    parser.add_argument("--latency-cmd", action="append", help="Latency of command: 'show interfaces=0.5' or 'show ip*=0.2'")
+    parser.add_argument("--page-length", type=int, default=24, help="Lines per page until terminal length is set")
+    parser.add_argument("--enable-secret", help="Start in > mode, enable asks for this secret")
+    parser.add_argument("--listen", default="127.0.0.1", help="Address to listen on")
+    parser.add_argument("--port", type=int, default=2222, help="TCP port to listen on")
+    parser.add_argument("--stdio", action="store_true", help="Serve one session on stdin/stdout")
+    args = parser.parse_args(argv)
+    deviceArgs = {
+        "fixtures": args.fixtures,
+        "hostname": args.hostname,
+        "latency": args.latency,
+        "latencies": parseLatencies(args.latency_cmd),
+        "pageLength": args.page_length,
+        "enableSecret": args.enable_secret,
+    }
+    if args.stdio:
+        serveStdio(FakeOs9Device(**deviceArgs))
+        return
+    with FakeOs9Server((args.listen, args.port), **deviceArgs) as server:
+        print(f"Fake Dell OS 9 CLI listening on {args.listen}:{server.port}")
+        try:
+            server.thread.join()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,465 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Synthetic Dell OS 9 command output generator
+Copyright: Contributors to the SENSE Project
+GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+Title                   : sdn-sense/dellos9
+Author                  : Justas Balcas
+Email                   : juztas (at) gmail.com
+@Copyright              : General Public License v3.0+
+Date                    : 2026/10/19
+
+Generates show interfaces, show running-config, show lldp neighbors detail
+and show system output of a device with given number of ports, VLANs and
+static routes. Output of the same parameters and seed is always the same,
+so benchmarks and stress tests are reproducible. Files are written with
+unit test fixture names, so they can be served in place of fixtures.
+
+    python tests/unit/modules/os9gen.py --ports 1024 --vlans 3000 --routes 500 --output /tmp/os9
+"""
+__metaclass__ = type
+
+import argparse
+import ipaddress
+import os
+import random
+
+# Ports per stack unit (Z9100: 32 x 100G ports)
+PORTS_PER_UNIT = 32
+
+# Member ports of every port-channel
+CHANNEL_MEMBERS = 2
+
+# Offset of interface MAC from stack MAC
+INTERFACE_MAC = 2
+
+# Highest VLAN id, which can be configured
+MAX_VLAN = 4093
+
+# Counters block of physical ports and port-channels in show interfaces
+_STATISTICS = """Input Statistics:
+     {inPkts} packets, {inBytes} bytes
+     {in64} 64-byte pkts, {in127} over 64-byte pkts, {in255} over 127-byte pkts
+     0 over 255-byte pkts, 0 over 511-byte pkts, 0 over 1023-byte pkts
+     {inMcast} Multicasts, {inBcast} Broadcasts, {inUcast} Unicasts
+     0 runts, 0 giants, 0 throttles
+     {inCrc} CRC, 0 overrun, {inDiscard} discarded
+Output Statistics:
+     {outPkts} packets, {outBytes} bytes, 0 underruns
+     {out64} 64-byte pkts, {out127} over 64-byte pkts, {out255} over 127-byte pkts
+     0 over 255-byte pkts, 0 over 511-byte pkts, 0 over 1023-byte pkts
+     {outMcast} Multicasts, {outBcast} Broadcasts, {outUcast} Unicasts
+     0 throttles, {outDiscard} discarded, 0 collisions, 0 wreddrops
+Rate info (interval 299 seconds):
+     Input {inRate:05.2f} Mbits/sec,        {inPps} packets/sec, 0.01% of line-rate
+     Output {outRate:05.2f} Mbits/sec,        {outPps} packets/sec, 0.00% of line-rate
+Time since last interface status change: 1w2d20h
+"""
+
+_PORT = """{name} is {status}, line protocol is {status}
+{member}Description: {description}
+Hardware is DellEMCEth, address is {mac}
+    Current address is {mac}
+Non-qualified pluggable media present, QSFP28 type is 100GBASE-SR4
+    AutoNegotiation is OFF
+    Forward Error Correction(FEC) configured is OFF
+    FEC status is OFF
+    Wavelength is 850nm
+    QSFP28 receive power reading is -0.2669dBm
+    QSFP28 transmit power reading is 0.1376dBm
+Interface index is {index}
+Internet address is not set
+Mode of IPv4 Address Assignment : NONE
+DHCP Client-ID :{clientId}
+MTU 9416 bytes, IP MTU 9398 bytes
+LineSpeed 100000 Mbit
+Flowcontrol rx off tx off
+ARP type: ARPA, ARP Timeout 04:00:00
+Last clearing of "show interface" counters 1w2d20h
+Queueing strategy: fifo
+"""
+
+_MANAGEMENT = """ManagementEthernet 1/1 is up, line protocol is up
+Hardware is DellEMCEth, address is {mac}
+    Current address is {mac}
+Pluggable media not present
+Interface index is 9437185
+Internet address is 10.0.0.10/24
+Mode of IPv4 Address Assignment : MANUAL
+DHCP Client-ID :{clientId}
+Virtual-IP is not set
+Virtual-IP IPv6 address is not set
+MTU 1554 bytes, IP MTU 1500 bytes
+LineSpeed 1000 Mbit, Mode full duplex
+ARP type: ARPA, ARP Timeout 04:00:00
+Last clearing of "show interface" counters 1w2d20h
+Queueing strategy: fifo
+    Input 5229670 packets, 59290673 bytes, 541652 multicast
+    Received 0 errors, 0 discarded
+    Output 27492 packets, 8550012 bytes, 0 multicast
+    Output 0 errors, 0 invalid protocol
+Time since last interface status change: 1w2d20h
+"""
+
+_CHANNEL = """{name} is up, line protocol is up
+Description: {description}
+Hardware address is {mac}, Current address is {mac}
+Interface index is {index}
+Minimum number of links to bring Port-channel up is 1
+Internet address is not set
+Mode of IPv4 Address Assignment : NONE
+DHCP Client-ID :{clientId}
+MTU 9416 bytes, IP MTU 9398 bytes
+LineSpeed {speed} Mbit
+Members in this channel: {members}
+ARP type: ARPA, ARP Timeout 04:00:00
+Last clearing of "show interface" counters 1w2d20h
+Queueing strategy: fifo
+"""
+
+_VLAN = """{name} is up, line protocol is up
+Description: {description}
+Address is {mac}, Current address is {mac}
+Interface index is {index}
+Internet address is {ipv4}
+Mode of IPv4 Address Assignment : {mode}
+DHCP Client-ID(61): {clientId}
+MTU 9416 bytes, IP MTU 9398 bytes
+LineSpeed {speed} Mbit
+ARP type: ARPA, ARP Timeout 04:00:00
+Last clearing of "show interface" counters 1w2d20h
+Queueing strategy: fifo
+Time since last interface status change: 1w2d20h
+Input Statistics:
+    {inPkts} packets, {inBytes} bytes
+Output Statistics:
+    {outPkts} packets, {outBytes} bytes
+"""
+
+_LLDP = """========================================================================
+ Local Interface Hu {port} has 1 neighbor
+  Total Frames Out: {framesOut}
+  Total Frames In: {framesIn}
+  Total Neighbor information Age outs: 0
+  Total Multiple Neighbors Detected: 0
+  Total Frames Discarded: 0
+  Total In Error Frames: 0
+  Total Unrecognized TLVs: 0
+  Total TLVs Discarded: 0
+  Next packet will be sent after {nextPacket} seconds
+  The neighbors are given below:
+  -----------------------------------------------------------------------
+
+    Remote Chassis ID Subtype: Mac address (4)
+    Remote Chassis ID:  {remoteMac}
+    Remote Port Subtype:  Interface name (5)
+    Remote Port ID:  hundredGigE {remotePort}
+    Local Port ID: hundredGigE {port}
+    Locally assigned remote Neighbor Index: {neighborIndex}
+    Remote TTL:  120
+    Information valid for next {valid} seconds
+    Time since last information change of this neighbor:  1w2d20h
+    Remote MTU:  9416
+    Remote System Name:  {remoteName}
+    Remote System Desc:  Dell Real Time Operating System Software. Dell
+     Operating System Version: 2.0. Dell Application Software Version:
+     9.14(2.7) Copyright (c) 1999-2020Dell Inc. All Rights Reserved.Build
+     Time: Mon Feb 27 16:57:20 2020
+    Existing System Capabilities:  Repeater Bridge Router
+    Enabled System Capabilities:  Repeater Bridge Router
+    Port and Protocol Vlan ID: 0, Capability: Not Supported, Status: Not Enabled
+    UnknownTLVList:
+    OrgUnknownTLVList:
+   ---------------------------------------------------------------------------
+"""
+
+_SYSTEM_UNIT = """--  Unit {unit} --
+Unit Type                      : {unitType}
+Status                         : online
+Next Boot                      : online
+Required Type                  : Z9100-ON - 34-port TE/TF/FO/FI/HU G (Z9100-ON)
+Current Type                   : Z9100-ON - 34-port TE/TF/FO/FI/HU G (Z9100-ON)
+Master priority                : NA
+Hardware Rev                   : 0.0
+Num Ports                      : {numPorts}
+Up Time                        : 1 wk, 2 day, 20 hr, 37 min
+Dell EMC Networking OS Version     : 9.14(2.7)
+Jumbo Capable                  : yes
+POE Capable                    : no
+FIPS Mode                      : disabled
+Burned In MAC                  : {mac}
+No Of MACs                     : 3
+"""
+
+
+def compressPorts(ports):
+    """
+    Port list in running-config range syntax, e.g. [(1, 1), (1, 2), (1, 3), (1, 7)]
+    is 1/1-1/3,1/7. Ranges do not cross stack units
+    """
+    out = []
+    start = prev = None
+    for port in sorted(ports):
+        if prev and port[0] == prev[0] and port[1] == prev[1] + 1:
+            prev = port
+            continue
+        if start:
+            out.append(f"{start[0]}/{start[1]}" if start == prev else f"{start[0]}/{start[1]}-{prev[0]}/{prev[1]}")
+        start = prev = port
+    if start:
+        out.append(f"{start[0]}/{start[1]}" if start == prev else f"{start[0]}/{start[1]}-{prev[0]}/{prev[1]}")
+    return ",".join(out)
+
+
+class Os9Generator:
+    """
+    Synthetic device: ports hundredGigE unit/port, port-channels of CHANNEL_MEMBERS
+    ports each, VLANs tagged on port ranges and port-channels, static routes
+    (ipv4 and ipv6, global and in vrf) and LLDP neighbors on every other port
+    """
+
+    def __init__(self, ports=32, vlans=100, routes=10, channels=None, seed=0, hostname="SYNTH-Z9100"):
+        if vlans > MAX_VLAN - 1:
+            raise ValueError(f"At most {MAX_VLAN - 1} VLANs can be generated")
+        self.seed = seed
+        self.hostname = hostname
+        self.ports = [(idx // PORTS_PER_UNIT + 1, idx % PORTS_PER_UNIT + 1) for idx in range(ports)]
+        if channels is None:
+            channels = max(1, ports // 16)
+        channels = min(channels, ports // CHANNEL_MEMBERS)
+        self.channels = {
+            100 + idx: self.ports[idx * CHANNEL_MEMBERS:(idx + 1) * CHANNEL_MEMBERS] for idx in range(channels)
+        }
+        self.memberOf = {port: channel for channel, members in self.channels.items() for port in members}
+        self.vlans = list(range(2, vlans + 2))
+        self.routes = routes
+        self.baseMac = 0x4c7625e80000 + self.rand("mac").randrange(0x10000)
+        self.tagged = self.vlanMembers()
+
+    def rand(self, name):
+        """Random generator of one output, so outputs do not depend on the order they are generated"""
+        return random.Random(f"{self.seed}-{name}")
+
+    def mac(self, offset=0):
+        """Stack MAC address (offset 0), interface MAC (INTERFACE_MAC) or MAC of remote device"""
+        value = f"{self.baseMac + offset:012x}"
+        return ":".join(value[idx:idx + 2] for idx in range(0, 12, 2))
+
+    @staticmethod
+    def portName(port):
+        """Port name of (unit, port)"""
+        return f"hundredGigE {port[0]}/{port[1]}"
+
+    def freePorts(self):
+        """Ports, which are not port-channel members"""
+        return [port for port in self.ports if port not in self.memberOf]
+
+    def vlanMembers(self):
+        """Tagged ports (contiguous range) and port-channels of every VLAN"""
+        rnd = self.rand("vlans")
+        free = self.freePorts()
+        channels = list(self.channels)
+        out = {}
+        for vlan in self.vlans:
+            ports = []
+            if free:
+                start = rnd.randrange(len(free))
+                ports = free[start:start + rnd.randint(1, 8)]
+            out[vlan] = (ports, rnd.sample(channels, min(len(channels), rnd.randint(0, 2))))
+        return out
+
+    def counters(self, rnd):
+        """Random counters of show interfaces Input/Output Statistics"""
+        values = {}
+        for direction in ("in", "out"):
+            ucast, mcast, bcast = rnd.randrange(1 << 40), rnd.randrange(1 << 24), rnd.randrange(1 << 20)
+            values.update({
+                f"{direction}Ucast": ucast, f"{direction}Mcast": mcast, f"{direction}Bcast": bcast,
+                f"{direction}Pkts": ucast + mcast + bcast, f"{direction}Bytes": (ucast + mcast + bcast) * 900,
+                f"{direction}64": ucast // 8, f"{direction}127": ucast // 4, f"{direction}255": ucast // 2,
+                f"{direction}Discard": rnd.randrange(100), f"{direction}Rate": rnd.uniform(0, 99),
+                f"{direction}Pps": rnd.randrange(100000),
+            })
+        values["inCrc"] = rnd.randrange(10)
+        return values
+
+    def showInterfaces(self):
+        """show interfaces output"""
+        rnd = self.rand("show interfaces")
+        mac = self.mac(INTERFACE_MAC)
+        clientId = mac.replace(":", "")
+        blocks = []
+        for idx, port in enumerate(self.ports):
+            channel = self.memberOf.get(port)
+            status = "up" if channel or rnd.random() < 0.8 else "down"
+            blocks.append(_PORT.format(
+                name=self.portName(port), status=status, mac=mac, clientId=clientId, index=2097152 + idx * 4,
+                member=f"Port is part of Port-channel {channel}\n" if channel else "",
+                description=f"'Port-channel {channel}'" if channel else f"Link to server-{idx}",
+            ) + _STATISTICS.format(**self.counters(rnd)))
+        blocks.append(_MANAGEMENT.format(mac=mac, clientId=clientId))
+        for channel, members in self.channels.items():
+            blocks.append(_CHANNEL.format(
+                name=f"Port-channel {channel}", description=f"PortChannel {channel} uplink", mac=mac,
+                clientId=clientId, index=1258342912 + channel * 512, speed=100000 * len(members),
+                members=" ".join(f"Hu {unit}/{num}(Up)" for unit, num in members),
+            ) + _STATISTICS.format(**self.counters(rnd)))
+        for vlan in self.vlans:
+            counters = self.counters(rnd)
+            routed = vlan % 4 == 0
+            blocks.append(_VLAN.format(
+                name=f"Vlan {vlan}", description=f"Synthetic VLAN {vlan}", mac=mac, clientId=clientId,
+                index=1275068416 + vlan * 512, ipv4=self.vlanAddress(vlan) if routed else "not set",
+                mode="MANUAL" if routed else "NONE", speed=100000 * max(1, len(self.tagged[vlan][0])),
+                inPkts=counters["inPkts"], inBytes=counters["inBytes"],
+                outPkts=counters["outPkts"], outBytes=counters["outBytes"],
+            ))
+        return "\n\n".join(blocks)
+
+    @staticmethod
+    def vlanAddress(vlan):
+        """IPv4 address of routed VLAN"""
+        return f"172.{16 + vlan // 256}.{vlan % 256}.1/24"
+
+    def showRunningConfig(self):
+        """show running-config output"""
+        rnd = self.rand("show running-config")
+        lines = [
+            "Current Configuration ...",
+            "! Version 9.14(2.7)",
+            "! Last configuration change at Thu Jul  6 19:58:01 2023 by sense",
+            "!",
+            f"hostname {self.hostname}",
+            "!",
+            "feature vrf",
+            "!",
+            "protocol lldp",
+            " advertise management-tlv system-capabilities system-description system-name",
+            "!",
+            "ip vrf lhcone",
+            "!",
+        ]
+        for idx, port in enumerate(self.ports):
+            channel = self.memberOf.get(port)
+            lines.append(f"interface {self.portName(port)}")
+            lines.append(f" description 'Port-channel {channel}'" if channel else f" description Link to server-{idx}")
+            lines += [" no ip address", " mtu 9416"]
+            if not channel:
+                lines.append(" switchport")
+                if rnd.random() < 0.2:
+                    lines.append(" spanning-tree pvst edge-port")
+            lines += [" no shutdown", "!"]
+        lines += ["interface ManagementEthernet 1/1", " ip address 10.0.0.10/24", " no shutdown", "!"]
+        for channel, members in self.channels.items():
+            lines += [
+                f"interface Port-channel {channel}",
+                f" description PortChannel {channel} uplink",
+                " no ip address",
+                " mtu 9416",
+                " switchport",
+                f" channel-member hundredGigE {compressPorts(members)}",
+                " no shutdown",
+                "!",
+            ]
+        for vlan in self.vlans:
+            ports, channels = self.tagged[vlan]
+            lines += [f"interface Vlan {vlan}", f" description Synthetic VLAN {vlan}"]
+            if vlan % 4 == 0:
+                lines += [
+                    " ip vrf forwarding lhcone",
+                    f" ip address {self.vlanAddress(vlan)}",
+                    f" ipv6 address fc00:{vlan:x}::1/64",
+                ]
+            else:
+                lines.append(" no ip address")
+            lines.append(" mtu 9416")
+            if ports:
+                lines.append(f" tagged hundredGigE {compressPorts(ports)}")
+            lines += [f" tagged Port-channel {channel}" for channel in sorted(channels)]
+            lines += [" no shutdown", "!"]
+        lines += self.routeLines(rnd)
+        lines += ["!", "ip ssh server enable", "!", "line console 0", "line vty 0", " exec-timeout 0 0", "!", "end"]
+        return "\n".join(lines)
+
+    def routeLines(self, rnd):
+        """Static routes: half ipv4 and half ipv6, every third in vrf lhcone"""
+        lines = []
+        for idx in range(self.routes):
+            vrf = "vrf lhcone " if idx % 3 == 0 else ""
+            if idx % 2 == 0:
+                network = ipaddress.IPv4Network((0x0a000000 + (idx // 2) * 256, 24))
+                nextHop = f"192.168.{rnd.randrange(256)}.{rnd.randrange(1, 255)}"
+                lines.append(f"ip route {vrf}{network} {nextHop}")
+            else:
+                network = ipaddress.IPv6Network((0x20010db8 << 96 | (idx // 2) << 64, 64))
+                lines.append(f"ipv6 route {vrf}{network} fc00::{rnd.randrange(1, 0xffff):x}")
+        return lines
+
+    def showLldpNeighborsDetail(self):
+        """show lldp neighbors detail output, neighbors on every other port"""
+        rnd = self.rand("show lldp neighbors detail")
+        blocks = []
+        for idx, port in enumerate(self.ports[::2]):
+            remote = rnd.randrange(1, 64)
+            blocks.append(_LLDP.format(
+                port=f"{port[0]}/{port[1]}", framesOut=rnd.randrange(100000), framesIn=rnd.randrange(100000),
+                nextPacket=rnd.randrange(30), remoteMac=self.mac(0x10000 + remote * 0x100),
+                remotePort=f"1/{rnd.randrange(1, PORTS_PER_UNIT + 1)}", neighborIndex=idx + 1,
+                valid=rnd.randrange(90, 120), remoteName=f"SYNTH-NEIGHBOR-{remote:02d}",
+            ))
+        return "\n".join(blocks)
+
+    def showSystem(self):
+        """show system output"""
+        units = sorted({port[0] for port in self.ports}) or [1]
+        lines = [
+            f"Stack MAC                      : {self.mac()}",
+            "Reload-Type                    : normal-reload [Next boot : normal-reload]",
+            "",
+        ]
+        for unit in units:
+            lines.append(_SYSTEM_UNIT.format(
+                unit=unit, unitType="Management Unit" if unit == units[0] else "Standby Unit",
+                numPorts=sum(1 for port in self.ports if port[0] == unit), mac=self.mac(),
+            ))
+        return "\n".join(lines)
+
+    def outputs(self):
+        """All outputs, keyed by unit test fixture name"""
+        return {
+            "show_interfaces": self.showInterfaces(),
+            "show_running-config": self.showRunningConfig(),
+            "show_lldp_neighbors_detail": self.showLldpNeighborsDetail(),
+            "show_system": self.showSystem(),
+        }
+
+    def write(self, directory):
+        """Write all outputs to directory and return their paths"""
+        os.makedirs(directory, exist_ok=True)
+        paths = []
+        for name, output in self.outputs().items():
+            path = os.path.join(directory, name)
+            with open(path, "w", encoding="utf-8") as fd:
+                fd.write(output)
+            paths.append(path)
+        return paths
+
+
+def main(argv=None):
+    """Parse arguments and write outputs"""
+    parser = argparse.ArgumentParser(description="Synthetic Dell OS 9 command output generator")
+    parser.add_argument("--ports", type=int, default=32, help="Number of hundredGigE ports")
+    parser.add_argument("--vlans", type=int, default=100, help="Number of VLANs")
+    parser.add_argument("--routes", type=int, default=10, help="Number of static routes")
+    parser.add_argument("--channels", type=int, help="Number of port-channels (default ports / 16)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--output", required=True, help="Directory to write outputs to")
+    args = parser.parse_args(argv)
+    generator = Os9Generator(args.ports, args.vlans, args.routes, args.channels, args.seed)
+    for path in generator.write(args.output):
+        print(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -13,11 +13,24 @@ Date                    : 2023/11/05
 __metaclass__ = type
 
 import json
+import os
+import tempfile
+import threading
 from unittest.mock import patch
 
+from ansible_collections.sense.dellos9.plugins.filter.fib import fib_lookup
+from ansible_collections.sense.dellos9.plugins.filter import mactable
+from ansible_collections.sense.dellos9.plugins.filter.mactable import (
+    mac_lookup, mac_port)
+from ansible_collections.sense.dellos9.plugins.module_utils.network.mactable import \
+    MacTable
 from ansible_collections.sense.dellos9.plugins.modules import dellos9_facts
+from ansible_collections.sense.dellos9.tests.unit.modules import \
+    dellos9_module
 from ansible_collections.sense.dellos9.tests.unit.modules.dellos9_module import (
-    TestDellOS9Module, load_fixture, set_module_args)
+    ParamsModule, TestDellOS9Module, load_fixture, set_module_args)
+from ansible_collections.sense.dellos9.tests.unit.modules.os9gen import \
+    Os9Generator
 
 
 class TestDellOS9Facts(TestDellOS9Module):
@@ -111,6 +124,18 @@ class TestDellOS9Facts(TestDellOS9Module):
                     subval, ansible_facts["ansible_net_interfaces"][key][subkey]
                 )
 
+    def test_dellos9_facts_gather_subset_all_extended(self):
+        extended = ["ansible_net_fib", "ansible_net_mac_table", "ansible_net_arp", "ansible_net_counters"]
+        set_module_args({"gather_subset": "all"})
+        ansible_facts = self.execute_module()["ansible_facts"]
+        self.assertIn("ansible_net_lldp", ansible_facts)
+        self.assertEqual([], [key for key in extended if key in ansible_facts])
+        set_module_args({"gather_subset": ["all", "extended", "!mac"]})
+        ansible_facts = self.execute_module()["ansible_facts"]
+        self.assertIn("ansible_net_lldp", ansible_facts)
+        self.assertEqual([key for key in extended if key != "ansible_net_mac_table"],
+                         [key for key in extended if key in ansible_facts])
+
     def test_dellos9_facts_gather_subset_routing(self):
         set_module_args({"gather_subset": "routing"})
         result = self.execute_module()
@@ -169,3 +194,460 @@ class TestDellOS9Facts(TestDellOS9Module):
             self.assertIn(key, ansible_facts["ansible_net_lldp"])
             for subkey, subval in vals.items():
                 self.assertEqual(subval, ansible_facts["ansible_net_lldp"][key][subkey])
+
+    def test_dellos9_facts_gather_fields_light(self):
+        set_module_args({"gather_subset": "default", "gather_fields": ["operstatus", "lineprotocol", "description"]})
+        result = self.execute_module()
+        ansible_facts = result["ansible_facts"]
+
+        commands = self.run_commands.call_args_list[0][0][1]
+        self.assertEqual(["show interfaces description"], commands)
+        self.assertNotIn("ansible_net_config", ansible_facts)
+        test_data = {
+            "Port-channel 104": {
+                "description": "PortChannel to Arista-R02",
+                "lineprotocol": "up",
+                "operstatus": "up",
+            },
+            "hundredGigE 1/8": {"lineprotocol": "down", "operstatus": "up"},
+            "Vlan 1": {"lineprotocol": "down", "operstatus": "down"},
+        }
+        for key, vals in test_data.items():
+            self.assertEqual(vals, ansible_facts["ansible_net_interfaces"][key])
+
+    def test_dellos9_facts_gather_fields_config_only(self):
+        set_module_args({"gather_subset": "default", "gather_fields": ["tagged", "duplex"]})
+        result = self.execute_module()
+        ansible_facts = result["ansible_facts"]
+
+        commands = self.run_commands.call_args_list[0][0][1]
+        self.assertEqual(["show interfaces status", "show running-config"], commands)
+        interfaces = ansible_facts["ansible_net_interfaces"]
+        self.assertEqual({"duplex": "full"}, interfaces["hundredGigE 1/1"])
+        self.assertIn("hundredGigE 1/10", interfaces["Vlan 101"]["tagged"])
+        self.assertNotIn("mtu", interfaces["Vlan 101"])
+
+    def test_dellos9_facts_gather_fields_bad(self):
+        set_module_args({"gather_fields": ["nosuchfield"]})
+        result = self.execute_module(failed=True)
+        self.assertIn("Bad field", result["msg"])
+
+    def test_dellos9_facts_interfaces_filter(self):
+        set_module_args({"gather_subset": "lldp", "interfaces": ["hundredGigE 1/1", "Vlan 101"]})
+        result = self.execute_module()
+        ansible_facts = result["ansible_facts"]
+
+        commands = [cmd for call in self.run_commands.call_args_list for cmd in call[0][1]]
+        self.assertIn("show interfaces hundredGigE 1/1", commands)
+        self.assertIn("show running-config interface Vlan 101", commands)
+        self.assertIn("show lldp neighbors interface hundredGigE 1/1 detail", commands)
+        self.assertNotIn("show interfaces", commands)
+        interfaces = ansible_facts["ansible_net_interfaces"]
+        self.assertEqual(["Vlan 101", "hundredGigE 1/1"], sorted(interfaces))
+        self.assertEqual("Port-channel 102", interfaces["Vlan 101"]["tagged"][-1])
+        self.assertEqual(["hundredGigE 1/1"], list(ansible_facts["ansible_net_lldp"]))
+        self.assertEqual("hundredGigE 1/32", ansible_facts["ansible_net_lldp"]["hundredGigE 1/1"]["remote_port_id"])
+        self.assertNotIn("ansible_net_config", ansible_facts)
+
+    def test_dellos9_facts_interfaces_filter_bulk(self):
+        filtered = [f"hundredGigE 1/{idx}" for idx in range(1, 11)]
+        set_module_args({"gather_subset": "lldp", "interfaces": filtered})
+        result = self.execute_module()
+        ansible_facts = result["ansible_facts"]
+
+        commands = [cmd for call in self.run_commands.call_args_list for cmd in call[0][1]]
+        self.assertIn("show interfaces", commands)
+        self.assertIn("show lldp neighbors detail", commands)
+        self.assertEqual(sorted(filtered), sorted(ansible_facts["ansible_net_interfaces"]))
+        self.assertEqual(load_fixture("show_running-config"), ansible_facts["ansible_net_config"])
+        for intf in ansible_facts["ansible_net_lldp"]:
+            self.assertIn(intf, filtered)
+
+    def test_dellos9_facts_output_format_xml(self):
+        set_module_args({"gather_subset": "lldp"})
+        text_facts = self.execute_module()["ansible_facts"]
+        set_module_args({"gather_subset": "lldp", "output_format": "xml"})
+        xml_facts = self.execute_module()["ansible_facts"]
+
+        commands = [cmd for call in self.run_commands.call_args_list for cmd in call[0][1]]
+        self.assertIn("show interfaces | display-xml", commands)
+        self.assertIn("show lldp neighbors detail | display-xml", commands)
+        self.assertEqual(text_facts["ansible_net_interfaces"], xml_facts["ansible_net_interfaces"])
+        self.assertEqual(text_facts["ansible_net_lldp"], xml_facts["ansible_net_lldp"])
+        self.assertEqual(text_facts["ansible_net_info"], xml_facts["ansible_net_info"])
+        # Slices cut tags and texts, records stay the same
+        with patch.object(dellos9_facts, "XML_CHUNK", 7):
+            sliced = self.execute_module()["ansible_facts"]
+        for key in ("ansible_net_interfaces", "ansible_net_lldp", "ansible_net_info"):
+            self.assertEqual(xml_facts[key], sliced[key])
+
+    def test_dellos9_facts_lldp_extra_tlvs(self):
+        set_module_args({"gather_subset": "lldp"})
+        result = self.execute_module()
+        lldp = result["ansible_facts"]["ansible_net_lldp"]
+
+        self.assertEqual("Repeater Bridge Router", lldp["hundredGigE 1/1"]["remote_system_capabilities"])
+        self.assertEqual("Bridge Router", lldp["hundredGigE 1/4"]["remote_enabled_capabilities"])
+        self.assertEqual(["172.16.0.234"], lldp["hundredGigE 1/4"]["remote_management_address"])
+        self.assertNotIn("remote_management_address", lldp["hundredGigE 1/1"])
+
+    def test_dellos9_facts_lldp_cache(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = os.path.join(tmpdir, "lldp.json")
+            set_module_args({"gather_subset": "lldp", "lldp_cache": cache})
+            first = self.execute_module()["ansible_facts"]["ansible_net_lldp"]
+            commands = [cmd for call in self.run_commands.call_args_list for cmd in call[0][1]]
+            self.assertIn("show lldp neighbors", commands)
+            self.assertIn("show lldp neighbors detail", commands)
+
+            # Nothing changed, only summary is fetched
+            self.run_commands.reset_mock()
+            set_module_args({"gather_subset": "lldp", "lldp_cache": cache})
+            second = self.execute_module()["ansible_facts"]["ansible_net_lldp"]
+            commands = [cmd for call in self.run_commands.call_args_list for cmd in call[0][1]]
+            self.assertEqual([], [cmd for cmd in commands if cmd.startswith("show lldp neighbors ")])
+            self.assertEqual(first, second)
+
+            # Neighbor of one port changed, only its detail is fetched
+            with open(cache, encoding="utf-8") as fd:
+                cached = json.load(fd)
+            cached["summary"]["hundredGigE 1/1"] = "changed"
+            with open(cache, "w", encoding="utf-8") as fd:
+                json.dump(cached, fd)
+            self.run_commands.reset_mock()
+            set_module_args({"gather_subset": "lldp", "lldp_cache": cache})
+            third = self.execute_module()["ansible_facts"]["ansible_net_lldp"]
+            commands = [cmd for call in self.run_commands.call_args_list for cmd in call[0][1]]
+            self.assertEqual(
+                ["show lldp neighbors interface hundredGigE 1/1 detail"],
+                [cmd for cmd in commands if cmd.startswith("show lldp neighbors ")],
+            )
+            self.assertEqual(first, third)
+
+    def test_dellos9_facts_gather_subset_fib(self):
+        set_module_args({"gather_subset": "fib"})
+        result = self.execute_module()
+        fib = result["ansible_facts"]["ansible_net_fib"]
+
+        self.assertEqual(["default", "lhcone"], sorted(fib))
+        self.assertEqual(6, fib["default"]["ipv4"]["count"])
+        self.assertEqual(4, fib["lhcone"]["ipv6"]["count"])
+        route = fib_lookup(fib, "172.20.8.200")
+        self.assertEqual(
+            {"prefix": "172.20.8.128/25", "code": "S", "gateway": "172.20.1.3", "interface": "Vlan 16"}, route
+        )
+        self.assertEqual("B EX", fib_lookup(fib, "131.225.10.1", "lhcone")["code"])
+        self.assertEqual("Vlan 101", fib_lookup(fib, "2605:d9c0:2:fff1::5", "lhcone")["interface"])
+
+    def test_dellos9_facts_gather_subset_mac(self):
+        set_module_args({"gather_subset": "mac"})
+        result = self.execute_module()
+        macs = result["ansible_facts"]["ansible_net_mac_table"]
+
+        self.assertEqual(12, macs["count"])
+        self.assertEqual(["Active", "Inactive"], sorted({flag[1] for flag in macs["flag_table"]}))
+        self.assertEqual(
+            [
+                {"mac": "34:17:eb:4c:1e:80", "vlan": 43, "interface": "Port-channel 102", "type": "Dynamic", "state": "Active"},
+                {"mac": "34:17:eb:4c:1e:80", "vlan": 3873, "interface": "Port-channel 102", "type": "Dynamic", "state": "Active"},
+            ],
+            mac_lookup(macs, "3417.eb4c.1e80"),
+        )
+        self.assertEqual([], mac_lookup(macs, "00:00:00:00:00:01"))
+        self.assertEqual(
+            [16, 43], sorted(entry["vlan"] for entry in mac_port(macs, "TenGigabitEthernet 1/33"))
+        )
+        self.assertEqual("fortyGigE 1/26/1", mac_lookup(macs, "00:01:e8:d7:72:f9")[0]["interface"])
+        # Any spelling of port name
+        self.assertEqual(mac_port(macs, "TenGigabitEthernet 1/33"), mac_port(macs, "Te 1/33"))
+        self.assertEqual(mac_port(macs, "TenGigabitEthernet 1/33"), mac_port(macs, "te1/33"))
+        # Same mac learned on two switches (other port and vlan) does not share cached table
+        switches = []
+        for vlan, port in ((16, "Port-channel 1"), (43, "TenGigabitEthernet 1/1")):
+            table = MacTable()
+            table.add(vlan, "3417.eb4c.1e80", port, "Dynamic", "Active")
+            table.finalize()
+            switches.append(table.serialize())
+        self.assertEqual(
+            [[(16, "Port-channel 1")], [(43, "TenGigabitEthernet 1/1")]],
+            [
+                [(entry["vlan"], entry["interface"]) for entry in mac_lookup(table, "3417.eb4c.1e80")]
+                for table in switches
+            ],
+        )
+        # Decoded tables of other hosts are evicted, cache stays bounded
+        for idx in range(mactable._CACHE_SIZE * 2):
+            mac_lookup(dict(macs, macs=macs["macs"] + "=" * idx), "00:00:00:00:00:01")
+        self.assertEqual(mactable._CACHE_SIZE, len(mactable._TABLES))
+
+    def test_dellos9_facts_spool_threshold(self):
+        set_module_args({"gather_subset": "mac"})
+        inMemory = self.execute_module()["ansible_facts"]["ansible_net_mac_table"]
+        set_module_args({"gather_subset": "mac", "spool_threshold": 0})
+        with patch.object(dellos9_facts.MacAddressTable, "parseMacTable") as parser:
+            spooled = self.execute_module()["ansible_facts"]["ansible_net_mac_table"]
+        parser.assert_not_called()
+        self.assertEqual(inMemory, spooled)
+
+    def test_dellos9_facts_interfaces_spans(self):
+        outputs = [load_fixture("show_interfaces"), Os9Generator(ports=64, vlans=40, routes=10).showInterfaces()]
+        for data in outputs:
+            facts = []
+            # Span parser must give same facts as per block parse_* methods (process pool path)
+            for parse in ("parseInterfacesSpans", "parseInterfacesOutput"):
+                parser = dellos9_facts.Default(ParamsModule())
+                parser.facts.update({"interfaces": {}, "info": {"macs": []}})
+                getattr(parser, parse)(data)
+                facts.append(json.dumps(parser.facts))
+            self.assertEqual(facts[0], facts[1])
+            self.assertIn("hundredGigE 1/1", json.loads(facts[0])["interfaces"])
+
+    def test_dellos9_facts_parse_workers(self):
+        set_module_args({"gather_subset": "default"})
+        serial = self.execute_module()["ansible_facts"]["ansible_net_interfaces"]
+        set_module_args({"gather_subset": "default", "parse_workers": 2})
+        startPool = dellos9_facts.startParsePool
+        threads = []
+
+        def startParsePool(workers):
+            # Workers are forked before fetch and parse threads start
+            threads.append(set(threading.enumerate()))
+            return startPool(workers)
+
+        with patch.object(dellos9_facts.Default, "PARALLEL_THRESHOLD", 1), \
+                patch.object(dellos9_facts, "startParsePool", startParsePool), \
+                patch.object(dellos9_facts.display, "warning") as warning, \
+                patch.object(dellos9_facts.Default, "parseInterfacesParallel",
+                             autospec=True, side_effect=dellos9_facts.Default.parseInterfacesParallel) as parallel:
+            before = set(threading.enumerate())
+            sharded = self.execute_module()["ansible_facts"]["ansible_net_interfaces"]
+        parallel.assert_called_once()
+        warning.assert_not_called()
+        self.assertEqual(1, len(threads))
+        self.assertLessEqual(threads[0], before)
+        self.assertEqual(json.dumps(serial), json.dumps(sharded))
+
+    def test_dellos9_facts_fetch_parse_overlap(self):
+        # Parse of each subset waits for fetch of the other one, which only
+        # completes if next fetch runs while previous output is parsed
+        fetched = {"mac": threading.Event(), "arp": threading.Event()}
+        other = {"mac": "arp", "arp": "mac"}
+        classes = {"mac": dellos9_facts.MacAddressTable, "arp": dellos9_facts.ArpInfo}
+        patches = []
+        for name, cls in classes.items():
+            def fetch(inst, name=name):
+                dellos9_facts.FactsBase.fetch(inst)
+                fetched[name].set()
+
+            def parse(inst, name=name, orig=cls.parse):
+                self.assertTrue(fetched[other[name]].wait(5))
+                orig(inst)
+
+            patches += [patch.object(cls, "fetch", fetch), patch.object(cls, "parse", parse)]
+        for patcher in patches:
+            patcher.start()
+        try:
+            set_module_args({"gather_subset": ["mac", "arp"]})
+            result = self.execute_module()
+        finally:
+            for patcher in patches:
+                patcher.stop()
+        self.assertIn("ansible_net_mac_table", result["ansible_facts"])
+        self.assertIn("ansible_net_arp", result["ansible_facts"])
+
+    def test_dellos9_facts_command_timeout(self):
+        set_module_args({"gather_subset": ["mac", "arp"], "command_timeout": 0.5})
+        loader = None
+
+        def load_slow(*args, **kwargs):
+            if args[1] == ["show ipv6 neighbors"]:
+                threading.Event().wait(2)
+            return loader(*args, **kwargs)
+
+        def load_fixtures(commands=None):
+            nonlocal loader
+            TestDellOS9Facts.load_fixtures(self, commands)
+            loader = self.run_commands.side_effect
+            self.run_commands.side_effect = load_slow
+
+        with patch.object(self, "load_fixtures", load_fixtures):
+            result = self.execute_module()
+        ansible_facts = result["ansible_facts"]
+        self.assertEqual(["arp"], ansible_facts["ansible_net_timed_out"])
+        self.assertIn("show ipv6 neighbors", ansible_facts["ansible_net_failed_subsets"]["arp"])
+        self.assertNotIn("ansible_net_arp", ansible_facts)
+        self.assertEqual(12, ansible_facts["ansible_net_mac_table"]["count"])
+        self.assertIn("ansible_net_interfaces", ansible_facts)
+        self.assertEqual({"fetch", "parse"}, set(ansible_facts["ansible_net_timings"]["mac"]))
+
+    def test_dellos9_facts_hung_parse(self):
+        set_module_args({"gather_subset": ["mac", "arp"], "subset_timeout": 0.5})
+        release = threading.Event()
+        self.addCleanup(release.set)
+        hung = []
+        parsers = {cls: cls.parse for cls in (dellos9_facts.MacAddressTable, dellos9_facts.ArpInfo)}
+
+        def parse(inst):
+            # First parsed subset hangs, next one must still finish within its own budget
+            if not hung:
+                hung.append(inst)
+                release.wait(5)
+            return parsers[type(inst)](inst)
+
+        with patch.object(dellos9_facts.MacAddressTable, "parse", parse), \
+                patch.object(dellos9_facts.ArpInfo, "parse", parse):
+            ansible_facts = self.execute_module()["ansible_facts"]
+        hungKey = "mac" if isinstance(hung[0], dellos9_facts.MacAddressTable) else "arp"
+        self.assertEqual([hungKey], ansible_facts["ansible_net_timed_out"])
+        self.assertIn("ansible_net_arp" if hungKey == "mac" else "ansible_net_mac_table", ansible_facts)
+
+    def test_dellos9_facts_failed_subset(self):
+        set_module_args({"gather_subset": ["mac", "arp"], "subset_timeout": 30})
+        with patch.object(dellos9_facts.MacAddressTable, "parse", side_effect=ValueError("broken table")):
+            result = self.execute_module()
+        ansible_facts = result["ansible_facts"]
+        self.assertEqual([], ansible_facts["ansible_net_timed_out"])
+        self.assertEqual({"mac": "broken table"}, ansible_facts["ansible_net_failed_subsets"])
+        self.assertIn("ansible_net_arp", ansible_facts)
+        self.assertNotIn("ansible_net_mac_table", ansible_facts)
+
+    def test_dellos9_facts_collect_metrics(self):
+        set_module_args({"gather_subset": "default"})
+        self.assertNotIn("metrics", self.execute_module())
+
+        set_module_args({"gather_subset": "mac", "collect_metrics": True})
+        metrics = self.execute_module()["metrics"]
+        self.assertEqual({"fetch", "parse", "join", "serialize"}, set(metrics["phases"]))
+        self.assertEqual(1, metrics["functions"]["MacAddressTable.parse"]["calls"])
+        self.assertIn("Default.parseInterfacesText", metrics["functions"])
+        self.assertIn("exec_command", metrics)
+        self.assertIn("bytes_received", metrics)
+
+    def test_dellos9_facts_profile(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            set_module_args(
+                {"gather_subset": "mac", "profile": ["cpu"], "profile_dir": tmpdir, "profile_name": "switch1_facts"}
+            )
+            files = self.execute_module()["profile_files"]
+            self.assertEqual(1, len(files))
+            self.assertTrue(os.path.basename(files[0]).startswith("switch1_facts_"))
+            self.assertTrue(os.path.exists(files[0]))
+
+    def test_dellos9_facts_gather_subset_arp(self):
+        set_module_args({"gather_subset": "arp"})
+        result = self.execute_module()
+        ansible_facts = result["ansible_facts"]
+        arp = ansible_facts["ansible_net_arp"]
+
+        self.assertEqual(
+            {
+                "ip": "172.20.1.2",
+                "mac": "00:01:e8:96:1c:19",
+                "port": "TenGigabitEthernet 1/33",
+                "interface": "Vlan 16",
+                "vlan": 16,
+            },
+            arp["by_ip"]["172.20.1.2"],
+        )
+        self.assertEqual("REACH", arp["by_ip"]["2605:d9c0:2:fff1::10"]["state"])
+        self.assertEqual(["192.168.255.254", "192.168.255.10"], arp["by_mac"]["34:17:eb:4c:1e:80"])
+        self.assertEqual(
+            ["172.20.1.2", "172.20.1.3", "fe80::ec4:7aff:fed9:b48d%Vlan 16", "fe80::2204:fff:fe4a:4fc4%Vlan 16"],
+            arp["by_interface"]["Vlan 16"],
+        )
+        # Same link-local address on two vlans, both entries are kept
+        self.assertEqual(
+            ["172.20.1.2", "fe80::2204:fff:fe4a:4fc4%Vlan 16", "fe80::2204:fff:fe4a:4fc4%Vlan 43"],
+            arp["by_interface"]["TenGigabitEthernet 1/33"],
+        )
+        self.assertEqual("fe80::2204:fff:fe4a:4fc4%Vlan 43", arp["by_interface"]["Vlan 43"][-1])
+        for key in arp["by_interface"]["TenGigabitEthernet 1/33"]:
+            self.assertEqual("TenGigabitEthernet 1/33", arp["by_ip"][key]["port"])
+        self.assertEqual([16, 43], [arp["by_ip"][f"fe80::2204:fff:fe4a:4fc4%Vlan {vlan}"]["vlan"] for vlan in (16, 43)])
+        self.assertNotIn("fe80::2204:fff:fe4a:4fc4", arp["by_ip"])
+        self.assertEqual({"port": "hundredGigE 1/4", "interface": "hundredGigE 1/4", "vlan": None},
+                         {key: arp["by_ip"]["172.16.0.234"][key] for key in ("port", "interface", "vlan")})
+        # Joined names are same as interface facts keys
+        for intf in arp["by_interface"]:
+            self.assertIn(intf, ansible_facts["ansible_net_interfaces"])
+
+    def test_dellos9_facts_gather_subset_counters(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = os.path.join(tmpdir, "counters.json")
+            set_module_args({"gather_subset": "counters", "counters_cache": cache})
+            first = self.execute_module()["ansible_facts"]["ansible_net_counters"]
+            # show interfaces response of default subset is reused
+            commands = [cmd for call in self.run_commands.call_args_list for cmd in call[0][1]]
+            self.assertEqual(1, commands.count("show interfaces"))
+            row = first["names"].index("hundredGigE 1/1")
+            self.assertEqual(773350033, first["columns"]["in_packets"][row])
+            self.assertEqual(1714550024524, first["columns"]["in_bytes"][row])
+            self.assertEqual(1318762724029, first["columns"]["out_bytes"][row])
+            self.assertEqual(4995066, first["columns"]["out_broadcasts"][row])
+            self.assertNotIn("rates", first)
+
+            # Previous sample 10 seconds ago: one counter wrapped, one was cleared
+            with open(cache, encoding="utf-8") as fd:
+                cached = json.load(fd)
+            cached["timestamp"] -= 10
+            cached["columns"]["in_bytes"][row] -= 1000
+            cached["columns"]["out_bytes"][row] = (1 << 64) - 500
+            cached["columns"]["in_packets"][row] += 1
+            cached["names"][-1] = "removed 1/1"
+            with open(cache, "w", encoding="utf-8") as fd:
+                json.dump(cached, fd)
+            set_module_args({"gather_subset": "counters", "counters_cache": cache})
+            second = self.execute_module()["ansible_facts"]["ansible_net_counters"]
+            self.assertAlmostEqual(10, second["interval"], places=0)
+            self.assertEqual(1000, second["deltas"]["in_bytes"][row])
+            self.assertEqual(1318762724029 + 500, second["deltas"]["out_bytes"][row])
+            self.assertEqual(773350033, second["deltas"]["in_packets"][row])
+            self.assertEqual(0, second["deltas"]["out_packets"][row])
+            self.assertAlmostEqual(100, second["rates"]["in_bytes"][row], places=0)
+            self.assertIsNone(second["deltas"]["in_bytes"][-1])
+
+    def test_dellos9_facts_counters_without_default_interfaces(self):
+        set_module_args({"gather_subset": "counters", "gather_fields": ["description"]})
+        counters = self.execute_module()["ansible_facts"]["ansible_net_counters"]
+        commands = [cmd for call in self.run_commands.call_args_list for cmd in call[0][1]]
+        self.assertEqual(["show interfaces description", "show interfaces"], commands)
+        self.assertIn("hundredGigE 1/1", counters["names"])
+
+    def test_dellos9_facts_joined_interfaces(self):
+        set_module_args({"gather_subset": "lldp"})
+        result = self.execute_module()
+        ansible_facts = result["ansible_facts"]
+        interfaces = ansible_facts["ansible_net_interfaces"]
+        lldp = ansible_facts["ansible_net_lldp"]
+
+        self.assertEqual(lldp["hundredGigE 1/1"], interfaces["hundredGigE 1/1"]["lldp"])
+        for member in interfaces["Port-channel 102"]["channel-member"]:
+            self.assertEqual("Port-channel 102", interfaces[member]["channel"])
+        self.assertNotIn("channel", interfaces["Vlan 101"])
+
+    def test_dellos9_facts_synthetic_outputs(self):
+        generator = Os9Generator(ports=80, vlans=300, routes=20, seed=7)
+        self.assertEqual(generator.outputs(), Os9Generator(ports=80, vlans=300, routes=20, seed=7).outputs())
+        with tempfile.TemporaryDirectory() as tmpdir:
+            generator.write(tmpdir)
+            set_module_args({"gather_subset": ["default", "routing", "lldp"]})
+            with patch.object(dellos9_module, "fixture_path", tmpdir):
+                result = self.execute_module()
+        # Facts of this size are passed in temp file
+        factsFile = result["ansible_facts_file"]["file"]
+        with open(factsFile, encoding="utf-8") as fd:
+            ansible_facts = json.load(fd)
+        os.unlink(factsFile)
+        interfaces = ansible_facts["ansible_net_interfaces"]
+
+        # 80 ports, management, 5 port-channels and 300 VLANs
+        self.assertEqual(80 + 1 + 5 + 300, len(interfaces))
+        self.assertEqual(["hundredGigE 1/1", "hundredGigE 1/2"], interfaces["Port-channel 100"]["channel-member"])
+        for vlan in generator.vlans:
+            ports, channels = generator.tagged[vlan]
+            expected = [generator.portName(port) for port in ports] + [f"Port-channel {ch}" for ch in sorted(channels)]
+            self.assertEqual(expected, interfaces[f"Vlan {vlan}"].get("tagged", []))
+        self.assertEqual(10, len(ansible_facts["ansible_net_ipv4"]))
+        self.assertEqual(10, len(ansible_facts["ansible_net_ipv6"]))
+        self.assertEqual(40, len(ansible_facts["ansible_net_lldp"]))
+        self.assertEqual([generator.mac(2), generator.mac()], ansible_facts["ansible_net_info"]["macs"])
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Dell OS 9 performance regression gates
+Copyright: Contributors to the SENSE Project
+GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+Title                   : sdn-sense/dellos9
+Author                  : Justas Balcas
+Email                   : juztas (at) gmail.com
+@Copyright              : General Public License v3.0+
+Date                    : 2026/10/19
+"""
+__metaclass__ = type
+
+import os
+import unittest
+
+from ansible_collections.sense.dellos9.tests.benchmark import perf_gate
+
+
+class TestDellOS9Perf(unittest.TestCase):
+
+    def test_exec_command_counts(self):
+        # Round trips are deterministic, so they are gated in every run
+        baseline = perf_gate.loadBaseline()
+        current = perf_gate.collect(timing=False)
+        self.assertEqual(set(baseline["modules"]), set(current["modules"]))
+        self.assertEqual([], perf_gate.compare(baseline, current))
+
+    def test_compare(self):
+        baseline = {
+            "python": "3.11",
+            "calibration": 0.1,
+            "modules": {"facts:default": {"exec_command": 3, "seconds": 0.02, "peak_kib": 300.0}},
+            "parsers": {
+                "a": {"seconds": 0.01, "peak_kib": 100.0, "scaling": 1.0},
+                "b": {"seconds": 0.01, "peak_kib": 100.0, "scaling": 1.0},
+                "c": {"seconds": 0.01, "peak_kib": 100.0, "scaling": 1.0},
+            },
+        }
+        # Twice slower host: all times double, calibration too
+        current = {
+            "python": "3.11",
+            "calibration": 0.2,
+            "modules": {"facts:default": {"exec_command": 3, "seconds": 0.04, "peak_kib": 300.0}},
+            "parsers": {
+                "a": {"seconds": 0.02, "peak_kib": 100.0, "scaling": 1.0},
+                "b": {"seconds": 0.02, "peak_kib": 100.0, "scaling": 1.0},
+                "c": {"seconds": 0.02, "peak_kib": 100.0, "scaling": 1.0},
+            },
+        }
+        self.assertEqual([], perf_gate.compare(baseline, current))
+
+        current["modules"]["facts:default"]["exec_command"] = 4
+        current["parsers"]["a"]["seconds"] = 0.07
+        current["parsers"]["b"]["peak_kib"] = 200.0
+        current["parsers"]["c"]["scaling"] = 2.0
+        regressions = perf_gate.compare(baseline, current)
+        self.assertEqual(4, len(regressions), regressions)
+        for expected in ["exec_command 3 -> 4", "parsers a: time", "parsers b: peak memory", "parsers c: scaling"]:
+            self.assertTrue(any(expected in regression for regression in regressions), expected)
+        # Memory of other Python version is not compared
+        current["python"] = "3.12"
+        regressions = perf_gate.compare(baseline, current)
+        self.assertEqual(3, len(regressions), regressions)
+        self.assertFalse(any("peak memory" in regression for regression in regressions))
+
+    @unittest.skipUnless(os.environ.get(perf_gate.GATE_ENV), f"{perf_gate.GATE_ENV} is not set")
+    def test_perf_gate(self):
+        regressions = perf_gate.compare(perf_gate.loadBaseline(), perf_gate.collect())
+        self.assertEqual([], regressions, "\n".join(regressions))
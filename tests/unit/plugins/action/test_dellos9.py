@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Dell OS 9 action plugin session reuse and config mode unittest
+Copyright: Contributors to the SENSE Project
+GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+Title                   : sdn-sense/dellos9
+Author                  : Justas Balcas
+Email                   : juztas (at) gmail.com
+@Copyright              : General Public License v3.0+
+Date                    : 2026/10/19
+"""
+__metaclass__ = type
+
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from ansible.module_utils._text import to_bytes
+from ansible.playbook.play_context import PlayContext
+from ansible.plugins.loader import connection_loader
+from ansible_collections.ansible.netcommon.plugins.action.network import \
+    ActionModule as ActionNetworkModule
+from ansible_collections.sense.dellos9.plugins.action import dellos9
+
+
+class FakeConnection:
+    """Persistent connection socket replacement, which records sent commands"""
+
+    prompt = b"FAKE-Z9100#"
+    calls = []
+    # Arguments of last call of every other method: {name: (args, kwargs)}
+    payloads = {}
+
+    def __init__(self, sockPath):
+        self.sockPath = sockPath
+
+    def get_prompt(self):
+        self.calls.append("get_prompt")
+        return self.prompt
+
+    def send_command(self, command):
+        self.calls.append(command)
+        FakeConnection.prompt = b"FAKE-Z9100#"
+
+    def __getattr__(self, name):
+        def call(*args, **kwargs):
+            self.calls.append(name)
+            self.payloads[name] = (args, kwargs)
+        return call
+
+
+class TestDellOS9Action(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmpdir)
+        self.sockPath = os.path.join(self.tmpdir, "socket")
+        FakeConnection.calls = []
+        FakeConnection.payloads = {}
+        FakeConnection.prompt = b"FAKE-Z9100#"
+        for patcher in [
+            patch.object(dellos9, "Connection", FakeConnection),
+            patch.object(ActionNetworkModule, "run", MagicMock(return_value={"changed": False})),
+        ]:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def action(self, module="sense.dellos9.dellos9_facts", connection="network_cli"):
+        task = MagicMock(action=module, args={})
+        playContext = PlayContext()
+        playContext.connection = connection
+        playContext.remote_addr = "10.0.0.1"
+        sharedLoader = MagicMock(connection_loader=connection_loader)
+        action = dellos9.ActionModule(task, MagicMock(socket_path=self.sockPath), playContext,
+                                      loader=None, templar=None, shared_loader_obj=sharedLoader)
+        return action
+
+    def test_prompt_probe(self):
+        self.action().run(task_vars={})
+        self.action(module="sense.dellos9.dellos9_config").run(task_vars={})
+        # Session in exec mode, only cached prompt is read
+        self.assertEqual(["get_prompt", "get_prompt"], FakeConnection.calls)
+
+    def test_other_task_left_config_mode(self):
+        self.action().run(task_vars={})
+        # e.g. ansible.netcommon.cli_config or failed task on same socket
+        FakeConnection.prompt = b"FAKE-Z9100(conf)#"
+        FakeConnection.calls = []
+        self.action().run(task_vars={})
+        self.assertEqual(["get_prompt", "end"], FakeConnection.calls)
+
+    def test_leave_config_mode(self):
+        FakeConnection.prompt = b"FAKE-Z9100(conf-if-vl-101)#"
+        self.action().run(task_vars={})
+        self.assertEqual(["get_prompt", "end"], FakeConnection.calls)
+
+    def test_reuse_socket(self):
+        action = self.action(connection="local")
+        playContext = action._play_context
+        playContext.connection = "network_cli"
+        playContext.remote_user = "admin"
+        playContext.port = 22
+        with patch.object(dellos9.C, "PERSISTENT_CONTROL_PATH_DIR", self.tmpdir):
+            self.assertIsNone(action.reuseSocket(playContext, 30))
+            ssh = connection_loader.get("ssh", class_only=True)
+            controlPath = ssh._create_control_path("10.0.0.1", 22, "admin", "network_cli", os.getppid())
+            sockPath = controlPath % {"directory": self.tmpdir}
+            with open(sockPath, "w", encoding="utf-8"):
+                pass
+            self.assertEqual(sockPath, action.reuseSocket(playContext, 30))
+        self.assertEqual(["set_options", "update_play_context", "set_check_prompt"], FakeConnection.calls)
+        # Provider timeout is kept, play context and task are passed
+        self.assertEqual(((), {"direct": {"persistent_command_timeout": 30}}), FakeConnection.payloads["set_options"])
+        pcData = pickle.loads(to_bytes(FakeConnection.payloads["update_play_context"][0][0]))
+        self.assertEqual(("10.0.0.1", "admin", 22), (pcData["remote_addr"], pcData["remote_user"], pcData["port"]))
+        self.assertEqual(((action._task._uuid,), {}), FakeConnection.payloads["set_check_prompt"])
+        # Other user gets its own connection
+        playContext.remote_user = "other"
+        with patch.object(dellos9.C, "PERSISTENT_CONTROL_PATH_DIR", self.tmpdir):
+            self.assertIsNone(action.reuseSocket(playContext, 30))
+
+
+if __name__ == "__main__":
+    unittest.main()
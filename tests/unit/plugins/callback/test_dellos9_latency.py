@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Latency callback plugin unittest
+Copyright: Contributors to the SENSE Project
+GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+Title                   : sdn-sense/dellos9
+Author                  : Justas Balcas
+Email                   : juztas (at) gmail.com
+@Copyright              : General Public License v3.0+
+Date                    : 2026/10/19
+"""
+__metaclass__ = type
+
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from ansible_collections.sense.dellos9.plugins.callback import dellos9_latency
+
+
+class TestLatencyCallback(unittest.TestCase):
+
+    def test_percentile(self):
+        values = list(range(1, 101))
+        self.assertEqual(50, dellos9_latency.percentile(values, 50))
+        self.assertEqual(99, dellos9_latency.percentile(values, 99))
+        self.assertEqual(7, dellos9_latency.percentile([7], 95))
+        self.assertIsNone(dellos9_latency.percentile([], 50))
+
+    def test_report(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            outputFile = os.path.join(tmpdir, "latency.json")
+            options = {"output_file": outputFile, "slowest": 2}
+            callback = dellos9_latency.CallbackModule()
+            callback.get_option = options.get
+            callback._display = MagicMock()
+            clock = iter([0.0, 1.0, 0.0, 5.0, 0.0, 2.0, 0.0, 0.5])
+            tasks = [
+                ("switch1", "sense.dellos9.dellos9_facts", {"metrics": {"exec_command": 3, "bytes_received": {"show system": 100}, "phases": {"fetch": 0.4}}}),
+                ("switch2", "sense.dellos9.dellos9_facts", {}),
+                ("switch3", "sense.dellos9.dellos9_config", {}),
+                ("switch1", "sense.dellos9.dellos9_config", {}),
+            ]
+            with patch.object(dellos9_latency.time, "perf_counter", lambda: next(clock)):
+                for idx, (hostName, action, res) in enumerate(tasks):
+                    host = MagicMock()
+                    host.get_name.return_value = hostName
+                    task = MagicMock(_uuid=str(idx), action=action)
+                    callback.v2_runner_on_start(host, task)
+                    callback.v2_runner_on_ok(MagicMock(_host=host, _task=task, _result=res))
+            callback.v2_playbook_on_stats(MagicMock())
+            with open(outputFile, encoding="utf-8") as fd:
+                report = json.load(fd)
+
+        self.assertEqual(2, report["modules"]["dellos9_facts"]["count"])
+        self.assertEqual(5.0, report["modules"]["dellos9_facts"]["max"])
+        self.assertEqual(
+            [{"host": "switch2", "total": 5.0}, {"host": "switch3", "total": 2.0}], report["slowest_devices"]
+        )
+        self.assertEqual(1.5, report["hosts"]["switch1"]["total"])
+        self.assertEqual(
+            {"exec_command": 3, "bytes_received": 100, "phases": {"fetch": 0.4}}, report["hosts"]["switch1"]["metrics"]
+        )
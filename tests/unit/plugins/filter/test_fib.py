@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Packed routing table and fib filters unittest
+Copyright: Contributors to the SENSE Project
+GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+Title                   : sdn-sense/dellos9
+Author                  : Justas Balcas
+Email                   : juztas (at) gmail.com
+@Copyright              : General Public License v3.0+
+Date                    : 2026/10/19
+"""
+__metaclass__ = type
+
+import ipaddress
+import random
+import unittest
+
+from ansible_collections.sense.dellos9.plugins.filter import fib
+from ansible_collections.sense.dellos9.plugins.filter.fib import (fib_count,
+                                                                   fib_lookup)
+from ansible_collections.sense.dellos9.plugins.module_utils.network.fib import \
+    RouteTable
+
+
+class TestRouteTable(unittest.TestCase):
+
+    def test_lookup_matches_linear_scan(self):
+        rand = random.Random(42)
+        table = RouteTable(4)
+        routes = []
+        for idx in range(5000):
+            prefixlen = rand.randint(8, 32)
+            network = ipaddress.ip_network((rand.getrandbits(32), prefixlen), strict=False)
+            routes.append((network, f"10.0.0.{idx % 250}"))
+            table.add(str(network), "S", f"10.0.0.{idx % 250}", "Vlan 16")
+        table.finalize()
+        self.assertEqual(5000, len(table))
+        # Interned nexthops, not one per route
+        self.assertEqual(250, len(table.nexthopTable))
+        table = RouteTable.deserialize(table.serialize())
+        for _ in range(500):
+            addr = ipaddress.ip_address(rand.getrandbits(32))
+            matches = [route for route in routes if addr in route[0]]
+            result = table.lookup(str(addr))
+            if not matches:
+                self.assertIsNone(result)
+                continue
+            best = max(route[0].prefixlen for route in matches)
+            self.assertEqual(best, int(result["prefix"].split("/")[1]))
+            self.assertIn(ipaddress.ip_network(result["prefix"]), [route[0] for route in matches])
+
+    def test_fib_filters(self):
+        table = RouteTable(6)
+        table.add("::/0", "S", "2605:d9c0:0:ff02::", "Vlan 67")
+        table.add("2605:d9c0:2::/48", "S", "", "Nu 0")
+        table.add("2605:d9c0:2:fff1::/64", "C", "", "Vlan 101")
+        table.finalize()
+        fib = {"lhcone": {"ipv6": table.serialize()}}
+        self.assertEqual(3, fib_count(fib, "lhcone", 6))
+        self.assertEqual("Vlan 101", fib_lookup(fib, "2605:d9c0:2:fff1::10", "lhcone")["interface"])
+        self.assertEqual("2605:d9c0:2::/48", fib_lookup(fib, "2605:d9c0:2:1::1", "lhcone")["prefix"])
+        self.assertEqual("::/0", fib_lookup(fib, "2001:db8::1", "lhcone")["prefix"])
+
+    def test_fib_filter_cache_bounded(self):
+        fib._TABLES.clear()
+        for idx in range(fib._CACHE_SIZE * 3):
+            table = RouteTable(4)
+            table.add(f"10.{idx}.0.0/16", "S", "", "Vlan 16")
+            table.finalize()
+            self.assertEqual(f"10.{idx}.0.0/16", fib_lookup({"default": {"ipv4": table.serialize()}}, f"10.{idx}.1.1")["prefix"])
+        self.assertEqual(fib._CACHE_SIZE, len(fib._TABLES))
+
+    def test_fib_filter_cache_per_host(self):
+        """Hosts with same prefixes, but different gateways, do not share cached table"""
+        fibs = {}
+        for host, gateway in (("host1", "192.168.1.1"), ("host2", "192.168.2.1")):
+            table = RouteTable(4)
+            table.add("0.0.0.0/0", "S", gateway, "Vlan 16")
+            table.finalize()
+            fibs[host] = {"default": {"ipv4": table.serialize()}}
+        self.assertEqual("192.168.1.1", fib_lookup(fibs["host1"], "8.8.8.8")["gateway"])
+        self.assertEqual("192.168.2.1", fib_lookup(fibs["host2"], "8.8.8.8")["gateway"])
+        self.assertEqual("192.168.1.1", fib_lookup(fibs["host1"], "8.8.8.8")["gateway"])
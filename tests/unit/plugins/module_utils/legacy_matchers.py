@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Terminal plugin prompt and error regexes before combined matchers
+Copyright: Contributors to the SENSE Project
+GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+Title                   : sdn-sense/dellos9
+Author                  : Justas Balcas
+Email                   : juztas (at) gmail.com
+@Copyright              : General Public License v3.0+
+Date                    : 2026/10/19
+
+Reference for climatch unittest and bench_terminal benchmark
+"""
+__metaclass__ = type
+
+import re
+
+# Prompt and error regexes of terminal plugin before combined matchers
+LEGACY_STDOUT_RE = [
+    re.compile(rb"[\r\n]?[\w+\-\.:\/\[\]]+(?:\([^\)]+\)){,3}(?:>|#) ?$"),
+    re.compile(rb"\[\w+\@[\w\-\.]+(?: [^\]])\] ?[>#\$] ?$"),
+]
+
+LEGACY_STDERR_RE = [
+    re.compile(
+        rb"% ?Error: (?:(?!\bdoes not exist\b)(?!\balready exists\b)(?!\bHost not found\b)(?!\bnot active\b).)*\n"
+    ),
+    re.compile(rb"% ?Bad secret"),
+    re.compile(rb"invalid input", re.I),
+    re.compile(rb"(?:incomplete|ambiguous) command", re.I),
+    re.compile(rb"connection timed out", re.I),
+    re.compile(rb"'[^']' +returned error code: ?\d+"),
+]
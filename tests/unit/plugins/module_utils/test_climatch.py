@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Incremental CLI prompt and error matchers unittest
+Copyright: Contributors to the SENSE Project
+GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+Title                   : sdn-sense/dellos9
+Author                  : Justas Balcas
+Email                   : juztas (at) gmail.com
+@Copyright              : General Public License v3.0+
+Date                    : 2026/10/19
+"""
+__metaclass__ = type
+
+import unittest
+
+from ansible_collections.sense.dellos9.plugins.terminal.dellos9 import \
+    TerminalModule
+from ansible_collections.sense.dellos9.tests.unit.modules.dellos9_module import \
+    load_fixture
+from ansible_collections.sense.dellos9.tests.unit.plugins.module_utils.legacy_matchers import (
+    LEGACY_STDERR_RE, LEGACY_STDOUT_RE)
+
+SAMPLES = [
+    b"show vlan\r\n% Error: Invalid input at \"^\" marker.\r\nFAKE-Z9100#",
+    b"no interface Vlan 300\r\n% Error: Vlan 300 does not exist.\r\nFAKE-Z9100(conf)#",
+    b"interface Vlan 100\r\n% Error: Interface already exists\r\nFAKE-Z9100(conf)#",
+    b"% Error: Port is not active\r\n% Error: Bad port\r\nFAKE-Z9100(conf-if-hu-1/1)#",
+    b"% Error: Port is active",
+    b"%Error: No such file\n[admin@host tmp] $ ",
+    b"enable\r\nPassword:\r\n% Bad secret\r\nFAKE-Z9100>",
+    b"sh\r\n% Ambiguous command: \"sh\"\r\nFAKE-Z9100#",
+    b"show\r\n% Incomplete command.\r\nFAKE-Z9100#",
+    b"ping 10.0.0.1\r\nConnection timed out\r\nFAKE-Z9100#",
+    b"'x' returned error code: 2\r\nFAKE-Z9100#",
+    b"show running-config\r\n! Version 9.14\r\nhostname FAKE-Z9100\r\n",
+    b"FAKE-Z9100(conf-if-vl-101)# ",
+    b"[admin@host tmp] $ ",
+    b"output line one\r\nnot a prompt > here\r\n",
+]
+
+
+def searchAll(regexes, data):
+    """True if any of regexes (compiled regex or matcher) is found in data"""
+    return any(regex.search(data) for regex in regexes)
+
+
+class TestCliMatchers(unittest.TestCase):
+
+    def setUp(self):
+        self.terminal = TerminalModule(None)
+
+    def assertSameAsLegacy(self, data):
+        self.assertEqual(searchAll(LEGACY_STDOUT_RE, data), searchAll(self.terminal.terminal_stdout_re, data), data)
+        self.assertEqual(searchAll(LEGACY_STDERR_RE, data), searchAll(self.terminal.terminal_stderr_re, data), data)
+
+    def test_same_as_legacy(self):
+        for data in SAMPLES + [load_fixture(name).encode() + b"FAKE-Z9100#" for name in ["show_running-config", "show_interfaces"]]:
+            self.assertSameAsLegacy(data)
+
+    def test_guarded_error(self):
+        stderr = self.terminal.terminal_stderr_re
+        self.assertFalse(searchAll(stderr, b"% Error: Vlan 300 does not exist.\r\n"))
+        self.assertTrue(searchAll(stderr, b"% Error: Invalid input\r\n"))
+        self.assertTrue(searchAll(stderr, b"% Error: Port is active\r\n"))
+        # Error line is complete only with newline
+        self.assertFalse(searchAll(stderr, b"% Error: Port is active"))
+
+    def test_growing_response(self):
+        """network_cli passes growing response; result must match legacy after every chunk"""
+        for data in SAMPLES:
+            for chunk in (1, 3, 7, 64):
+                stderr = self.terminal.terminal_stderr_re
+                stdout = self.terminal.terminal_stdout_re
+                for end in range(chunk, len(data) + chunk, chunk):
+                    resp = data[:end]
+                    self.assertEqual(searchAll(LEGACY_STDERR_RE, resp), searchAll(stderr, resp), (resp, chunk))
+                    self.assertEqual(searchAll(LEGACY_STDOUT_RE, resp), searchAll(stdout, resp), (resp, chunk))
+
+    def test_sliding_window(self):
+        """network_cli (paramiko) passes only last bytes of response; matcher starts over"""
+        data = b"line\r\n" * 200 + SAMPLES[0]
+        stderr = self.terminal.terminal_stderr_re
+        for end in range(100, len(data) + 100, 100):
+            window = data[max(0, end - 512):end]
+            self.assertEqual(searchAll(LEGACY_STDERR_RE, window), searchAll(stderr, window), window)
+
+    def test_large_response_prompt(self):
+        data = b"x" * 100000 + b"\r\nFAKE-Z9100#"
+        self.assertTrue(searchAll(self.terminal.terminal_stdout_re, data))
+        self.assertFalse(searchAll(self.terminal.terminal_stdout_re, data + b"\r\nmore output\r\n"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Interface name normalizer and alias index unittest
+Copyright: Contributors to the SENSE Project
+GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+Title                   : sdn-sense/dellos9
+Author                  : Justas Balcas
+Email                   : juztas (at) gmail.com
+@Copyright              : General Public License v3.0+
+Date                    : 2026/10/19
+"""
+__metaclass__ = type
+
+import unittest
+
+from ansible_collections.sense.dellos9.plugins.module_utils.network.ifnames import (
+    ABBREVIATIONS, InterfaceIndex, canonicalName)
+
+
+class TestInterfaceNames(unittest.TestCase):
+
+    def test_canonical_name(self):
+        for name in ["Hu 1/1", "Hu1/1", "hundredgige 1/1", "Hu_1/1(Up)", " hundredGigE 1/1 ", "HundredGigabitEthernet 1/1"]:
+            self.assertEqual("hundredGigE 1/1", canonicalName(name))
+        self.assertEqual("fortyGigE 1/49/1", canonicalName("Fo 1/49/1"))
+        self.assertEqual("twentyFiveGigE 1/2/4", canonicalName("Tf1/2/4"))
+        self.assertEqual("Port-channel 102", canonicalName("po102"))
+        self.assertEqual("Vlan 101", canonicalName("Vl 101"))
+        self.assertEqual("NULL 0", canonicalName("NULL 0"))
+        for abbr, prefix in ABBREVIATIONS.items():
+            self.assertEqual(f"{prefix} 1/2", canonicalName(f"{abbr} 1/2"))
+            self.assertEqual(f"{prefix} 1/2", canonicalName(f"{prefix} 1/2"))
+
+    def test_interface_index(self):
+        index = InterfaceIndex(["hundredGigE 1/1", "fortyGigE 1/49/1", "Port-channel 102", "Vlan 101"])
+        self.assertEqual("hundredGigE 1/1", index.get("Hu 1/1"))
+        self.assertEqual("hundredGigE 1/1", index.get("Hu_1/1"))
+        self.assertEqual("fortyGigE 1/49/1", index.get("Fo1/49/1"))
+        self.assertEqual("Port-channel 102", index.get("Po 102"))
+        self.assertEqual("Vlan 101", index.get("vlan101"))
+        self.assertIn("Hu 1/1(U)", index)
+        self.assertNotIn("Hu 1/2", index)
+        self.assertIsNone(index.get("fortyGigE 1/49"))
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Runtime instrumentation wrappers unittest
+Copyright: Contributors to the SENSE Project
+GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+Title                   : sdn-sense/dellos9
+Author                  : Justas Balcas
+Email                   : juztas (at) gmail.com
+@Copyright              : General Public License v3.0+
+Date                    : 2026/10/19
+"""
+__metaclass__ = type
+
+import os
+import pstats
+import sys
+import tempfile
+import threading
+import types
+import unittest
+from unittest.mock import patch
+
+from ansible_collections.sense.dellos9.plugins.module_utils import runwrapper
+
+MODULE_NAME = "ansible_collections.sense.dellos9.tests.unit.runwrapper_dummy"
+
+
+class TestRunWrapper(unittest.TestCase):
+
+    def setUp(self):
+        patchers = [
+            patch.object(runwrapper, "ENABLED", False),
+            patch.object(runwrapper, "_REGISTRY", []),
+            patch.object(runwrapper, "STATS", {}),
+            patch.object(runwrapper, "IO_STATS", {"exec_command": 0, "bytes_received": {}}),
+            patch.object(runwrapper, "PHASES", {}),
+            patch.dict(sys.modules, {MODULE_NAME: types.ModuleType(MODULE_NAME)}),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.module = sys.modules[MODULE_NAME]
+
+    def test_disabled_leaves_functions_unwrapped(self):
+        def parse(data):
+            return data.upper()
+
+        class Parser:
+            def run(self, data):
+                return data.lower()
+
+            @staticmethod
+            def parse_field(data):
+                return data
+
+        run = Parser.run
+        self.assertIs(parse, runwrapper.functionwrapper(parse))
+        self.assertIs(run, runwrapper.classwrapper(Parser).__dict__["run"])
+        self.assertEqual({}, runwrapper.STATS)
+
+    def test_enable_wraps_registered_functions(self):
+        def parse(data):
+            return data.upper()
+
+        class Parser:
+            def run(self, data):
+                return data.lower()
+
+        self.module.parse = runwrapper.functionwrapper(parse)
+        self.module.alias = self.module.parse
+        runwrapper.classwrapper(Parser)
+        runwrapper.enable()
+
+        self.assertIsNot(parse, self.module.parse)
+        self.assertIs(self.module.parse, self.module.alias)
+        self.assertEqual("ABC", self.module.parse("abc"))
+        self.assertEqual("ABC", self.module.alias("abc"))
+        self.assertEqual("abc", Parser().run("ABC"))
+        self.assertEqual(2, runwrapper.STATS[parse.__qualname__][0])
+        self.assertEqual(1, runwrapper.STATS[Parser.run.__qualname__][0])
+        # Verbosity is checked once, when function is wrapped
+        with patch.object(runwrapper.display, "vvvvvv") as log:
+            self.module.parse("abc")
+        log.assert_not_called()
+        # Arguments are not formatted to log
+        with patch.object(runwrapper.display, "verbosity", 6), patch.object(runwrapper.display, "vvvvvv") as log:
+            verbose = runwrapper._wrap(parse)
+            verbose("x" * 1000)
+        self.assertNotIn("xxx", log.call_args[0][0])
+
+    def test_generators_not_wrapped(self):
+        def lines(data):
+            yield from data.split()
+
+        class Parser:
+            def records(self, data):
+                yield from data.split()
+
+        records = Parser.records
+        with patch.object(runwrapper, "ENABLED", True):
+            self.assertIs(lines, runwrapper.functionwrapper(lines))
+            self.assertIs(records, runwrapper.classwrapper(Parser).__dict__["records"])
+        self.assertEqual([], runwrapper._REGISTRY)
+        self.assertEqual({}, runwrapper.STATS)
+
+    def test_metrics(self):
+        # Nothing is recorded while disabled
+        runwrapper.recordCommand("show system", "x" * 10)
+        self.assertEqual({"exec_command": 0, "bytes_received": {}}, runwrapper.IO_STATS)
+        runwrapper.enable()
+        with runwrapper.phase("fetch"):
+            runwrapper.recordCommand("show system", "x" * 10)
+            runwrapper.recordCommand("show system", "x" * 5)
+            runwrapper.recordCommand("show arp", None)
+            # Bytes, not characters
+            runwrapper.recordCommand("show lldp neighbors", "Łódź")
+        metrics = runwrapper.metrics()
+        self.assertEqual(4, metrics["exec_command"])
+        self.assertEqual({"show system": 15, "show arp": 0, "show lldp neighbors": 7}, metrics["bytes_received"])
+        self.assertEqual(["fetch"], list(metrics["phases"]))
+        self.assertEqual({}, metrics["functions"])
+
+    def test_profiler(self):
+        def threadWork():
+            return sum(range(1000))
+
+        with tempfile.TemporaryDirectory() as tmpdir, patch.dict(os.environ, {runwrapper.PROFILE_ENV: "cpu,memory"}):
+            profiler = runwrapper.startProfiling(directory=tmpdir, name="host1_Gather facts")
+            worker = threading.Thread(target=runwrapper.profiled, args=(threadWork,))
+            worker.start()
+            worker.join()
+            files = profiler.stop()
+            self.assertIsNone(runwrapper.PROFILER)
+            self.assertEqual(
+                [".pstats", ".tracemalloc", ".top.txt"],
+                [name[len(os.path.join(tmpdir, "host1_Gather_facts_")) + 15:] for name in files],
+            )
+            functions = [func[2] for func in pstats.Stats(files[0]).stats]
+            self.assertIn("threadWork", functions)
+            self.assertEqual(files, profiler.stop())
+
+    def test_profiler_not_requested(self):
+        with patch.dict(os.environ, {runwrapper.PROFILE_ENV: ""}):
+            self.assertIsNone(runwrapper.startProfiling())
+        self.assertEqual(3, runwrapper.profiled(len, "abc"))
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Spooled command output unittest
+Copyright: Contributors to the SENSE Project
+GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+Title                   : sdn-sense/dellos9
+Author                  : Justas Balcas
+Email                   : juztas (at) gmail.com
+@Copyright              : General Public License v3.0+
+Date                    : 2026/10/19
+"""
+__metaclass__ = type
+
+import re
+import unittest
+
+from ansible_collections.sense.dellos9.plugins.module_utils.network.spool import (
+    SpooledOutput, encodedSize, spool)
+
+
+class TestSpool(unittest.TestCase):
+
+    def test_threshold_in_bytes(self):
+        data = "description Łódź uplink\n" * 4
+        size = len(data.encode("utf-8"))
+        self.assertLess(len(data), size)
+        self.assertEqual(size, encodedSize(data, size))
+        self.assertIs(data, spool(data, None))
+        self.assertIs(data, spool(data, size))
+        # Fewer characters than threshold, but more bytes
+        with spool(data, len(data)) as spooled:
+            self.assertIsInstance(spooled, SpooledOutput)
+            self.assertEqual(size, len(spooled))
+            self.assertEqual(4, len(list(spooled.finditer(re.compile("Łódź".encode("utf-8"))))))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Dell OS 9 terminal plugin unittest against fake CLI
+Copyright: Contributors to the SENSE Project
+GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+Title                   : sdn-sense/dellos9
+Author                  : Justas Balcas
+Email                   : juztas (at) gmail.com
+@Copyright              : General Public License v3.0+
+Date                    : 2026/10/19
+"""
+__metaclass__ = type
+
+import re
+import socket
+import time
+import unittest
+
+from ansible_collections.sense.dellos9.plugins.terminal.dellos9 import \
+    TerminalModule
+from ansible_collections.sense.dellos9.tests.unit.modules.dellos9_module import \
+    load_fixture
+from ansible_collections.sense.dellos9.tests.unit.modules.fake_os9 import (
+    MORE, FakeOs9Server)
+
+CONFIRM_RE = re.compile(rb"\[confirm yes/no\]: ?$")
+
+TERMINAL = TerminalModule(None)
+
+
+class CliClient:
+    """Minimal exec_command loop: send command, read until prompt, check errors"""
+
+    def __init__(self, port):
+        self.sock = socket.create_connection(("127.0.0.1", port), timeout=5)
+        self.read()
+
+    def read(self, prompts=None):
+        """Read until one of prompts matches end of received data"""
+        prompts = prompts or TERMINAL.terminal_stdout_re
+        data = b""
+        while not any(regex.search(data) for regex in prompts):
+            chunk = self.sock.recv(65536)
+            if not chunk:
+                raise EOFError(data)
+            data += chunk
+        return data
+
+    def send(self, command, prompts=None):
+        """Send command, return output without echo and prompt and error match (or None)"""
+        self.sock.sendall(command.encode() + b"\r")
+        data = self.read(prompts)
+        error = next((regex.search(data) for regex in TERMINAL.terminal_stderr_re if regex.search(data)), None)
+        lines = data.split(b"\r\n")
+        return b"\n".join(lines[1:-1]).decode(), lines[-1], error
+
+    def close(self):
+        self.sock.close()
+
+
+class TestDellOS9Terminal(unittest.TestCase):
+
+    def setUp(self):
+        self.server = FakeOs9Server().__enter__()
+        self.addCleanup(self.server.__exit__)
+        self.client = CliClient(self.server.port)
+        self.addCleanup(self.client.close)
+
+    def test_show_command(self):
+        self.client.send("terminal length 0")
+        output, prompt, error = self.client.send("show running-config")
+        self.assertIsNone(error)
+        self.assertEqual(b"FAKE-Z9100#", prompt)
+        self.assertEqual(load_fixture("show_running-config").rstrip("\n"), output)
+
+    def test_paging(self):
+        prompts = TERMINAL.terminal_stdout_re + [re.compile(re.escape(MORE) + b"$")]
+        output, prompt, _ = self.client.send("show system", prompts)
+        self.assertEqual(MORE, prompt)
+        self.assertEqual(24, len(output.split("\n")))
+
+    def test_config_mode_prompts(self):
+        for command, expected in [
+            ("configure terminal", b"FAKE-Z9100(conf)#"),
+            ("interface hundredGigE 1/1", b"FAKE-Z9100(conf-if-hu-1/1)#"),
+            ("interface Vlan 101", b"FAKE-Z9100(conf-if-vl-101)#"),
+            ("exit", b"FAKE-Z9100(conf)#"),
+            ("end", b"FAKE-Z9100#"),
+        ]:
+            _, prompt, error = self.client.send(command)
+            self.assertIsNone(error)
+            self.assertEqual(expected, prompt)
+
+    def test_errors(self):
+        _, prompt, error = self.client.send("show bogus")
+        self.assertIsNotNone(error)
+        self.assertEqual(b"FAKE-Z9100#", prompt)
+        self.client.send("configure")
+        _, _, error = self.client.send("interface bogus 1/1")
+        self.assertIsNotNone(error)
+
+    def test_confirm_prompt(self):
+        _, prompt, _ = self.client.send("copy running-config startup-config", [CONFIRM_RE])
+        self.assertTrue(CONFIRM_RE.search(prompt))
+        output, prompt, error = self.client.send("yes")
+        self.assertIsNone(error)
+        self.assertIn("bytes successfully copied", output)
+        self.assertEqual(b"FAKE-Z9100#", prompt)
+
+    def test_latency_and_round_trips(self):
+        with FakeOs9Server(latency=0.01, latencies={"show ip*": 0.2}) as server:
+            client = CliClient(server.port)
+            self.addCleanup(client.close)
+            start = time.perf_counter()
+            client.send("terminal length 0")
+            client.send("show system")
+            quick = time.perf_counter() - start
+            start = time.perf_counter()
+            client.send("show ip route")
+            slow = time.perf_counter() - start
+        self.assertGreaterEqual(quick, 0.02)
+        self.assertGreaterEqual(slow, 0.2)
+        self.assertEqual(["terminal length 0", "show system", "show ip route"], server.sessions[0].commands)